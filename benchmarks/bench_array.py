@@ -0,0 +1,325 @@
+""" Benchmarks for datastructures.array.Array.
+    Run from the repository root with: python -m benchmarks.bench_array
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable
+
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.memmaparray import MemmapArray
+from datastructures.recordarray import RecordArray
+from datastructures.sortedarray import SortedArray
+from datastructures.tieredarray import TieredArray
+from tests.car import Car, Color, Make, Model
+
+
+N = 1_000_000
+
+
+def timed(label: str, func: Callable[[], object]) -> float:
+    """Run func once and print how long it took."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<45} {elapsed * 1000:>10.2f} ms")
+    return elapsed
+
+
+def buffer_bytes(array: Array) -> int:
+    """Bytes held by the array's live elements, counting boxed Python objects for object storage."""
+    live = array._live()
+    if array.is_native:
+        return live.nbytes
+    return live.nbytes + sum(sys.getsizeof(item) for item in live)
+
+
+def bench_native_vs_object() -> None:
+    """The same operations on int64 storage and on the object-array path, for the same 1M ints."""
+    print("== native dtype vs object dtype ==")
+    values = list(range(N))
+
+    native = Array(values, data_type=int)
+    boxed = Array(values, data_type=object)
+    native_bytes, boxed_bytes = buffer_bytes(native), buffer_bytes(boxed)
+    print(f"{'memory int64':<45} {native_bytes / 2**20:>10.2f} MiB")
+    print(f"{'memory object':<45} {boxed_bytes / 2**20:>10.2f} MiB  ({boxed_bytes / native_bytes:.1f}x)")
+
+    native_load = timed("Array(1M ints, int)", lambda: Array(values, data_type=int))
+    boxed_load = timed("Array(1M ints, object)", lambda: Array(values, data_type=object))
+    print(f"{'object / int64':<45} {boxed_load / native_load:>10.1f}x")
+
+    native_append = timed("append 1M ints one by one (int)", lambda: _append_all(values, int))
+    boxed_append = timed("append 1M ints one by one (object)", lambda: _append_all(values, object))
+    print(f"{'object / int64':<45} {boxed_append / native_append:>10.1f}x")
+
+    native_sum = timed("reduce(np.add) (int)", lambda: native.reduce(np.add))
+    boxed_sum = timed("reduce(np.add) (object)", lambda: boxed.reduce(np.add))
+    print(f"{'object / int64':<45} {boxed_sum / native_sum:>10.1f}x")
+
+
+def _append_all(values: list[int], data_type: type) -> Array:
+    """Build an Array of data_type with one append() per value."""
+    array = Array(data_type=data_type)
+    for value in values:
+        array.append(value)
+    return array
+
+
+def bench_bulk_load() -> None:
+    """extend/from_iterable versus repeated append."""
+    print("== bulk load ==")
+    values = list(range(N))
+    block = np.arange(N, dtype=np.int64)
+
+    def append_loop() -> None:
+        array = Array(data_type=int)
+        for value in values:
+            array.append(value)
+
+    looped = timed("append 1M ints one by one", append_loop)
+    listed = timed("extend from list", lambda: Array(data_type=int).extend(values))
+    blocked = timed("extend from NumPy block", lambda: Array(data_type=int).extend(block))
+    timed("from_iterable(generator, size_hint)", lambda: Array.from_iterable((v for v in values), int, size_hint=N))
+    print(f"{'speedup list / block':<45} {looped / listed:>9.1f}x / {looped / blocked:.1f}x")
+
+
+def bench_front_back() -> None:
+    """1M alternating front and back operations against collections.deque as a reference."""
+    print("== alternating front/back operations ==")
+
+    def array_ops() -> None:
+        array = Array(data_type=int)
+        for i in range(N // 4):
+            array.append_front(i)
+            array.append(i)
+        for _ in range(N // 4):
+            array.pop_front()
+            array.pop()
+
+    def deque_ops() -> None:
+        items: deque[int] = deque()
+        for i in range(N // 4):
+            items.appendleft(i)
+            items.append(i)
+        for _ in range(N // 4):
+            items.popleft()
+            items.pop()
+
+    elapsed = timed("Array 1M front/back ops", array_ops)
+    timed("collections.deque 1M front/back ops (reference)", deque_ops)
+    print(f"{'Array per operation':<45} {elapsed / N * 1e9:>10.0f} ns")
+
+
+def bench_memmap_reopen() -> None:
+    """Reopening a memory-mapped array versus reloading the same items one by one."""
+    print("== memmap reopen ==")
+    values = list(range(N))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.dsmm")
+        MemmapArray(path, values, data_type=int).close()
+
+        def reload() -> None:
+            array = Array(data_type=int)
+            for value in values:
+                array.append(value)
+
+        timed("reload 1M ints element by element", reload)
+        timed("MemmapArray.open 1M ints", lambda: MemmapArray.open(path))
+
+
+def bench_search() -> None:
+    """Membership, index and count on 5M ints versus a Python scan."""
+    print("== search ==")
+    array = Array.from_iterable(range(5 * N), data_type=int)
+    target = 5 * N - 1
+    scan = timed("Python scan for last item", lambda: any(item == target for item in array._live().tolist()))
+    contains = timed("target in array (NumPy comparison)", lambda: target in array)
+    timed("array.index(target)", lambda: array.index(target))
+    timed("array.count(target)", lambda: array.count(target))
+    timed("array.searchsorted(target)", lambda: array.searchsorted(target))
+    print(f"{'speedup contains':<45} {scan / contains:>10.1f}x")
+
+
+def bench_resize_hysteresis() -> None:
+    """Fill/drain cycles with and without reserve(), reporting the resize counters."""
+    print("== resize events over 20 fill/drain cycles of 100K ints ==")
+
+    def cycles(array: Array) -> None:
+        for _ in range(20):
+            for i in range(N // 10):
+                array.append(i)
+            for _ in range(N // 10):
+                array.pop()
+
+    plain = Array(data_type=int)
+    timed("default policy", lambda: cycles(plain))
+    print(f"{'':<45} {plain.resize_counters}")
+
+    reserved = Array(data_type=int)
+    reserved.reserve(N // 10)
+    timed("reserve(100K)", lambda: cycles(reserved))
+    print(f"{'':<45} {reserved.resize_counters}")
+
+
+def bench_batch_delete() -> None:
+    """Removing 20% of 1M items with one compaction versus repeated __delitem__."""
+    print("== batch delete (20% of items) ==")
+    doomed = list(range(0, N, 5))
+
+    small = Array.from_iterable(range(N // 10), data_type=int)
+    looped = timed("del array[i] for 20% of 100K (back to front)", lambda: [small.__delitem__(i) for i in reversed(range(0, N // 10, 5))])
+    array = Array.from_iterable(range(N), data_type=int)
+    batched = timed("delete_many for 20% of 1M", lambda: array.delete_many(doomed))
+    print(f"{'per item removed: loop / batch':<45} {looped / (N // 50) * 1e9:>7.0f} ns / {batched / (N // 5) * 1e9:.0f} ns")
+    array = Array.from_iterable(range(N), data_type=int)
+    timed("delete_where(lambda x: x % 5 == 0) on 1M", lambda: array.delete_where(lambda x: x % 5 == 0, vectorized=True))
+
+
+def bench_map_reduce() -> None:
+    """Feature scaling (x - mean) / std on 1M floats: operators versus a Python loop."""
+    print("== feature scaling on 1M floats ==")
+    array = Array.from_iterable(np.random.default_rng(0).random(N), data_type=float)
+
+    def python_loop() -> Array:
+        items = list(array)
+        mean = sum(items) / len(items)
+        std = (sum((x - mean) ** 2 for x in items) / len(items)) ** 0.5
+        scaled = Array(data_type=float)
+        for x in items:
+            scaled.append((x - mean) / std)
+        return scaled
+
+    def vectorized() -> Array:
+        mean = array.reduce(np.add) / len(array)
+        std = (((array - mean) ** 2).reduce(np.add) / len(array)) ** 0.5
+        return (array - mean) / std
+
+    looped = timed("Python loop", python_loop)
+    fast = timed("Array operators + reduce(np.add)", vectorized)
+    print(f"{'speedup':<45} {looped / fast:>10.1f}x")
+
+
+def bench_sorted_range() -> None:
+    """Range lookups over 10M sorted timestamps: SortedArray.range versus a full NumPy scan."""
+    print("== range query over 10M timestamps ==")
+    timestamps = np.sort(np.random.default_rng(0).integers(0, 10**12, 10 * N))
+    array = Array.from_iterable(timestamps, data_type=int)
+    ordered = SortedArray(data_type=int)
+    ordered.merge_in(timestamps)
+    low, high = int(timestamps[len(timestamps) // 2]), int(timestamps[len(timestamps) // 2 + 1000])
+    scanned = timed("filter(low <= t < high) scan", lambda: array.filter(lambda t: (t >= low) & (t < high), vectorized=True))
+    ranged = timed("SortedArray.range(low, high)", lambda: ordered.range(low, high))
+    print(f"{'speedup':<45} {scanned / ranged:>10.0f}x")
+
+
+def bench_gather() -> None:
+    """Gathering 1K rows by id list from 1M items, 1000 times."""
+    print("== gather 1K ids from 1M, x1000 ==")
+    array = Array.from_iterable(np.random.default_rng(0).random(N), data_type=float)
+    ids = np.random.default_rng(1).integers(0, N, 1000).tolist()
+    looped = timed("[array[i] for i in ids]", lambda: [[array[i] for i in ids] for _ in range(1000)])
+    gathered = timed("array[ids]", lambda: [array[ids] for _ in range(1000)])
+    print(f"{'speedup':<45} {looped / gathered:>10.1f}x")
+
+
+def bench_middle_insert() -> None:
+    """10K inserts and deletes in the middle of a 1M item array: Array versus TieredArray."""
+    print("== 10K middle insert + delete on 1M items ==")
+    values = list(range(N))
+
+    def churn(array: Array | TieredArray) -> None:
+        for i in range(10_000):
+            array.insert(len(array) // 2, i)
+        for _ in range(10_000):
+            del array[len(array) // 3]
+
+    flat = Array.from_iterable(values, data_type=int)
+    tiered = TieredArray(values, data_type=int)
+    shifted = timed("Array (shifts half the buffer per edit)", lambda: churn(flat))
+    blocked = timed("TieredArray (O(sqrt n) per edit)", lambda: churn(tiered))
+    print(f"{'speedup':<45} {shifted / blocked:>10.1f}x")
+
+
+def bench_iteration() -> None:
+    """Iterating 10M floats: NumPy scalar iteration versus chunked tolist() and iter_chunks."""
+    print("== iterate 10M floats ==")
+    array = Array.from_iterable(np.random.default_rng(0).random(10 * N), data_type=float)
+    scalars = timed("for x in ndarray (NumPy scalars)", lambda: sum(x for x in array.to_numpy()))
+    native = timed("for x in array (chunked Python floats)", lambda: sum(x for x in array))
+    timed("for chunk in array.iter_chunks()", lambda: sum(float(chunk.sum()) for chunk in array.iter_chunks()))
+    print(f"{'speedup':<45} {scalars / native:>10.1f}x")
+
+
+def bench_sort() -> None:
+    """Sorting 10M ints and 2M strings: list round trip versus Array.sort, serial and on a process pool."""
+    print(f"== sort 10M ints / 2M strings ({os.cpu_count()} CPUs) ==")
+    rng = np.random.default_rng(0)
+    numbers = rng.integers(0, 10**12, 10 * N)
+    timed("sorted(list(array)) on ints", lambda: Array.from_iterable(sorted(Array.from_iterable(numbers, data_type=int)), data_type=int))
+    timed("Array.sort() on ints (NumPy)", lambda: Array.from_iterable(numbers, data_type=int).sort())
+    words = [str(value) for value in rng.integers(0, 10**12, 2 * N)]
+    serial = timed("Array.sort() on strings", lambda: Array(words, data_type=str).sort())
+    pooled = timed("Array.sort(parallel=True) on strings", lambda: Array(words, data_type=str).sort(parallel=True))
+    print(f"{'speedup':<45} {serial / pooled:>10.1f}x")
+
+
+def bench_snapshot() -> None:
+    """Snapshotting while a writer appends: snapshot() is O(1) at any size, a full copy is O(n)."""
+    print("== 100 snapshots of 1M / 10M ints ==")
+    for size in (N, 10 * N):
+        array = Array.from_iterable(np.arange(size), data_type=int)
+        array.reserve(size + 100)
+
+        def reader_snapshots() -> None:
+            for value in range(100):
+                array.snapshot()
+                array.append(value)
+
+        def reader_copies() -> None:
+            for _ in range(100):
+                array.to_numpy(copy=True)
+
+        copied = timed(f"to_numpy(copy=True) at {size:,}", reader_copies)
+        shared = timed(f"snapshot() + append at {size:,}", reader_snapshots)
+        print(f"{'speedup':<45} {copied / shared:>10.0f}x   (unshares: {array.resize_counters.unshares})")
+
+
+def bench_records() -> None:
+    """1M Car records: Array(data_type=Car) of objects versus a RecordArray of typed columns."""
+    print("== 1M Car records ==")
+    rng = np.random.default_rng(0)
+    colors, makes, models = list(Color), list(Make), list(Model)
+    cars = [Car(f"VIN{index:014d}", colors[c], makes[m], models[d])
+            for index, (c, m, d) in enumerate(zip(rng.integers(0, len(colors), N), rng.integers(0, len(makes), N), rng.integers(0, len(models), N)))]
+    objects = Array(cars, data_type=Car)
+    records = RecordArray.for_class(Car, cars)
+    per_object = (buffer_bytes(objects) + sum(sys.getsizeof(car.__dict__) + sys.getsizeof(car.vin) for car in cars)) / N
+    print(f"{'bytes per row, Array of Car':<45} {per_object:>10.0f}")
+    print(f"{'bytes per row, RecordArray':<45} {records.nbytes / N:>10.0f}")
+    scanned = timed("filter(lambda car: car.color is RED)", lambda: objects.filter(lambda car: car.color is Color.RED))
+    filtered = timed("RecordArray.where(color=RED)", lambda: records.where(color=Color.RED))
+    print(f"{'speedup':<45} {scanned / filtered:>10.0f}x")
+
+
+if __name__ == '__main__':
+    bench_native_vs_object()
+    bench_bulk_load()
+    bench_front_back()
+    bench_memmap_reopen()
+    bench_search()
+    bench_resize_hysteresis()
+    bench_batch_delete()
+    bench_map_reduce()
+    bench_sorted_range()
+    bench_gather()
+    bench_middle_insert()
+    bench_iteration()
+    bench_sort()
+    bench_snapshot()
+    bench_records()
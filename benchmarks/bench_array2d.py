@@ -0,0 +1,140 @@
+""" Benchmarks for datastructures.array2d.Array2D.
+    Run from the repository root with: python -m benchmarks.bench_array2d
+"""
+
+import os
+
+import numpy as np
+
+from benchmarks.bench_array import timed
+from datastructures.array2d import Array2D
+from datastructures.sparsearray2d import SparseArray2D
+
+
+SIDE = 4096
+
+
+def bench_contiguous_grid() -> None:
+    """Fill, scan and transpose a 4K x 4K int grid: a list of row lists versus Array2D's single 2D buffer."""
+    print(f"== fill / scan / transpose {SIDE}x{SIDE} ints ==")
+    rows = [[0] * SIDE for _ in range(SIDE)]
+    grid = Array2D.empty(SIDE, SIDE, data_type=int)
+
+    def fill_lists() -> None:
+        for row in rows:
+            for column in range(SIDE):
+                row[column] = 7
+
+    looped = timed("fill: nested loop over row lists", fill_lists)
+    filled = timed("fill: Array2D.fill(7)", lambda: grid.fill(7))
+    print(f"{'speedup':<45} {looped / filled:>10.0f}x")
+
+    looped = timed("scan: sum(sum(row) for row in rows)", lambda: sum(sum(row) for row in rows))
+    timed("scan: sum over Array2D rows (Python values)", lambda: sum(sum(row) for row in grid))
+    scanned = timed("scan: Array2D.to_numpy().sum()", lambda: int(grid.to_numpy().sum()))
+    print(f"{'speedup':<45} {looped / scanned:>10.0f}x")
+
+    looped = timed("transpose: zip(*rows)", lambda: [list(column) for column in zip(*rows)])
+    moved = timed("transpose: Array2D(grid.to_numpy().T)", lambda: Array2D(grid.to_numpy().T, data_type=int))
+    print(f"{'speedup':<45} {looped / moved:>10.0f}x")
+    timed("transpose: Array2D.transpose() (view)", grid.transpose)
+
+
+def bench_columns() -> None:
+    """Per-column sums of a wide 256 x 8K float table: indexing every Row versus column views and axis=0."""
+    print("== column sums, 256 x 8192 floats ==")
+    table = Array2D(np.random.default_rng(0).random((256, 8 * 1024)), data_type=float)
+    num_rows, num_columns = table.shape
+    rows = timed("row scan: sum(row) for row in table", lambda: [sum(row) for row in table])
+    indexed = timed("column scan: table[r][c] per cell", lambda: [sum(table[r][c] for r in range(num_rows)) for c in range(num_columns)])
+    columns = timed("column scan: sum(col) for col in iter_columns()", lambda: [sum(col) for col in table.iter_columns()])
+    reduced = timed("column scan: table.sum(axis=0)", lambda: table.sum(axis=0))
+    print(f"{'column / row scan, per-cell indexing':<45} {indexed / rows:>10.1f}x")
+    print(f"{'column / row scan, iter_columns()':<45} {columns / rows:>10.1f}x")
+    print(f"{'speedup of sum(axis=0) over indexing':<45} {indexed / reduced:>10.0f}x")
+
+
+def bench_cell_access() -> None:
+    """Counting live neighbours on a 512 x 512 grid: a[r][c] (one Row per access) versus a[r, c] and get_many."""
+    print("== neighbour counts on 512x512 ==")
+    size = 512
+    grid = Array2D(np.random.default_rng(0).integers(0, 2, (size, size)), data_type=int)
+    offsets = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+    def nested() -> int:
+        return sum(grid[r + dr][c + dc] for r in range(1, size - 1) for c in range(1, size - 1) for dr, dc in offsets)
+
+    def tupled() -> int:
+        return sum(grid[r + dr, c + dc] for r in range(1, size - 1) for c in range(1, size - 1) for dr, dc in offsets)
+
+    def gathered() -> int:
+        rows, cols = np.meshgrid(np.arange(1, size - 1), np.arange(1, size - 1), indexing='ij')
+        return sum(grid.get_many((rows + dr).ravel(), (cols + dc).ravel()).reduce(np.add) for dr, dc in offsets)
+
+    row_objects = timed("a[r][c]", nested)
+    direct = timed("a[r, c]", tupled)
+    batched = timed("get_many(rows, cols) per offset", gathered)
+    print(f"{'speedup a[r, c] over a[r][c]':<45} {row_objects / direct:>10.1f}x")
+    print(f"{'speedup get_many over a[r][c]':<45} {row_objects / batched:>10.0f}x")
+
+
+def bench_windows() -> None:
+    """Taking overlapping 64 x 64 windows (stride 16) of a 1080 x 1920 frame: nested-list crops versus views."""
+    print("== 64x64 windows of a 1080x1920 frame, stride 16 ==")
+    frame = Array2D(np.random.default_rng(0).integers(0, 256, (1080, 1920)), data_type=int)
+    rows = frame.to_numpy().tolist()
+    corners = [(r, c) for r in range(0, 1080 - 64 + 1, 16) for c in range(0, 1920 - 64 + 1, 16)]
+    print(f"{'windows per frame':<45} {len(corners):>10}")
+    cropped = timed("nested-list crop per window", lambda: [[row[c:c + 64] for row in rows[r:r + 64]] for r, c in corners])
+    viewed = timed("frame[r:r + 64, c:c + 64] per window", lambda: [frame[r:r + 64, c:c + 64] for r, c in corners])
+    timed("window view + sum()", lambda: [frame[r:r + 64, c:c + 64].sum() for r, c in corners])
+    print(f"{'speedup':<45} {cropped / viewed:>10.0f}x")
+
+
+def bench_stencil() -> None:
+    """8-neighbour counts: game_of_life-style nested loops on 500 x 500 versus Array2D.stencil up to 10K x 10K."""
+    print("== 8-neighbour counts ==")
+    kernel = [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+    small = Array2D(np.random.default_rng(0).integers(0, 2, (500, 500)), data_type=int)
+    size = small.shape[0]
+    offsets = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+    def nested() -> list[list[int]]:
+        return [[sum(small[r + dr, c + dc] for dr, dc in offsets if 0 <= r + dr < size and 0 <= c + dc < size)
+                 for c in range(size)] for r in range(size)]
+
+    looped = timed("nested loops, 500x500", nested)
+    stenciled = timed("stencil(kernel), 500x500", lambda: small.stencil(kernel))
+    print(f"{'speedup':<45} {looped / stenciled:>10.0f}x")
+    large = Array2D(np.random.default_rng(0).integers(0, 2, (10_000, 10_000)), data_type=int)
+    for boundary in ('zero', 'wrap', 'reflect'):
+        timed(f"stencil(kernel, {boundary!r}), 10Kx10K", lambda: large.stencil(kernel, boundary))
+    timed(f"stencil(parallel=True), 10Kx10K, {os.cpu_count()} CPUs", lambda: large.stencil(kernel, parallel=True))
+
+
+def bench_sparse() -> None:
+    """Set, read and walk 100K cells of a 1M x 1M occupancy map, which could never be allocated densely."""
+    print("== sparse 1Mx1M occupancy map, 100K cells ==")
+    rng = np.random.default_rng(0)
+    cells = list(zip(rng.integers(0, 1_000_000, 100_000).tolist(), rng.integers(0, 1_000_000, 100_000).tolist()))
+    grid = SparseArray2D.empty(1_000_000, 1_000_000, data_type=int)
+
+    def set_cells() -> None:
+        for row, column in cells:
+            grid[row, column] = 1
+
+    timed("set 100K cells: a[r, c] = 1", set_cells)
+    timed("get 100K cells: a[r, c]", lambda: [grid[row, column] for row, column in cells])
+    timed("iter_row over 10K rows", lambda: [list(grid.iter_row(row)) for row, _ in cells[:10_000]])
+    timed("iter_col over 10K columns", lambda: [list(grid.iter_col(column)) for _, column in cells[:10_000]])
+    crop = SparseArray2D.from_dense(Array2D(np.eye(2048, dtype=np.int64), data_type=int))
+    timed("from_dense + to_dense, 2Kx2K", lambda: SparseArray2D.from_dense(crop.to_dense()))
+
+
+if __name__ == '__main__':
+    bench_contiguous_grid()
+    bench_columns()
+    bench_cell_access()
+    bench_windows()
+    bench_stencil()
+    bench_sparse()
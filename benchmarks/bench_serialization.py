@@ -0,0 +1,48 @@
+""" Benchmarks for save()/load() on the datastructures versus plain pickle.
+    Run from the repository root with: python -m benchmarks.bench_serialization
+"""
+
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from benchmarks.bench_array import N, timed
+from datastructures.array import Array
+from datastructures.array2d import Array2D
+from datastructures.bag import Bag
+
+
+def compare(label: str, structure: object, directory: str) -> None:
+    """Time save/load against pickle.dump/pickle.load for one structure and report file sizes."""
+    print(f"== {label} ==")
+    saved, pickled = os.path.join(directory, "saved.ds"), os.path.join(directory, "pickled.pkl")
+
+    def dump_pickle() -> None:
+        with open(pickled, 'wb') as file:
+            pickle.dump(structure, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_pickle() -> object:
+        with open(pickled, 'rb') as file:
+            return pickle.load(file)
+
+    pickle_save = timed("pickle.dump", dump_pickle)
+    fast_save = timed("save()", lambda: structure.save(saved))
+    pickle_load = timed("pickle.load", load_pickle)
+    fast_load = timed("load()", lambda: type(structure).load(saved))
+    print(f"{'speedup save / load':<45} {pickle_save / fast_save:>9.1f}x / {pickle_load / fast_load:.1f}x")
+    print(f"{'file size save() / pickle':<45} {os.path.getsize(saved) / 2**20:>7.1f} MiB / {os.path.getsize(pickled) / 2**20:.1f} MiB")
+
+
+def main() -> None:
+    """Run every comparison in a scratch directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        compare("Array of 10M ints", Array.from_iterable(np.arange(10 * N), data_type=int), directory)
+        compare("Array of 1M floats (object storage)", Array.from_iterable(np.random.default_rng(0).random(N).tolist(), data_type=object), directory)
+        compare("Array2D 1000 x 1000 ints", Array2D([[r * 1000 + c for c in range(1000)] for r in range(1000)], data_type=int), directory)
+        compare("Bag of 1M distinct ints", Bag(range(N)), directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,72 +1,515 @@
 from __future__ import annotations
-from collections.abc import Sequence, Iterator
+import bisect
+import functools
+import heapq
+import math
+import operator
+import os
+from collections.abc import Callable, Iterable, Sequence, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
 from numpy.typing import NDArray
+from dataclasses import dataclass
+from typing import Generic
+from datastructures import serialization
 from datastructures.iarray import IArray, T
 
 
+# Python element types that can live in a native NumPy buffer instead of an object array. int is stored as int64,
+# so an int Array rejects values outside [-2**63, 2**63) with ValueError; use data_type=object for larger integers.
+NATIVE_DTYPES: dict[type, np.dtype] = {
+    bool: np.dtype(np.bool_),
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+    complex: np.dtype(np.complex128),
+}
+
+# NumPy dtype kinds whose elements pass isinstance(item, data_type) for each primitive data type.
+ACCEPTED_KINDS: dict[type, str] = {
+    bool: 'b',
+    int: 'biu',
+    float: 'f',
+    complex: 'c',
+}
+
+# Items handed to Python callables at a time when an operation cannot be vectorized.
+CHUNK_SIZE = 4096
+
+# Object arrays shorter than this are sorted in-process even when parallel=True: below it, pickling the chunks
+# to worker processes costs more than the sort itself.
+PARALLEL_SORT_THRESHOLD = 100_000
+
+
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+
+def _check_range(item: object, dtype: np.dtype) -> None:
+    """Raise ValueError if item is an int that an int64 buffer cannot hold."""
+    if dtype.kind == 'i' and not _INT64_MIN <= item <= _INT64_MAX:
+        raise ValueError(f"{item} does not fit in int64; use data_type=object for larger integers.")
+
+
+def storage_dtype(data_type: type) -> np.dtype:
+    """Return the NumPy dtype used to store elements of data_type (object for anything non-primitive)."""
+    return NATIVE_DTYPES.get(data_type, np.dtype(object))
+
+
+def iterate_native(items: NDArray, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Yield the items as Python values, converting a chunk at a time with tolist() instead of boxing
+        one NumPy scalar per item.
+    """
+    for begin in range(0, len(items), chunk_size):
+        yield from items[begin:begin + chunk_size].tolist()
+
+
+def selection_index(index: object, size: int) -> NDArray:
+    """Validate an integer index array or boolean mask for a sequence of size items and return it as NumPy.
+        Accepts sequences, NumPy arrays, Arrays and ArrayViews; an empty selection becomes an empty intp array.
+    """
+    if isinstance(index, Array):
+        index = index._live()
+    elif isinstance(index, ArrayView):
+        index = index._view
+    elif not isinstance(index, (Sequence, np.ndarray)) or isinstance(index, str):
+        raise TypeError("Index must be an integer, a slice, an integer sequence or a boolean mask.")
+
+    positions = np.asarray(index)
+    if positions.size == 0:
+        return positions.astype(np.intp).reshape(0)
+    if positions.ndim != 1:
+        raise IndexError("Index arrays must be one-dimensional.")
+    if positions.dtype == bool:
+        if len(positions) != size:
+            raise IndexError(f"Boolean mask has {len(positions)} entries, expected {size}.")
+        return positions
+    if positions.dtype.kind not in 'iu':
+        raise TypeError("Index must be an integer, a slice, an integer sequence or a boolean mask.")
+    if positions.min() < -size or positions.max() >= size:
+        raise IndexError("Index out of bounds.")
+    return positions
+
+
+def _sorted_chunk(items: list, key: Callable[[object], object] | None, reverse: bool) -> list:
+    """Sort one chunk of a parallel object sort. Runs in a worker process, so it must live at module level."""
+    return sorted(items, key=key, reverse=reverse)
+
+
+def python_type(dtype: np.dtype) -> type:
+    """Return the Python data type an Array should use for a NumPy result of the given dtype."""
+    for data_type, kinds in ACCEPTED_KINDS.items():
+        if dtype.kind in kinds:
+            return data_type
+    return object
+
+
+@dataclass(frozen=True)
+class GrowthPolicy:
+    """When and by how much an Array reallocates. The array grows by growth_factor when an end is full and
+        shrinks by shrink_factor once it is at most shrink_threshold full. Keeping shrink_threshold below
+        shrink_factor leaves a dead band, so a push/pop workload cannot make the array grow and shrink back
+        and forth. The defaults are the textbook double-when-full, halve-at-a-quarter policy.
+    """
+    growth_factor: float = 2.0
+    shrink_threshold: float = 0.25
+    shrink_factor: float = 0.5
+    min_capacity: int = 2
+
+    def __post_init__(self) -> None:
+        """Reject policies that could not terminate or that would thrash."""
+        if self.growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1.")
+        if not 0 <= self.shrink_threshold < self.shrink_factor < 1:
+            raise ValueError("Need 0 <= shrink_threshold < shrink_factor < 1 so that shrinking cannot thrash.")
+        if self.min_capacity < 2:
+            raise ValueError("min_capacity must be at least 2.")
+
+    def grown(self, capacity: int) -> int:
+        """Capacity after growing from capacity."""
+        return max(self.min_capacity, capacity + 1, math.ceil(capacity * self.growth_factor))
+
+    def should_shrink(self, size: int, capacity: int) -> bool:
+        """True when size items in capacity slots is sparse enough to shrink."""
+        return capacity > self.min_capacity and size <= capacity * self.shrink_threshold
+
+    def shrunk(self, capacity: int) -> int:
+        """Capacity after shrinking from capacity."""
+        return max(self.min_capacity, int(capacity * self.shrink_factor))
+
+
+@dataclass
+class ResizeCounters:
+    """How many times an Array grew, shrank or recentred its buffer in place, and how many items those moves copied.
+        unshares counts the buffer copies made because a write would have been visible through a snapshot.
+    """
+    grows: int = 0
+    shrinks: int = 0
+    recentres: int = 0
+    items_copied: int = 0
+    unshares: int = 0
+
+
 class Array(IArray[T]):  
-    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object) -> None:
+    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object, growth_policy: GrowthPolicy | None = None) -> None:
         """Initialize a dynamic array using NumPy."""
         if not isinstance(starting_sequence, Sequence):
             raise ValueError("Starting sequence must be a valid sequence type.")
 
-        self._data_type = data_type
+        self._init_state(data_type, growth_policy)
         self._logical_size = len(starting_sequence)
-        self._physical_size = max(2, self._logical_size * 2)  
-        self._array: NDArray = np.empty(self._physical_size, dtype=self._data_type)
+        self._physical_size = max(self._policy.min_capacity, math.ceil(self._logical_size * self._policy.growth_factor))
+        self._array: NDArray = self._allocate(self._physical_size)
+        # Items live in _array[_start:_start + _logical_size]; the slack on both sides makes front
+        # and back operations amortized O(1).
+        self._start = 0
+
+        self._validate_many(starting_sequence)
+        # fromiter converts in one pass without an intermediate list of NumPy scalars, and keeps nested
+        # sequences as single elements of an object array instead of broadcasting them.
+        self._array[:self._logical_size] = self._convert(starting_sequence)
+
+    def _init_state(self, data_type: type, growth_policy: GrowthPolicy | None) -> None:
+        """Set up everything except the buffer; shared by every way of constructing an array."""
+        self._data_type = data_type
+        self._dtype = storage_dtype(data_type)
+        self._policy = growth_policy or GrowthPolicy()
+        self._reserved = 0
+        self.resize_counters = ResizeCounters()
+        # Physical slots [begin, end) of the current buffer that snapshots can see, or None if none can.
+        self._shared: tuple[int, int] | None = None
+        # True once a raw NumPy view of the current buffer has been handed out (to_numpy(), np.asarray(),
+        # iter_chunks()): writes through it cannot be intercepted, so snapshots must copy.
+        self._exported = False
+        # Replaced on every reallocation, but kept when unsharing: ArrayViews follow the buffer across unshares only.
+        self._lineage = object()
+
+    @property
+    def is_native(self) -> bool:
+        """True when elements are stored in a primitive NumPy buffer rather than an object array."""
+        return self._dtype != object
+
+    def _validate(self, item: T) -> None:
+        """Raise TypeError if item is not an instance of the array's data type, ValueError if it overflows int64."""
+        if not isinstance(item, self._data_type):
+            raise TypeError(f"Expected type {self._data_type}, but got {type(item)}")
+        _check_range(item, self._dtype)
+
+    def _validate_many(self, items: Sequence[T]) -> None:
+        """Type check a whole batch at once: each distinct element type is checked only once."""
+        if self._data_type is object:
+            return
+        for item_type in set(map(type, items)):
+            if not issubclass(item_type, self._data_type):
+                raise TypeError(f"Expected type {self._data_type}, but got {item_type}")
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], data_type: type = object, size_hint: int | None = None) -> Array[T]:
+        """Build an array from any iterable, allocating once when the size is known or hinted."""
+        array = cls(data_type=data_type)
+        if size_hint is not None:
+            array._ensure_capacity(size_hint)
+        array.extend(iterable)
+        return array
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """Append every item of iterable, growing capacity at most once and copying in a single step."""
+        block = self._as_block(iterable)
+        count = len(block)
+        if count == 0:
+            return
+        if np.may_share_memory(block, self._array):
+            # a.extend(a) or a.extend(a[i:j]): recentring below could overwrite the block before it is copied.
+            block = block.copy()
+        self._ensure_capacity(self._logical_size + count)
+        end = self._start + self._logical_size
+        if end + count > self._physical_size:
+            self._move_within((self._physical_size - self._logical_size - count) // 2)
+            end = self._start + self._logical_size
+        self._before_write(end, end + count)
+        self._array[end:end + count] = block
+        self._logical_size += count
+
+    def _as_block(self, iterable: Iterable[T]) -> NDArray:
+        """Turn iterable into a validated 1-D NumPy block ready to copy into the buffer."""
+        if isinstance(iterable, Array):
+            iterable = iterable._live()
+        elif not isinstance(iterable, np.ndarray) and not isinstance(iterable, (str, bytes)):
+            try:
+                iterable = np.asarray(memoryview(iterable))
+            except TypeError:
+                pass
 
-        for i, item in enumerate(starting_sequence):
-            if not isinstance(item, self._data_type):
-                raise TypeError(f"Expected type {self._data_type}, but got {type(item)}")  
-            self._array[i] = item
+        if isinstance(iterable, np.ndarray) and iterable.dtype != object:
+            if iterable.ndim != 1:
+                raise ValueError("Only one-dimensional blocks can be added to an Array.")
+            accepted = ACCEPTED_KINDS.get(self._data_type)
+            if self._data_type is not object and (accepted is None or iterable.dtype.kind not in accepted):
+                raise TypeError(f"Expected type {self._data_type}, but got array of {iterable.dtype}")
+            return iterable if self.is_native else iterable.astype(object)
+
+        items = iterable if isinstance(iterable, (list, tuple, np.ndarray)) else list(iterable)
+        self._validate_many(items)
+        return self._convert(items)
+
+    def _convert(self, items: Sequence[T]) -> NDArray:
+        """Convert validated items to a block of the storage dtype in one pass."""
+        try:
+            return np.fromiter(items, dtype=self._dtype, count=len(items))
+        except OverflowError:
+            raise ValueError("Items do not fit in int64; use data_type=object for larger integers.") from None
+
+    def to_numpy(self, copy: bool = False) -> NDArray:
+        """Return the items as a NumPy array: a view of the live buffer region, or an independent copy.
+            The view reflects later writes but not appends, removals or reallocation.
+        """
+        return self._live().copy() if copy else self._export()
+
+    def to_memoryview(self) -> memoryview:
+        """Return a zero-copy memoryview of the items, for struct, file or socket I/O on primitive dtypes."""
+        if not self.is_native:
+            raise TypeError(f"Array of {self._data_type} has no buffer representation.")
+        return memoryview(self._export())
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> NDArray:
+        """NumPy interop: lets np.asarray, np.sum, np.save etc. use the live region directly. While a snapshot
+            shares the live slots the region is handed out read-only, so reading it never copies the buffer.
+        """
+        live = self._live()
+        if dtype is not None and np.dtype(dtype) != live.dtype:
+            if copy is False:
+                raise ValueError(f"Cannot convert Array of {live.dtype} to {dtype} without copying.")
+            return live.astype(dtype)
+        if copy:
+            return live.copy()
+        if self._is_shared(self._start, self._start + self._logical_size):
+            live.flags.writeable = False
+            return live
+        return self._export()
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the items to path in the binary format of datastructures.serialization: a raw buffer for
+            primitive dtypes, a pickle protocol 5 stream otherwise.
+        """
+        serialization.save(path, 'Array', self._live(), self._logical_size, {'data_type': self._data_type, 'growth_policy': self._policy})
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> Array:
+        """Read an Array written by save()."""
+        _, metadata, payload = serialization.load(path, 'Array')
+        array = Array(data_type=metadata['data_type'], growth_policy=metadata['growth_policy'])
+        if payload.dtype == array._dtype and len(payload) >= array._physical_size:
+            # The freshly read buffer is exactly the live region, so adopt it rather than copying it again.
+            array._array, array._physical_size, array._logical_size = payload, len(payload), len(payload)
+        else:
+            array.extend(payload)
+        return array
+
+    def to_shared(self) -> Array[T]:
+        """Copy the items into a new shared memory segment owned by this process and return a SharedArray
+            over it. See datastructures.sharedarray.SharedArray for the ownership and unlink protocol.
+        """
+        from datastructures.sharedarray import SharedArray
+        return SharedArray.create(self)
+
+    @staticmethod
+    def attach_shared(name: str) -> Array:
+        """Map a segment created by to_shared() in another process, without copying its items."""
+        from datastructures.sharedarray import SharedArray
+        return SharedArray.attach(name)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Buffer protocol (Python 3.12+): memoryview(array), file.write(array), socket.sendall(array)."""
+        return self.to_memoryview()
+
+    @property
+    def capacity(self) -> int:
+        """The physical size: how many items fit before the next reallocation."""
+        return self._physical_size
+
+    def reserve(self, capacity: int) -> None:
+        """Presize the buffer for at least capacity items and keep automatic shrinking from going below it."""
+        if capacity < 0:
+            raise ValueError("Capacity must be non-negative.")
+        self._reserved = capacity
+        if capacity > self._physical_size:
+            self._reallocate(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """Release unused capacity (down to the policy's minimum) and drop any reservation."""
+        self._reserved = 0
+        target = max(self._policy.min_capacity, self._logical_size)
+        if target != self._physical_size:
+            self._reallocate(target, 0)
+
+    def _ensure_capacity(self, required: int) -> None:
+        """Grow the buffer (by at least the growth factor) so it can hold required elements."""
+        if required > self._physical_size:
+            self._reallocate(max(required, self._policy.grown(self._physical_size)))
+
+    def _live(self) -> NDArray:
+        """Return a view of the occupied region of the buffer."""
+        return self._array[self._start:self._start + self._logical_size]
+
+    def _writable_live(self) -> NDArray:
+        """Return the live region for writing, or for handing out as a writable view, unsharing it first."""
+        self._before_write(self._start, self._start + self._logical_size)
+        return self._live()
+
+    def _export(self) -> NDArray:
+        """Return the live region as a raw writable NumPy view for callers outside the Array."""
+        live = self._writable_live()
+        self._exported = True
+        return live
+
+    def snapshot(self) -> ArrayView[T]:
+        """Return a read-only view of the current items, usually in O(1). The snapshot shares the buffer; the array
+            copies the buffer (once) the first time it would overwrite a slot a snapshot can see, and slices taken
+            from the array do the same when written through. Appending into free slots and reallocating on growth
+            leave snapshots intact without copying.
+
+            Raw NumPy views (to_numpy(), iter_chunks()) write to the buffer directly, so while one taken from the
+            current buffer may be alive the snapshot is an O(n) copy instead. np.asarray(array) is read-only while
+            a snapshot shares the slots, and only counts as a raw view otherwise. Writing through
+            a slice that outlived a reallocation of the array is not tracked either and may show in snapshots
+            taken before that reallocation.
+        """
+        if self._exported:
+            frozen = self._live().copy()
+        else:
+            begin, end = self._start, self._start + self._logical_size
+            if self._shared is not None:
+                begin, end = min(begin, self._shared[0]), max(end, self._shared[1])
+            self._shared = (begin, end)
+            frozen = self._live()[:]
+        frozen.flags.writeable = False
+        return ArrayView(frozen, self._data_type)
+
+    def _is_shared(self, begin: int, end: int) -> bool:
+        """True if any of physical slots [begin, end) is visible through a snapshot."""
+        return self._shared is not None and begin < self._shared[1] and self._shared[0] < end
+
+    def _before_write(self, begin: int, end: int) -> None:
+        """Copy the buffer if physical slots [begin, end) are visible through a snapshot."""
+        if self._is_shared(begin, end):
+            self.resize_counters.unshares += 1
+            self._array = self._array.copy()
+            self._shared = None
+            self._exported = False
 
     def __len__(self) -> int:
         """Return the logical size of the array."""
         return self._logical_size
 
-    def __getitem__(self, index: int | slice) -> T | Array[T]:
-        """Retrieve an item or slice from the array."""
-        if isinstance(index, int):
+    def __getitem__(self, index: int | slice | Sequence[int] | Sequence[bool] | NDArray) -> T | ArrayView[T] | Array[T]:
+        """Retrieve an item, a zero-copy view for a slice, or a new Array gathered by an integer index array
+            or a boolean mask (one NumPy fancy-indexing operation).
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
             if index < 0:
                 index += self._logical_size
             if index < 0 or index >= self._logical_size:
                 raise IndexError("Array index out of bounds.")
-            return self._array[index].item() if isinstance(self._array[index], np.generic) else self._array[index]
+            item = self._array[self._start + index]
+            return item.item() if isinstance(item, np.generic) else item
 
         if isinstance(index, slice):
-            return Array(
-                starting_sequence=[x.item() if isinstance(x, np.generic) else x for x in self._array[index][:self._logical_size]],
-                data_type=self._data_type
-            )
+            # Not unshared here: the view unshares the buffer itself if it is written through.
+            positions = range(self._start, self._start + self._logical_size)[index]
+            return ArrayView(self._live()[index], self._data_type, self, positions)
 
-        raise TypeError("Index must be an integer or a slice.")
+        gathered = self._live()[self._fancy_index(index)]
+        array = Array(data_type=self._data_type, growth_policy=self._policy)
+        array.extend(gathered)
+        return array
 
-    def __setitem__(self, index: int, item: T) -> None:
-        """Modify an item at a specific index."""
-        if not isinstance(item, self._data_type):
-            raise TypeError(f"Expected type {self._data_type}, but got {type(item)}")  
-        if index < 0:
-            index += self._logical_size
-        if index < 0 or index >= self._logical_size:
-            raise IndexError("Array index out of bounds.")
-        self._array[index] = item
+    def __setitem__(self, index: int | slice | Sequence[int] | Sequence[bool] | NDArray, item: T | Sequence[T]) -> None:
+        """Modify an item at a specific index, or scatter into a slice, an integer index array or a boolean mask.
+            For scatters, item is either one value for every selected slot or an Array, view, list or NumPy array
+            with one value per selected slot (tuples count as single values).
+        """
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            self._validate(item)
+            if index < 0:
+                index += self._logical_size
+            if index < 0 or index >= self._logical_size:
+                raise IndexError("Array index out of bounds.")
+            self._before_write(self._start + index, self._start + index + 1)
+            self._array[self._start + index] = item
+            return
+
+        selection = index if isinstance(index, slice) else self._fancy_index(index)
+        live = self._writable_live()
+        if isinstance(item, (Array, ArrayView, list, np.ndarray)):
+            values = self._as_block(item._view if isinstance(item, ArrayView) else item)
+            if len(values) != len(live[selection]):
+                raise ValueError(f"Cannot assign {len(values)} values to {len(live[selection])} selected items.")
+            live[selection] = values
+        else:
+            self._validate(item)
+            if self.is_native:
+                live[selection] = item
+            else:
+                # Wrapping the item in a 0-d object array stops NumPy from unpacking sequence-like items.
+                scalar = np.empty((), dtype=object)
+                scalar[()] = item
+                live[selection] = scalar
+
+    def _fancy_index(self, index: object) -> NDArray:
+        """Validate an integer index array or boolean mask against the live region and return it as NumPy."""
+        return selection_index(index, self._logical_size)
 
     def append(self, data: T) -> None:
         """Append an item to the end of the array, resizing if necessary."""
-        if self._logical_size == self._physical_size:
-            self._resize(self._physical_size * 2)
-
-        self._array[self._logical_size] = data
+        # The hot path of one-by-one loading: checks are inlined and int64 overflow is caught on the store.
+        if not isinstance(data, self._data_type):
+            raise TypeError(f"Expected type {self._data_type}, but got {type(data)}")
+        end = self._start + self._logical_size
+        if end == self._physical_size:
+            self._make_room(at_front=False)
+            end = self._start + self._logical_size
+        if self._shared is not None:
+            self._before_write(end, end + 1)
+        try:
+            self._array[end] = data
+        except OverflowError:
+            raise ValueError(f"{data} does not fit in int64; use data_type=object for larger integers.") from None
         self._logical_size += 1
 
     def append_front(self, data: T) -> None:
         """Append an item to the front of the array."""
-        if self._logical_size == self._physical_size:
-            self._resize(self._physical_size * 2)
+        self._validate(data)
+        if self._start == 0:
+            self._make_room(at_front=True)
+
+        self._before_write(self._start - 1, self._start)
+        self._start -= 1
+        self._array[self._start] = data
+        self._logical_size += 1
+
+    def insert(self, index: int, data: T) -> None:
+        """Insert an item before index (list.insert semantics), shifting whichever side of it is shorter."""
+        self._validate(data)
+        if index < 0:
+            index = max(0, index + self._logical_size)
+        index = min(index, self._logical_size)
+        self._before_write(self._start - 1, self._start + self._logical_size + 1)
 
-        self._array[1 : self._logical_size + 1] = self._array[0 : self._logical_size]
-        self._array[0] = data
+        if index < self._logical_size // 2:
+            if self._start == 0:
+                self._make_room(at_front=True)
+            position = self._start + index
+            self._array[self._start - 1:position - 1] = self._array[self._start:position]
+            self._start -= 1
+            self._array[position - 1] = data
+        else:
+            if self._start + self._logical_size == self._physical_size:
+                self._make_room(at_front=False)
+            position = self._start + index
+            end = self._start + self._logical_size
+            self._array[position + 1:end + 1] = self._array[position:end]
+            self._array[position] = data
         self._logical_size += 1
 
     def pop(self) -> None:
@@ -74,64 +517,571 @@ class Array(IArray[T]):
         if self._logical_size == 0:
             raise IndexError("Pop from empty array.")
         self._logical_size -= 1
-        if self._logical_size <= self._physical_size // 4:
-            self._resize(self._physical_size // 2)
+        self._forget(self._start + self._logical_size, self._start + self._logical_size + 1)
+        self._maybe_shrink()
 
     def pop_front(self) -> None:
-        """Remove the first element and shift elements left."""
+        """Remove the first element by advancing the start offset."""
         if self._logical_size == 0:
             raise IndexError("Pop from empty array.")
-        self._array[: self._logical_size - 1] = self._array[1 : self._logical_size]
+        self._forget(self._start, self._start + 1)
+        self._start += 1
         self._logical_size -= 1
-        if self._logical_size <= self._physical_size // 4:
-            self._resize(self._physical_size // 2)
+        self._maybe_shrink()
 
     def __delitem__(self, index: int) -> None:
-        """Delete an item at an index and shift elements left."""
+        """Delete an item at an index, shifting whichever side of it is shorter."""
         if index < 0:
             index += self._logical_size
         if index < 0 or index >= self._logical_size:
             raise IndexError("Array index out of bounds.")
 
-        self._array[index:self._logical_size - 1] = self._array[index + 1:self._logical_size]
+        self._before_write(self._start, self._start + self._logical_size)
+        position = self._start + index
+        if index < self._logical_size // 2:
+            self._array[self._start + 1:position + 1] = self._array[self._start:position]
+            self._forget(self._start, self._start + 1)
+            self._start += 1
+        else:
+            end = self._start + self._logical_size
+            self._array[position:end - 1] = self._array[position + 1:end]
+            self._forget(end - 1, end)
         self._logical_size -= 1
-
-        if self._logical_size <= self._physical_size // 4:
-            self._resize(self._physical_size // 2)
+        self._maybe_shrink()
 
     def __eq__(self, other: object) -> bool:
-        """Check equality of two arrays."""
-        if not isinstance(other, Array):
-            return False
-        return np.array_equal(self._array[:self._logical_size], other._array[:other._logical_size])
+        """Check equality with another Array or a view."""
+        if isinstance(other, Array):
+            return np.array_equal(self._live(), other._live())
+        if isinstance(other, ArrayView):
+            return np.array_equal(self._live(), other._view)
+        return NotImplemented
 
     def __iter__(self) -> Iterator[T]:
-        """Return an iterator over the array."""
-        return iter(self._array[:self._logical_size])
+        """Return an iterator over the array that yields the same Python values as indexing does."""
+        return iterate_native(self._live())
+
+    def iter_chunks(self, size: int = CHUNK_SIZE) -> Iterator[NDArray]:
+        """Yield consecutive NumPy views of at most size items, for consumers that batch their own work."""
+        if size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        live = self._export()
+        for begin in range(0, len(live), size):
+            yield live[begin:begin + size]
 
     def __reversed__(self) -> Iterator[T]:
         """Return a reversed iterator."""
-        return iter(self._array[:self._logical_size][::-1])
+        return iterate_native(self._live()[::-1])
 
     def __contains__(self, item: T) -> bool:
         """Check if an item exists in the array."""
-        return item in self._array[:self._logical_size]
+        mask = self._equal_mask(self._live(), item)
+        if mask is None:
+            return any(element is item or element == item for element in self._live())
+        return bool(mask.any())
+
+    def index(self, value: T, start: int = 0, stop: int | None = None) -> int:
+        """Return the first index of value within [start, stop). Raises ValueError if it is not present."""
+        start, stop, _ = slice(start, stop).indices(self._logical_size)
+        region = self._live()[start:stop]
+        mask = self._equal_mask(region, value)
+        if mask is None:
+            for offset, element in enumerate(region):
+                if element is value or element == value:
+                    return start + offset
+        elif mask.any():
+            return start + int(mask.argmax())
+        raise ValueError(f"{value!r} is not in array")
+
+    def count(self, value: T) -> int:
+        """Return the number of occurrences of value."""
+        mask = self._equal_mask(self._live(), value)
+        if mask is None:
+            return sum(1 for element in self._live() if element is value or element == value)
+        return int(np.count_nonzero(mask))
+
+    def find_all(self, predicate_or_value: Callable[[T], bool] | T, vectorized: bool = False) -> Array[int]:
+        """Return the indices of all items equal to a value, or all items a predicate accepts. A NumPy ufunc on a
+            primitive dtype, or a predicate passed with vectorized=True (lambda x: x > 3), is applied once to the
+            whole NumPy block; any other predicate is called per item.
+        """
+        indices = Array(data_type=int)
+        indices.extend(np.flatnonzero(self._selection_mask(predicate_or_value, vectorized)))
+        return indices
+
+    def delete_many(self, indices: Iterable[int]) -> int:
+        """Delete the items at the given indices (negative allowed, duplicates ignored) in one compaction pass.
+            Returns the number of items removed.
+        """
+        positions = np.fromiter(indices, dtype=np.intp)
+        if len(positions) and (positions.min() < -self._logical_size or positions.max() >= self._logical_size):
+            raise IndexError("Array index out of bounds.")
+        keep = np.ones(self._logical_size, dtype=bool)
+        keep[positions] = False
+        return self._compact(keep)
+
+    def delete_where(self, mask_or_predicate: Sequence[bool] | NDArray | Callable[[T], bool], vectorized: bool = False) -> int:
+        """Delete every item selected by a boolean mask of the array's length, or accepted by a predicate,
+            in one compaction pass. Returns the number of items removed. See find_all() for vectorized.
+        """
+        if callable(mask_or_predicate):
+            mask = self._selection_mask(mask_or_predicate, vectorized)
+        else:
+            mask = np.asarray(mask_or_predicate, dtype=bool)
+            if mask.shape != (self._logical_size,):
+                raise ValueError(f"Mask must have one entry per item ({self._logical_size}), got shape {mask.shape}.")
+        return self._compact(~mask)
+
+    def retain(self, predicate: Callable[[T], bool], vectorized: bool = False) -> int:
+        """Keep only the items predicate accepts, in one compaction pass. Returns the number of items removed.
+            See find_all() for vectorized.
+        """
+        return self._compact(self._selection_mask(predicate, vectorized))
+
+    def map(self, function: Callable[[T], object], data_type: type | None = None, vectorized: bool = False) -> Array:
+        """Return a new Array of function applied to every item. NumPy ufuncs on primitive dtypes, and callables
+            passed with vectorized=True (lambda x: x * 2 + 1), are applied once to the whole NumPy block; anything else is
+            called per item a chunk at a time. The result's data type is inferred from a vectorized result,
+            otherwise it is object unless data_type is given.
+        """
+        live = self._live()
+        result = self._vectorized_result(live, function, vectorized)
+        if result is None:
+            result = np.empty(len(live), dtype=object)
+            for begin in range(0, len(live), CHUNK_SIZE):
+                result[begin:begin + CHUNK_SIZE] = [function(item) for item in live[begin:begin + CHUNK_SIZE].tolist()]
+        return Array._from_block(result, data_type)
+
+    def filter(self, predicate: Callable[[T], bool], vectorized: bool = False) -> Array[T]:
+        """Return a new Array with the items predicate accepts. See find_all() for vectorized."""
+        return Array._from_block(self._live()[self._selection_mask(predicate, vectorized)], self._data_type)
+
+    def reduce(self, function: Callable[[T, T], T], initial: T | None = None) -> T:
+        """Fold the items with a binary function, left to right. A NumPy ufunc such as np.add or np.maximum reduces
+            the whole block at once; other callables run through functools.reduce a chunk at a time.
+        """
+        live = self._live()
+        if isinstance(function, np.ufunc) and self.is_native:
+            if initial is None and len(live) == 0:
+                raise TypeError("reduce() of empty Array with no initial value")
+            result = function.reduce(live) if initial is None else function.reduce(live, initial=initial)
+            return result.item() if isinstance(result, np.generic) else result
+
+        chunks = (live[begin:begin + CHUNK_SIZE].tolist() for begin in range(0, len(live), CHUNK_SIZE))
+        items = (item for chunk in chunks for item in chunk)
+        if initial is None:
+            try:
+                initial = next(items)
+            except StopIteration:
+                raise TypeError("reduce() of empty Array with no initial value") from None
+        return functools.reduce(function, items, initial)
+
+    def __add__(self, other: object) -> Array:
+        """Element-wise array + other."""
+        return self._arithmetic(other, operator.add)
+
+    def __radd__(self, other: object) -> Array:
+        """Element-wise other + array."""
+        return self._arithmetic(other, operator.add, reflected=True)
+
+    def __sub__(self, other: object) -> Array:
+        """Element-wise array - other."""
+        return self._arithmetic(other, operator.sub)
+
+    def __rsub__(self, other: object) -> Array:
+        """Element-wise other - array."""
+        return self._arithmetic(other, operator.sub, reflected=True)
+
+    def __mul__(self, other: object) -> Array:
+        """Element-wise array * other."""
+        return self._arithmetic(other, operator.mul)
+
+    def __rmul__(self, other: object) -> Array:
+        """Element-wise other * array."""
+        return self._arithmetic(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other: object) -> Array:
+        """Element-wise array / other."""
+        return self._arithmetic(other, operator.truediv)
+
+    def __rtruediv__(self, other: object) -> Array:
+        """Element-wise other / array."""
+        return self._arithmetic(other, operator.truediv, reflected=True)
+
+    def __floordiv__(self, other: object) -> Array:
+        """Element-wise array // other."""
+        return self._arithmetic(other, operator.floordiv)
+
+    def __rfloordiv__(self, other: object) -> Array:
+        """Element-wise other // array."""
+        return self._arithmetic(other, operator.floordiv, reflected=True)
+
+    def __mod__(self, other: object) -> Array:
+        """Element-wise array % other."""
+        return self._arithmetic(other, operator.mod)
+
+    def __rmod__(self, other: object) -> Array:
+        """Element-wise other % array."""
+        return self._arithmetic(other, operator.mod, reflected=True)
+
+    def __pow__(self, other: object) -> Array:
+        """Element-wise array ** other."""
+        return self._arithmetic(other, operator.pow)
+
+    def __rpow__(self, other: object) -> Array:
+        """Element-wise other ** array."""
+        return self._arithmetic(other, operator.pow, reflected=True)
+
+    def __neg__(self) -> Array:
+        """Element-wise negation."""
+        return Array._from_block(-self._live())
+
+    def __abs__(self) -> Array:
+        """Element-wise absolute value."""
+        return Array._from_block(abs(self._live()))
+
+    def _arithmetic(self, other: object, op: Callable[[object, object], object], reflected: bool = False) -> Array:
+        """Element-wise op between this array and a scalar or an equally long Array, view or sequence.
+            NumPy does the work, so primitive dtypes never touch Python per item.
+        """
+        if isinstance(other, Array):
+            operand = other._live()
+        elif isinstance(other, ArrayView):
+            operand = other._view
+        elif isinstance(other, (list, tuple, np.ndarray)):
+            operand = np.asarray(other)
+        elif isinstance(other, (bool, int, float, complex, np.generic)) or not self.is_native:
+            operand = other
+        else:
+            return NotImplemented
+        if isinstance(operand, np.ndarray) and operand.shape != (self._logical_size,):
+            raise ValueError(f"Operand has shape {operand.shape}, expected ({self._logical_size},).")
+        live = self._live()
+        return Array._from_block(op(operand, live) if reflected else op(live, operand))
+
+    @staticmethod
+    def _from_block(block: NDArray, data_type: type | None = None) -> Array:
+        """Wrap a freshly computed 1-D NumPy block in a new Array, inferring the data type from its dtype."""
+        array = Array(data_type=data_type or python_type(np.asarray(block).dtype))
+        array.extend(block)
+        return array
+
+    def _vectorized_result(self, region: NDArray, function: Callable[[T], object], vectorized: bool = False) -> NDArray | None:
+        """Apply function to the whole block if the caller said it is vectorized, or if it is a ufunc and the
+            dtype is primitive, else None. Other callables are never probed with the block: they may branch on
+            the item type or have side effects.
+        """
+        if not vectorized and not (isinstance(function, np.ufunc) and self.is_native):
+            return None
+        result = function(region)
+        if not isinstance(result, np.ndarray) or result.shape != region.shape:
+            raise ValueError(f"A vectorized function must return an array of shape {region.shape}, got {type(result)}.")
+        return result
+
+    def _selection_mask(self, predicate_or_value: Callable[[T], bool] | T, vectorized: bool = False) -> NDArray:
+        """Boolean mask of the items equal to a value or accepted by a predicate, vectorized where possible."""
+        live = self._live()
+        if callable(predicate_or_value):
+            mask = self._vectorized_mask(live, predicate_or_value, vectorized)
+            if mask is None:
+                mask = np.fromiter((bool(predicate_or_value(element)) for element in live.tolist()), dtype=bool, count=len(live))
+        else:
+            mask = self._equal_mask(live, predicate_or_value)
+            if mask is None:
+                mask = np.fromiter((element is predicate_or_value or element == predicate_or_value for element in live), dtype=bool, count=len(live))
+        return mask
+
+    def _compact(self, keep: NDArray) -> int:
+        """Keep the items where keep is True, packed to the front of the live region, then shrink at most once."""
+        kept = self._live()[keep]
+        removed = self._logical_size - len(kept)
+        if removed == 0:
+            return 0
+        self._before_write(self._start, self._start + self._logical_size)
+        self._array[self._start:self._start + len(kept)] = kept
+        self._forget(self._start + len(kept), self._start + self._logical_size)
+        self._logical_size = len(kept)
+
+        target = self._physical_size
+        while self._policy.should_shrink(self._logical_size, target):
+            target = self._policy.shrunk(target)
+        target = max(target, self._reserved)
+        if target < self._physical_size:
+            self._reallocate(target)
+        return removed
+
+    def searchsorted(self, value: T, side: str = 'left') -> int:
+        """Return the insertion point for value in an array already sorted ascending (bisect semantics)."""
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'.")
+        if self.is_native:
+            return int(np.searchsorted(self._live(), value, side=side))
+        search = bisect.bisect_left if side == 'left' else bisect.bisect_right
+        return search(self._live(), value)
+
+    def sort(self, key: Callable[[T], object] | None = None, reverse: bool = False, parallel: bool = False) -> None:
+        """Sort the items in place, stably, with list.sort semantics for key and reverse. Primitive dtypes use
+            NumPy's sort (a ufunc key such as np.abs is applied to the whole block). Object dtypes with
+            parallel=True sort one chunk per CPU in a process pool and k-way merge the sorted runs; the items
+            and key must then be picklable (a module-level function or operator.itemgetter, not a lambda).
+        """
+        live = self._writable_live()
+        if self.is_native and key is None:
+            # Equal primitive values are indistinguishable, so the faster unstable sort is safe here.
+            live.sort()
+            if reverse:
+                live[:] = live[::-1].copy()
+        elif self.is_native:
+            live[:] = live[self._sort_order(live, key, reverse)]
+        elif not parallel or len(live) < PARALLEL_SORT_THRESHOLD or (os.cpu_count() or 1) == 1:
+            live[:] = np.fromiter(sorted(live.tolist(), key=key, reverse=reverse), dtype=object, count=len(live))
+        else:
+            workers = os.cpu_count()
+            chunks = [chunk.tolist() for chunk in np.array_split(live, workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                runs = list(executor.map(_sorted_chunk, chunks, repeat(key), repeat(reverse)))
+            live[:] = np.fromiter(heapq.merge(*runs, key=key, reverse=reverse), dtype=object, count=len(live))
+
+    def argsort(self, key: Callable[[T], object] | None = None, reverse: bool = False) -> Array[int]:
+        """Return the indices that would sort the array stably, leaving the array itself unchanged."""
+        indices = Array(data_type=int)
+        indices.extend(self._sort_order(self._live(), key, reverse))
+        return indices
+
+    def _sort_order(self, region: NDArray, key: Callable[[T], object] | None, reverse: bool) -> NDArray:
+        """Stable permutation that sorts region by key, vectorized when the keys form a primitive block."""
+        keys = region if key is None else self._vectorized_result(region, key)
+        if keys is None or keys.dtype == object:
+            items = region.tolist()
+            keys = items if key is None else [key(item) for item in items]
+            return np.fromiter(sorted(range(len(items)), key=keys.__getitem__, reverse=reverse), dtype=np.intp, count=len(items))
+        if not reverse:
+            return np.argsort(keys, kind='stable')
+        # Sorting the reversed block and flipping the result keeps equal keys in their original order.
+        return len(keys) - 1 - np.argsort(keys[::-1], kind='stable')[::-1]
+
+    def _equal_mask(self, region: NDArray, value: object) -> NDArray | None:
+        """Boolean mask of region == value computed by NumPy, or None when only Python equality is safe
+            (object storage, or a value NumPy would broadcast instead of comparing).
+        """
+        if not self.is_native:
+            return None
+        if not isinstance(value, (bool, int, float, complex, np.generic)):
+            return np.zeros(len(region), dtype=bool)
+        return np.asarray(region == value, dtype=bool)
+
+    def _vectorized_mask(self, region: NDArray, predicate: Callable[[T], bool], vectorized: bool = False) -> NDArray | None:
+        """Apply a ufunc or vectorized predicate to the whole block as a boolean mask, or return None."""
+        result = self._vectorized_result(region, predicate, vectorized)
+        return None if result is None else result.astype(bool, copy=False)
 
     def clear(self) -> None:
         """Clear the array."""
+        self._forget(self._start, self._start + self._logical_size)
         self._logical_size = 0
+        self._start = 0
 
     def __str__(self) -> str:
         """Return a string representation of the array."""
-        return str(list(self._array[:self._logical_size]))
+        return str(self._live().tolist())
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the array."""
         return f"Array(logical size: {self._logical_size}, physical size: {self._physical_size}, data type: {self._data_type})"
 
-    def _resize(self, new_size: int) -> None:
-        """Resize the array to a new size."""
-        new_array = np.empty(new_size, dtype=self._data_type)
-        new_array[: self._logical_size] = self._array[: self._logical_size]
+    def _allocate(self, size: int) -> NDArray:
+        """Create an uninitialised backing buffer with room for size items."""
+        return np.empty(size, dtype=self._dtype)
+
+    def _forget(self, begin: int, end: int) -> None:
+        """Clear vacated slots of an object buffer so removed items can be garbage collected."""
+        if not self.is_native:
+            self._before_write(begin, end)
+            self._array[begin:end] = None
+
+    def _make_room(self, at_front: bool) -> None:
+        """Free at least one slot on the requested end: recentre in place when at least half the
+            buffer is slack, otherwise grow the buffer and give all new space to that end.
+        """
+        if self._logical_size <= self._physical_size // 2:
+            slack = self._physical_size - self._logical_size
+            self._move_within((slack + 1) // 2 if at_front else slack // 2)
+            return
+
+        grown = self._policy.grown(self._physical_size)
+        extra = grown - self._physical_size
+        self._reallocate(grown, self._start + extra if at_front else self._start)
+
+    def _maybe_shrink(self) -> None:
+        """Shrink the buffer when the growth policy says it is sparse enough, but never below the reservation."""
+        if self._physical_size > self._reserved and self._policy.should_shrink(self._logical_size, self._physical_size):
+            target = max(self._policy.shrunk(self._physical_size), self._reserved)
+            if target < self._physical_size:
+                self._reallocate(target)
+
+    def _move_within(self, new_start: int) -> None:
+        """Recentre the live region inside the current buffer, recording the event."""
+        if new_start != self._start:
+            self.resize_counters.recentres += 1
+            self.resize_counters.items_copied += self._logical_size
+            self._recentre(new_start)
+
+    def _reallocate(self, new_size: int, new_start: int | None = None) -> None:
+        """Resize the buffer, recording the event."""
+        if new_size > self._physical_size:
+            self.resize_counters.grows += 1
+        else:
+            self.resize_counters.shrinks += 1
+        self.resize_counters.items_copied += self._logical_size
+        self._resize(new_size, new_start)
+
+    def _recentre(self, new_start: int) -> None:
+        """Move the live region to new_start within the current buffer."""
+        if new_start == self._start:
+            return
+        if self._shared is not None:
+            # Moving into a fresh buffer leaves snapshots intact and costs the same single copy.
+            self._resize(self._physical_size, new_start)
+            return
+        live = self._live().copy()
+        self._forget(self._start, self._start + self._logical_size)
+        self._start = new_start
+        self._array[self._start:self._start + self._logical_size] = live
+
+    def _resize(self, new_size: int, new_start: int | None = None) -> None:
+        """Resize the array to a new size. Unless told otherwise the live region keeps its front slack,
+            capped so the items still fit and the remaining slack is split evenly.
+        """
+        if new_start is None:
+            new_start = min(self._start, (new_size - self._logical_size) // 2)
+        new_array = self._allocate(new_size)
+        new_array[new_start:new_start + self._logical_size] = self._live()
         self._array = new_array
+        self._start = new_start
         self._physical_size = new_size
+        self._shared = None
+        self._exported = False
+        self._lineage = object()
+
+
+class ArrayView(Sequence[T], Generic[T]):
+    """A read/write window onto part of an Array's buffer. Slicing an Array returns one of these without
+        copying; writes through the view are visible in the Array and vice versa. The view keeps referring to
+        the buffer it was taken from, so it stops tracking the Array once the Array reallocates (grows or shrinks).
+        When the Array copies its buffer away from a snapshot, the view moves to the new copy; writing through a
+        view makes that copy first if the slot is visible to a snapshot. Views returned by Array.snapshot() are
+        read-only (see its caveats). Call copy() for an independent Array.
+    """
+
+    def __init__(self, view: NDArray, data_type: type = object, source: Array | None = None, positions: range | None = None) -> None:
+        """Wrap a one-dimensional NumPy view, optionally of source's buffer at physical positions."""
+        self._data = view
+        self._data_type = data_type
+        self._source = source
+        self._positions = positions
+        self._buffer = source._array if source is not None else None
+        self._lineage = source._lineage if source is not None else None
+
+    @property
+    def _view(self) -> NDArray:
+        """The NumPy view, moved onto the source's current buffer if the source unshared it since."""
+        source = self._source
+        if source is not None and source._array is not None and source._array is not self._buffer and source._lineage is self._lineage:
+            self._buffer = source._array
+            stop = self._positions.stop if self._positions.stop >= 0 else None
+            self._data = self._buffer[self._positions.start:stop:self._positions.step]
+        return self._data
+
+    def _attached(self) -> bool:
+        """True while the view still tracks its source's buffer."""
+        return self._source is not None and self._source._lineage is self._lineage
+
+    def __len__(self) -> int:
+        """Return the number of items in the view."""
+        return len(self._view)
+
+    def __getitem__(self, index: int | slice) -> T | ArrayView[T]:
+        """Retrieve an item, or a nested view for a slice."""
+        if isinstance(index, (int, np.integer)):
+            index = int(index)
+            if index < 0:
+                index += len(self._view)
+            if index < 0 or index >= len(self._view):
+                raise IndexError("ArrayView index out of bounds.")
+            item = self._view[index]
+            return item.item() if isinstance(item, np.generic) else item
+
+        if isinstance(index, slice):
+            if self._attached():
+                return ArrayView(self._view[index], self._data_type, self._source, self._positions[index])
+            return ArrayView(self._view[index], self._data_type)
+
+        raise TypeError("Index must be an integer or a slice.")
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """Write an item through to the underlying buffer."""
+        if not isinstance(item, self._data_type):
+            raise TypeError(f"Expected type {self._data_type}, but got {type(item)}")
+        _check_range(item, self._view.dtype)
+        index = int(index)
+        if index < 0:
+            index += len(self._view)
+        if index < 0 or index >= len(self._view):
+            raise IndexError("ArrayView index out of bounds.")
+        if self._attached():
+            position = self._positions[index]
+            self._source._before_write(position, position + 1)
+        self._view[index] = item
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the view."""
+        return iterate_native(self._view)
+
+    def to_numpy(self, copy: bool = False) -> NDArray:
+        """Return the items as a NumPy array: the view itself (read-only for snapshots), or an independent copy."""
+        if copy:
+            return self._view.copy()
+        if self._attached() and len(self._positions):
+            first, last = self._positions[0], self._positions[-1]
+            self._source._before_write(min(first, last), max(first, last) + 1)
+            self._source._exported = True
+        return self._view
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> NDArray:
+        """NumPy interop: np.sum(array[i:j]) and friends read the viewed slots directly, not item by item."""
+        view = self._view
+        if dtype is not None and np.dtype(dtype) != view.dtype:
+            if copy is False:
+                raise ValueError(f"Cannot convert view of {view.dtype} to {dtype} without copying.")
+            return view.astype(dtype)
+        if copy:
+            return view.copy()
+        if self._attached() and len(self._positions):
+            first, last = self._positions[0], self._positions[-1]
+            if self._source._is_shared(min(first, last), max(first, last) + 1):
+                view = view[:]
+                view.flags.writeable = False
+                return view
+        return self.to_numpy()
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality with another view or Array."""
+        if isinstance(other, ArrayView):
+            return np.array_equal(self._view, other._view)
+        if isinstance(other, Array):
+            return np.array_equal(self._view, other._live())
+        return NotImplemented
+
+    def copy(self) -> Array[T]:
+        """Return an independent Array holding the items of this view."""
+        array = Array(data_type=self._data_type)
+        array.extend(self._view)
+        return array
+
+    def __str__(self) -> str:
+        """Return a string representation of the view."""
+        return str(self._view.tolist())
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the view."""
+        return f"ArrayView(size: {len(self._view)}, data type: {self._data_type})"
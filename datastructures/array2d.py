@@ -1,85 +1,406 @@
 from __future__ import annotations
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import Iterator, Sequence, TypeVar, Generic
+import numpy as np
+from numpy.typing import NDArray
+from datastructures import serialization
+from datastructures.array import Array, NATIVE_DTYPES, ACCEPTED_KINDS, iterate_native, python_type, storage_dtype
 from datastructures.iarray2d import IArray2D, T
+from datastructures.sharedarray import attach_untracked
 
 T = TypeVar("T")
 
+# np.pad modes behind each stencil boundary: zeros outside the grid, periodic, or mirrored about the edge cell.
+_BOUNDARY_MODES = {'zero': 'constant', 'wrap': 'wrap', 'reflect': 'reflect'}
+# Rows computed per pass of a stencil, so the shifted windows of a band stay in cache while they are summed.
+STENCIL_BAND_ROWS = 256
+# Grids with fewer cells than this are never split across processes: copying them into shared memory would cost
+# more than the stencil itself.
+PARALLEL_STENCIL_THRESHOLD = 4096 * 4096
+
+
+def _accumulate(padded: NDArray, taps: list[tuple[int, int, object]], out: NDArray, begin: int, end: int) -> None:
+    """Compute rows [begin, end) of out as the sum of weight * (padded shifted by (i, j)) over the taps."""
+    columns = out.shape[1]
+    for band in range(begin, end, STENCIL_BAND_ROWS):
+        stop = min(band + STENCIL_BAND_ROWS, end)
+        target = out[band:stop]
+        target[...] = 0
+        scratch = None
+        for i, j, weight in taps:
+            window = padded[band + i:stop + i, j:j + columns]
+            if weight == 1:
+                target += window
+            elif weight == -1:
+                target -= window
+            else:
+                if scratch is None:
+                    scratch = np.empty_like(target)
+                np.multiply(window, weight, out=scratch)
+                target += scratch
+
+
+def _stencil_band(padded_name: str, out_name: str, padded_shape: tuple[int, int], out_shape: tuple[int, int],
+                  dtype: str, taps: list[tuple[int, int, object]], begin: int, end: int) -> None:
+    """Worker side of a parallel stencil: attach to the shared padded grid and output and fill one band of rows."""
+    padded_segment, out_segment = attach_untracked(padded_name), attach_untracked(out_name)
+    padded = np.ndarray(padded_shape, dtype=dtype, buffer=padded_segment.buf)
+    out = np.ndarray(out_shape, dtype=dtype, buffer=out_segment.buf)
+    _accumulate(padded, taps, out, begin, end)
+    # The views must be gone before the segments can be closed.
+    del padded, out
+    padded_segment.close()
+    out_segment.close()
+
 class Array2D(IArray2D[T]):
+    """A rows x columns grid stored in one contiguous 2D NumPy buffer: a native dtype for bool, int, float and
+        complex, an object array otherwise. Rows, columns (col(j)), sub-grids (a[r0:r1, c0:c1]) and transpose()
+        are zero-copy views of that buffer, so writes through any of them are visible everywhere; copy() makes an
+        independent grid.
+    """
+
     class Row(IArray2D.IRow[T]):
         def __init__(self, row_index: int, array: Array2D[T], num_columns: int) -> None:
             self.row_index = row_index
             self.array = array
             self.num_columns = num_columns
+            self._view: NDArray = array._data[row_index]
 
         def __getitem__(self, column_index: int) -> T:
-            if column_index < 0 or column_index >= self.num_columns:
+            if column_index < 0 or column_index >= len(self._view):
                 raise IndexError("Column index out of bounds")
-            return self.array._data[self.row_index][column_index]
-        
+            item = self._view[column_index]
+            return item.item() if isinstance(item, np.generic) else item
+
         def __setitem__(self, column_index: int, value: T) -> None:
-            if column_index < 0 or column_index >= self.num_columns:
+            if column_index < 0 or column_index >= len(self._view):
                 raise IndexError("Column index out of bounds")
-            self.array._data[self.row_index][column_index] = value
-        
+            if not isinstance(value, self.array.data_type):
+                raise ValueError(f"Expected type {self.array.data_type}, but got {type(value)}")
+            self._view[column_index] = value
+
         def __iter__(self) -> Iterator[T]:
-            return iter(self.array._data[self.row_index])
-        
+            return iterate_native(self._view)
+
         def __reversed__(self) -> Iterator[T]:
-            return reversed(self.array._data[self.row_index])
+            return iterate_native(self._view[::-1])
 
         def __len__(self) -> int:
-            return self.num_columns
-        
+            return len(self._view)
+
+        def to_numpy(self) -> NDArray:
+            """Returns the row as a NumPy view of the grid's buffer."""
+            return self._view
+
         def __str__(self) -> str:
-            return f"[{', '.join(map(str, self.array._data[self.row_index]))}]"
-        
+            return f"[{', '.join(map(str, self._view.tolist()))}]"
+
         def __repr__(self) -> str:
             return f"Row {self.row_index}: {self}"
 
-    def __init__(self, starting_sequence: Sequence[Sequence[T]] = [[]], data_type=object) -> None:
+    class Column(Row):
+        """One column as a strided view of the grid's buffer; indexed by row, otherwise used like a Row."""
+
+        def __init__(self, column_index: int, array: Array2D[T], num_rows: int) -> None:
+            self.column_index = column_index
+            self.array = array
+            self.num_rows = num_rows
+            self._view: NDArray = array._data[:, column_index]
+
+        def __repr__(self) -> str:
+            return f"Column {self.column_index}: {self}"
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]] | NDArray = [[]], data_type=object) -> None:
         """Initializes the 2D array, validating input data."""
+        if isinstance(starting_sequence, np.ndarray):
+            if starting_sequence.ndim != 2:
+                raise ValueError("Starting array must be two-dimensional.")
+            if data_type in ACCEPTED_KINDS and starting_sequence.dtype.kind not in ACCEPTED_KINDS[data_type]:
+                raise ValueError(f"Cannot store {starting_sequence.dtype} items as {data_type}.")
+            self._data: NDArray = np.array(starting_sequence, dtype=storage_dtype(data_type), order='C')
+            self.data_type = data_type
+            if self._data.dtype == object:
+                self._validate_items()
+            return
+
         if not isinstance(starting_sequence, Sequence) or any(not isinstance(row, Sequence) for row in starting_sequence):
             raise ValueError("Starting sequence must be a sequence of sequences.")
 
-        if any(any(not isinstance(item, data_type) for item in row) for row in starting_sequence):
-            raise ValueError("All elements in starting_sequence must be of the same data type.")
-
+        self.data_type = data_type
+        self._validate_items(starting_sequence)
         row_lengths = {len(row) for row in starting_sequence}
         if len(row_lengths) > 1:
             raise ValueError("All rows must have the same length.")
 
-        self._data = [list(row) for row in starting_sequence]
-        self.__num_rows = len(self._data)
-        self.__num_columns = row_lengths.pop() if self.__num_rows > 0 else 0
-        self.data_type = data_type
+        num_rows = len(starting_sequence)
+        num_columns = row_lengths.pop() if num_rows > 0 else 0
+        self._data = np.empty((num_rows, num_columns), dtype=storage_dtype(data_type))
+        if self._data.dtype != object:
+            self._data[...] = starting_sequence
+            return
+        for row_index, row in enumerate(starting_sequence):
+            # fromiter keeps sequence-like items whole instead of broadcasting them into extra dimensions.
+            self._data[row_index] = np.fromiter(row, dtype=object, count=num_columns)
+
+    def _validate_items(self, rows: Sequence[Sequence[T]] | None = None) -> None:
+        """Raises ValueError unless every item is an instance of data_type; each distinct item type is checked once."""
+        if self.data_type is object:
+            return
+        items = (item for row in rows for item in row) if rows is not None else self._data.flat
+        for item_type in set(map(type, items)):
+            if not issubclass(item_type, self.data_type):
+                raise ValueError("All elements in starting_sequence must be of the same data type.")
+
+    @classmethod
+    def _wrap(cls, data: NDArray, data_type: type) -> Array2D:
+        """Builds an Array2D around an existing 2D buffer without copying or validating it."""
+        array = cls.__new__(cls)
+        array._data = data
+        array.data_type = data_type
+        return array
 
     @staticmethod
     def empty(rows: int = 0, cols: int = 0, data_type: type = object) -> Array2D:
         """Creates an empty Array2D of given dimensions and data type."""
+        if data_type in NATIVE_DTYPES:
+            return Array2D._wrap(np.zeros((rows, cols), dtype=NATIVE_DTYPES[data_type]), data_type)
         return Array2D([[data_type() for _ in range(cols)] for _ in range(rows)], data_type=data_type)
 
-    def __getitem__(self, row_index: int) -> Row[T]:
-        """Returns a row at the specified index."""
-        if row_index < 0 or row_index >= self.__num_rows:
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The (rows, columns) of the grid."""
+        return self._data.shape
+
+    def copy(self) -> Array2D[T]:
+        """Returns an independent grid with its own contiguous buffer, e.g. to keep a window past later writes."""
+        return Array2D._wrap(self._data.copy(), self.data_type)
+
+    def to_numpy(self, copy: bool = False) -> NDArray:
+        """Returns the grid as a 2D NumPy array: a view of the buffer, or an independent copy."""
+        return self._data.copy() if copy else self._data
+
+    def fill(self, value: T) -> None:
+        """Sets every cell to value in one vectorized write."""
+        if not isinstance(value, self.data_type):
+            raise ValueError(f"Expected type {self.data_type}, but got {type(value)}")
+        if self._data.dtype == object:
+            # A 0-d object array stops NumPy from unpacking sequence-like values.
+            scalar = np.empty((), dtype=object)
+            scalar[()] = value
+            value = scalar
+        self._data[...] = value
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Writes the grid to path: one raw rows x columns buffer for primitive data types, a pickled object array otherwise."""
+        num_rows, num_columns = self.shape
+        serialization.save(path, 'Array2D', self._data, num_rows * num_columns,
+                           {'data_type': self.data_type, 'rows': num_rows, 'columns': num_columns})
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> Array2D:
+        """Reads an Array2D written by save()."""
+        _, metadata, payload = serialization.load(path, 'Array2D')
+        return Array2D._wrap(payload.reshape(metadata['rows'], metadata['columns']), metadata['data_type'])
+
+    def __getitem__(self, index: int | slice | tuple[int, int] | tuple[slice, slice]) -> Row[T] | T | Array2D[T]:
+        """Returns a row at the specified index, or with a[r, c] the item itself without building a Row.
+            a[r0:r1, c0:c1] (any steps) and a[r0:r1] return a sub-grid view sharing this grid's buffer.
+        """
+        if isinstance(index, slice):
+            return Array2D._wrap(self._data[index], self.data_type)
+        if isinstance(index, tuple):
+            row_index, column_index = index
+            if isinstance(row_index, slice) and isinstance(column_index, slice):
+                return Array2D._wrap(self._data[row_index, column_index], self.data_type)
+            if isinstance(row_index, slice) or isinstance(column_index, slice):
+                raise TypeError("Index with two integers or two slices; use a[r] or col(c) for a single line.")
+            if row_index < 0 or column_index < 0:
+                raise IndexError("Index out of bounds")
+            # ndarray.item bounds-checks and returns a Python value in one call.
+            return self._data.item(row_index, column_index)
+        if index < 0 or index >= len(self._data):
             raise IndexError("Row index out of bounds")
-        return Array2D.Row(row_index, self, self.__num_columns)
-    
+        return Array2D.Row(index, self, self._data.shape[1])
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        """Sets the item at a[r, c] directly in the buffer."""
+        if not isinstance(index, tuple):
+            raise TypeError("Assign to a[r, c], or to a[r][c] through a row.")
+        row_index, column_index = index
+        num_rows, num_columns = self._data.shape
+        if row_index < 0 or row_index >= num_rows or column_index < 0 or column_index >= num_columns:
+            raise IndexError("Index out of bounds")
+        if not isinstance(value, self.data_type):
+            raise ValueError(f"Expected type {self.data_type}, but got {type(value)}")
+        self._data[row_index, column_index] = value
+
+    def get_many(self, rows: Sequence[int] | NDArray, cols: Sequence[int] | NDArray) -> Array:
+        """Gathers the items at (rows[i], cols[i]) for every i in one vectorized lookup and returns them as an Array."""
+        row_indices, column_indices = np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)
+        if row_indices.ndim != 1 or row_indices.shape != column_indices.shape:
+            raise ValueError("rows and cols must be one-dimensional and of equal length.")
+        num_rows, num_columns = self._data.shape
+        if len(row_indices) and (row_indices.min() < 0 or row_indices.max() >= num_rows
+                                 or column_indices.min() < 0 or column_indices.max() >= num_columns):
+            raise IndexError("Index out of bounds")
+        gathered = Array(data_type=self.data_type)
+        gathered.extend(self._data[row_indices, column_indices])
+        return gathered
+
+    def col(self, column_index: int) -> Column[T]:
+        """Returns a column at the specified index as a strided view."""
+        if column_index < 0 or column_index >= self._data.shape[1]:
+            raise IndexError("Column index out of bounds")
+        return Array2D.Column(column_index, self, len(self._data))
+
+    def iter_columns(self) -> Iterator[Column[T]]:
+        """Returns an iterator over the columns."""
+        return (Array2D.Column(column_index, self, len(self._data)) for column_index in range(self._data.shape[1]))
+
+    def transpose(self) -> Array2D[T]:
+        """Returns the columns x rows transpose as a view that shares this grid's buffer."""
+        return Array2D._wrap(self._data.T, self.data_type)
+
+    def reduce(self, function: Callable[[T, T], T], axis: int | None = None) -> T | Array:
+        """Folds the items with a binary function over the whole grid (axis=None), down each column (axis=0,
+            one result per column) or along each row (axis=1, one result per row). NumPy ufuncs such as np.add
+            reduce vectorized; other callables fold each line with functools.reduce.
+        """
+        if axis not in (None, 0, 1):
+            raise ValueError("axis must be None, 0 or 1.")
+        if isinstance(function, np.ufunc):
+            result = function.reduce(self._data, axis=axis) if axis is not None else function.reduce(self._data.reshape(-1))
+        elif axis is None:
+            result = functools.reduce(function, self._data.reshape(-1).tolist())
+        else:
+            lines = self._data.T if axis == 0 else self._data
+            values = [functools.reduce(function, line.tolist()) for line in lines]
+            value_types = set(map(type, values))
+            return Array.from_iterable(values, value_types.pop() if len(value_types) == 1 else object)
+        return self._reduced(result, axis)
+
+    def sum(self, axis: int | None = None) -> T | Array:
+        """Sum of the items over the grid, per column (axis=0) or per row (axis=1)."""
+        return self.reduce(np.add, axis)
+
+    def min(self, axis: int | None = None) -> T | Array:
+        """Smallest item over the grid, per column (axis=0) or per row (axis=1)."""
+        return self.reduce(np.minimum, axis)
+
+    def max(self, axis: int | None = None) -> T | Array:
+        """Largest item over the grid, per column (axis=0) or per row (axis=1)."""
+        return self.reduce(np.maximum, axis)
+
+    def mean(self, axis: int | None = None) -> float | Array:
+        """Mean of the items over the grid, per column (axis=0) or per row (axis=1)."""
+        if axis not in (None, 0, 1):
+            raise ValueError("axis must be None, 0 or 1.")
+        return self._reduced(self._data.mean(axis=axis), axis)
+
+    def stencil(self, kernel: Sequence[Sequence[object]] | NDArray | Array2D, boundary: str = 'zero', parallel: bool = False) -> Array2D:
+        """Returns a new grid where each cell is the kernel-weighted sum of its neighbourhood, e.g.
+            [[1, 1, 1], [1, 0, 1], [1, 1, 1]] counts the 8 neighbours. The kernel has odd dimensions, is centred
+            on the cell and is not flipped (correlation). Outside the grid, boundary='zero' reads zeros, 'wrap'
+            wraps around and 'reflect' mirrors about the edge cell without repeating it.
+
+            The sum is vectorized: one shifted-window add per non-zero kernel weight over a padded copy of the
+            grid. Integer sums accumulate in the narrowest integer dtype that cannot overflow (int8 for 0/1 cells
+            and 8 neighbours), which keeps memory traffic low on large grids. With parallel=True, primitive grids
+            of at least PARALLEL_STENCIL_THRESHOLD cells are split into row bands computed by a process pool over
+            shared memory.
+        """
+        if boundary not in _BOUNDARY_MODES:
+            raise ValueError(f"boundary must be one of {list(_BOUNDARY_MODES)}, got {boundary!r}.")
+        weights = np.asarray(kernel.to_numpy() if isinstance(kernel, Array2D) else kernel)
+        if weights.ndim != 2 or weights.shape[0] % 2 == 0 or weights.shape[1] % 2 == 0 or weights.dtype.kind not in 'biufc':
+            raise ValueError("kernel must be a 2D numeric grid with odd dimensions.")
+
+        result_dtype = np.result_type(self._data.dtype, weights.dtype)
+        data_type = python_type(result_dtype) if result_dtype != object else self.data_type
+        if self._data.size == 0:
+            return Array2D._wrap(np.zeros(self._data.shape, dtype=storage_dtype(data_type)), data_type)
+
+        accumulator = self._stencil_dtype(weights, result_dtype)
+        half_rows, half_columns = weights.shape[0] // 2, weights.shape[1] // 2
+        pads = ((half_rows, half_rows), (half_columns, half_columns))
+        taps = [(i, j, weights[i, j].item()) for i, j in zip(*np.nonzero(weights))]
+        source = self._data.astype(accumulator, copy=False)
+        workers = os.cpu_count() or 1
+        if parallel and workers > 1 and accumulator != object and self._data.size >= PARALLEL_STENCIL_THRESHOLD:
+            out = self._parallel_stencil(source, pads, _BOUNDARY_MODES[boundary], taps, workers)
+        else:
+            padded = np.pad(source, pads, mode=_BOUNDARY_MODES[boundary])
+            out = np.empty(self._data.shape, dtype=accumulator)
+            _accumulate(padded, taps, out, 0, len(out))
+        return Array2D._wrap(out.astype(storage_dtype(data_type), copy=False), data_type)
+
+    def _stencil_dtype(self, weights: NDArray, result_dtype: np.dtype) -> np.dtype:
+        """The dtype a stencil sums in: the narrowest signed integer that holds max |cell| * sum |weight| for
+            integer sums, otherwise the result dtype itself.
+        """
+        if result_dtype.kind not in 'biu':
+            return result_dtype
+        largest = max(int(self._data.max()), -int(self._data.min()))
+        bound = largest * int(np.abs(weights.astype(np.int64)).sum())
+        return np.promote_types(np.min_scalar_type(-bound - 1), np.int8)
+
+    @staticmethod
+    def _parallel_stencil(source: NDArray, pads: tuple, mode: str, taps: list[tuple[int, int, object]], workers: int) -> NDArray:
+        """Pad source into shared memory and let one process per band of rows sum its part of the output there."""
+        padded_shape = (source.shape[0] + sum(pads[0]), source.shape[1] + sum(pads[1]))
+        padded_segment = shared_memory.SharedMemory(create=True, size=max(1, padded_shape[0] * padded_shape[1] * source.itemsize))
+        out_segment = shared_memory.SharedMemory(create=True, size=max(1, source.size * source.itemsize))
+        try:
+            padded = np.ndarray(padded_shape, dtype=source.dtype, buffer=padded_segment.buf)
+            padded[...] = np.pad(source, pads, mode=mode)
+            del padded
+            bounds = np.linspace(0, source.shape[0], workers + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                bands = [executor.submit(_stencil_band, padded_segment.name, out_segment.name, padded_shape, source.shape,
+                                         source.dtype.str, taps, begin, end)
+                         for begin, end in zip(bounds[:-1], bounds[1:]) if end > begin]
+                for band in bands:
+                    band.result()
+            return np.ndarray(source.shape, dtype=source.dtype, buffer=out_segment.buf).copy()
+        finally:
+            padded_segment.close()
+            padded_segment.unlink()
+            out_segment.close()
+            out_segment.unlink()
+
+    def _reduced(self, result: object, axis: int | None) -> object:
+        """A whole-grid result as a Python value, or a per-line result as an Array."""
+        if axis is None:
+            return result.item() if isinstance(result, np.generic) else result
+        return Array._from_block(result)
+
     def __iter__(self) -> Iterator[Sequence[T]]:
         """Returns an iterator over the rows."""
-        return iter(self._data)
-    
+        return (Array2D.Row(row_index, self, self._data.shape[1]) for row_index in range(len(self._data)))
+
     def __reversed__(self) -> Iterator[Sequence[T]]:
         """Returns a reversed iterator over the rows."""
-        return reversed(self._data)
-    
+        return (Array2D.Row(row_index, self, self._data.shape[1]) for row_index in reversed(range(len(self._data))))
+
     def __len__(self) -> int:
         """Returns the number of rows in the 2D array."""
-        return self.__num_rows
-                                  
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        """Checks two grids have the same shape and items."""
+        if not isinstance(other, Array2D):
+            return False
+        return np.array_equal(self._data, other._data)
+
     def __str__(self) -> str:
         """Returns a string representation of the 2D array."""
-        return f"[{', '.join(str(row) for row in self._data)}]"
-    
+        return f"[{', '.join(str(row) for row in self)}]"
+
     def __repr__(self) -> str:
         """Returns a detailed string representation of the 2D array."""
-        return f"Array2D {self.__num_rows} Rows x {self.__num_columns} Columns, items: {str(self)}"
+        num_rows, num_columns = self.shape
+        return f"Array2D {num_rows} Rows x {num_columns} Columns, items: {str(self)}"
@@ -1,4 +1,6 @@
+import os
 from typing import Iterable, Optional, Dict
+from datastructures import serialization
 from datastructures.ibag import IBag, T  
 
 
@@ -37,3 +39,14 @@ class Bag(IBag[T]):
 
     def clear(self) -> None:
         self._items.clear()
+
+    def save(self, path: str | os.PathLike) -> None:
+        # The counts dict is pickled (protocol 5): converting it to NumPy columns costs more than it saves.
+        serialization.save(path, 'Bag', self._items, len(self))
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> 'Bag':
+        _, _, items = serialization.load(path, 'Bag')
+        bag = Bag()
+        bag._items = items
+        return bag
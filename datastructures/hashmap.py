@@ -1,5 +1,7 @@
 import copy
+import os
 from typing import Callable, Iterator, Optional, Tuple
+from datastructures import serialization
 from datastructures.ihashmap import KT, VT, IHashMap
 from datastructures.array import Array
 from datastructures.linkedlist import LinkedList
@@ -100,6 +102,18 @@ class HashMap(IHashMap[KT, VT]):
     def __repr__(self) -> str:
         return f"HashMap({str(self)})"
 
+    def save(self, path: str | os.PathLike) -> None:
+        serialization.save(path, 'HashMap', list(self.items()), self._size,
+                           {'capacity': self._capacity, 'load_factor': self._load_factor, 'data_type': self._data_type})
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> 'HashMap':
+        _, metadata, items = serialization.load(path, 'HashMap')
+        hashmap = HashMap(initial_capacity=metadata['capacity'], load_factor=metadata['load_factor'], data_type=metadata['data_type'])
+        for key, value in items:
+            hashmap[key] = value
+        return hashmap
+
     @staticmethod
     def _default_hash_function(key: KT) -> int:
         try:
@@ -0,0 +1,152 @@
+from __future__ import annotations
+import os
+import struct
+from collections.abc import Sequence
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array import Array, ArrayView, GrowthPolicy, NATIVE_DTYPES
+from datastructures.iarray import T
+
+
+# File layout: a fixed 64 byte header followed by the raw physical buffer.
+_MAGIC = b'DSMMAP01'
+_HEADER = struct.Struct('<8s16sqqq')
+_HEADER_SIZE = 64
+# Items moved per step when the live region slides inside the file, so moves never need the whole array in RAM.
+_MOVE_CHUNK = 1 << 20
+
+
+class MemmapArray(Array[T]):
+    """An Array whose backing buffer is an np.memmap file instead of memory. Growing or shrinking resizes the file
+        and remaps it; the header (dtype, start offset, logical and physical size) is written by flush() and close(),
+        so open() can reattach to an existing file in O(1) without reading the items. Only primitive data types
+        (see NATIVE_DTYPES) can be memory mapped.
+    """
+
+    def __init__(self, path: str | os.PathLike, starting_sequence: Sequence[T] = [], data_type: type = int,
+                 growth_policy: GrowthPolicy | None = None) -> None:
+        """Create (or overwrite) the file at path and fill it with starting_sequence."""
+        if data_type not in NATIVE_DTYPES:
+            raise TypeError(f"MemmapArray requires a primitive data type, got {data_type}")
+        self._path = os.fspath(path)
+        super().__init__(starting_sequence, data_type, growth_policy)
+        self.flush()
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, growth_policy: GrowthPolicy | None = None) -> MemmapArray:
+        """Reattach to a file written by a MemmapArray. Only the header is read."""
+        path = os.fspath(path)
+        with open(path, 'rb') as file:
+            magic, dtype_str, start, logical_size, physical_size = _HEADER.unpack(file.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a MemmapArray file.")
+
+        dtype = np.dtype(dtype_str.rstrip(b'\0').decode())
+        data_type = next(python_type for python_type, native in NATIVE_DTYPES.items() if native == dtype)
+
+        array = cls.__new__(cls)
+        array._path = path
+        array._init_state(data_type, growth_policy)
+        array._start = start
+        array._logical_size = logical_size
+        array._physical_size = physical_size
+        array._array = array._map(physical_size)
+        return array
+
+    @property
+    def path(self) -> str:
+        """The backing file."""
+        return self._path
+
+    def flush(self) -> None:
+        """Write pending changes and the current header to disk."""
+        self._array.flush()
+        with open(self._path, 'r+b') as file:
+            file.write(_HEADER.pack(_MAGIC, self._dtype.str.encode(), self._start, self._logical_size, self._physical_size))
+
+    def close(self) -> None:
+        """Flush, trim the file to the physical size and release the mapping. Neither the array nor views
+            taken from it can be used afterwards.
+        """
+        self.flush()
+        self._array = None
+        self._set_file_size(self._physical_size)
+
+    def __enter__(self) -> MemmapArray[T]:
+        """Use the array as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the array."""
+        self.close()
+
+    def snapshot(self) -> ArrayView[T]:
+        """Return a read-only copy of the items. Unlike Array.snapshot() this is O(n):
+            the file mapping cannot be swapped for a private copy on write.
+        """
+        frozen = np.array(self._live())
+        frozen.flags.writeable = False
+        return ArrayView(frozen, self._data_type)
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the array."""
+        return f"MemmapArray(path: {self._path}, logical size: {self._logical_size}, physical size: {self._physical_size}, data type: {self._data_type})"
+
+    def _map(self, size: int) -> NDArray:
+        """Map size items of the file after the header."""
+        return np.memmap(self._path, dtype=self._dtype, mode='r+', offset=_HEADER_SIZE, shape=(size,))
+
+    def _set_file_size(self, size: int) -> None:
+        """Truncate or extend the file so it holds exactly size items."""
+        with open(self._path, 'r+b') as file:
+            file.truncate(_HEADER_SIZE + size * self._dtype.itemsize)
+
+    def _extend_file(self, size: int) -> None:
+        """Make the file hold at least size items, never truncating it: mappings taken before an earlier shrink
+            may still cover the old end of the file.
+        """
+        needed = _HEADER_SIZE + size * self._dtype.itemsize
+        if os.path.getsize(self._path) < needed:
+            with open(self._path, 'r+b') as file:
+                file.truncate(needed)
+
+    def _allocate(self, size: int) -> NDArray:
+        """Create the file with room for size items and map it. Only used by the constructor."""
+        with open(self._path, 'wb') as file:
+            file.write(bytes(_HEADER_SIZE))
+        self._set_file_size(size)
+        return self._map(size)
+
+    def _move(self, new_start: int) -> None:
+        """Slide the live region to new_start in chunks, front to back or back to front so nothing is overwritten."""
+        count, old_start = self._logical_size, self._start
+        if new_start == old_start:
+            return
+        offsets = range(0, count, _MOVE_CHUNK)
+        for offset in (offsets if new_start < old_start else reversed(offsets)):
+            stop = min(offset + _MOVE_CHUNK, count)
+            self._array[new_start + offset:new_start + stop] = self._array[old_start + offset:old_start + stop]
+        self._start = new_start
+
+    def _recentre(self, new_start: int) -> None:
+        """Move the live region within the file without staging it in memory."""
+        self._move(new_start)
+
+    def _resize(self, new_size: int, new_start: int | None = None) -> None:
+        """Grow the file or shrink the mapped window and remap, moving the items in chunks."""
+        if new_start is None:
+            new_start = min(self._start, (new_size - self._logical_size) // 2)
+
+        if new_size < self._physical_size:
+            # The file itself is only trimmed by close(): views of the old, larger mapping may still be alive
+            # and touching pages past the end of a truncated file is a fatal SIGBUS.
+            self._move(new_start)
+            self._array.flush()
+            self._array = self._map(new_size)
+        else:
+            self._array.flush()
+            self._extend_file(new_size)
+            self._array = self._map(new_size)
+            self._move(new_start)
+        self._physical_size = new_size
+        self._lineage = object()
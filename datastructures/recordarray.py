@@ -0,0 +1,275 @@
+from __future__ import annotations
+import inspect
+import typing
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from enum import Enum
+from itertools import islice
+from typing import Any, Generic
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array import CHUNK_SIZE, GrowthPolicy, NATIVE_DTYPES, selection_index
+from datastructures.iarray import T
+
+
+def _enum_dtype(enum_type: type[Enum]) -> np.dtype:
+    """The smallest unsigned integer dtype that can hold a code for every member of enum_type."""
+    return np.min_scalar_type(max(0, len(enum_type) - 1))
+
+
+class RecordArray(Sequence[T], Generic[T]):
+    """An array of records stored as one typed NumPy column per field (struct of arrays) instead of one Python
+        object per record. Primitive fields use their native dtype, Enum fields a small integer code (uint8 for up
+        to 256 members), str fields UTF-8 bytes in a fixed-width column that widens to the longest value seen,
+        and any other field type an object column. Records are only built when they are read, by calling
+        record_type(**fields). where(color=Color.RED) compares a whole column at once.
+
+        Strings ending in NUL characters lose them, since NumPy's fixed-width bytes are NUL padded.
+    """
+
+    def __init__(self, schema: Mapping[str, type], record_type: Callable[..., T] | None = None, records: Iterable[T] = (),
+                 growth_policy: GrowthPolicy | None = None) -> None:
+        """Create an empty RecordArray for schema (field name -> type) and add records. Without a record_type,
+            rows are materialized as a namedtuple of the fields.
+        """
+        if not schema:
+            raise ValueError("A RecordArray needs at least one field.")
+        self._schema: dict[str, type] = dict(schema)
+        self._record_type = record_type or namedtuple('Record', list(self._schema))
+        self._policy = growth_policy or GrowthPolicy()
+        self._members: dict[str, NDArray] = {}
+        self._codes: dict[str, dict[Enum, int]] = {}
+        dtypes = {}
+        for name, field_type in self._schema.items():
+            if isinstance(field_type, type) and issubclass(field_type, Enum):
+                self._members[name] = np.fromiter(field_type, dtype=object, count=len(field_type))
+                self._codes[name] = {member: code for code, member in enumerate(field_type)}
+                dtypes[name] = _enum_dtype(field_type)
+            elif field_type is str:
+                dtypes[name] = np.dtype('S1')
+            else:
+                dtypes[name] = NATIVE_DTYPES.get(field_type, np.dtype(object))
+        self._logical_size = 0
+        self._physical_size = self._policy.min_capacity
+        self._columns: dict[str, NDArray] = {name: np.zeros(self._physical_size, dtype=dtype) for name, dtype in dtypes.items()}
+        self.extend(records)
+
+    @classmethod
+    def for_class(cls, record_type: type[T], records: Iterable[T] = (), growth_policy: GrowthPolicy | None = None) -> RecordArray[T]:
+        """Create a RecordArray whose schema is the annotated parameters of record_type.__init__, such as
+            Car(vin: str, color: Color, make: Make, model: Model).
+        """
+        hints = typing.get_type_hints(record_type.__init__)
+        parameters = list(inspect.signature(record_type.__init__).parameters)[1:]
+        missing = [name for name in parameters if name not in hints]
+        if missing:
+            raise TypeError(f"{record_type.__name__}.__init__ has unannotated parameters: {missing}")
+        return cls({name: hints[name] for name in parameters}, record_type, records, growth_policy)
+
+    @property
+    def fields(self) -> dict[str, type]:
+        """The schema: field name -> field type."""
+        return dict(self._schema)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the live rows of every column (object columns count their pointers only)."""
+        return sum(column[:self._logical_size].nbytes for column in self._columns.values())
+
+    def column(self, name: str) -> NDArray:
+        """Read-only view of one column's storage: native values, enum codes or UTF-8 bytes."""
+        view = self._columns[self._field(name)][:self._logical_size]
+        view.flags.writeable = False
+        return view
+
+    def _field(self, name: str) -> str:
+        """Check name is a field of the schema."""
+        if name not in self._schema:
+            raise KeyError(f"RecordArray has no field {name!r}; fields are {list(self._schema)}.")
+        return name
+
+    def _encode(self, name: str, values: list) -> NDArray:
+        """Validate a list of Python values for field name and convert them to the column's storage."""
+        field_type = self._schema[name]
+        wrong = next((value for value in values if not isinstance(value, field_type)), None)
+        if wrong is not None:
+            raise TypeError(f"Field {name!r} expects {field_type}, but got {type(wrong)}")
+        if name in self._codes:
+            codes = self._codes[name]
+            return np.fromiter((codes[value] for value in values), dtype=self._columns[name].dtype, count=len(values))
+        if field_type is str:
+            return np.array([value.encode() for value in values], dtype=bytes)
+        column = self._columns[name]
+        if column.dtype == object:
+            return np.fromiter(values, dtype=object, count=len(values))
+        return np.asarray(values, dtype=column.dtype)
+
+    def _decode(self, name: str, block: NDArray) -> list:
+        """Convert a block of column storage back to Python values."""
+        if name in self._members:
+            return self._members[name][block].tolist()
+        if self._schema[name] is str:
+            return [value.decode() for value in block.tolist()]
+        return block.tolist()
+
+    def _store(self, name: str, begin: int, encoded: NDArray) -> None:
+        """Write encoded values into a column from row begin, widening a string column if they do not fit."""
+        column = self._columns[name]
+        if encoded.dtype.kind == 'S' and encoded.dtype.itemsize > column.dtype.itemsize:
+            column = self._columns[name] = column.astype(encoded.dtype)
+        column[begin:begin + len(encoded)] = encoded
+
+    def _values_of(self, record: T) -> dict[str, Any]:
+        """The field values of a record: a mapping's items or the record's attributes."""
+        if isinstance(record, Mapping):
+            return {name: record[name] for name in self._schema}
+        return {name: getattr(record, name) for name in self._schema}
+
+    def _build(self, fields: dict[str, list]) -> list[T]:
+        """Materialize records from per-field value lists."""
+        names = list(fields)
+        return [self._record_type(**dict(zip(names, row))) for row in zip(*fields.values())]
+
+    def _ensure_capacity(self, required: int) -> None:
+        """Grow every column (by at least the growth factor) so it can hold required rows."""
+        if required <= self._physical_size:
+            return
+        new_size = max(required, self._policy.grown(self._physical_size))
+        for name, column in self._columns.items():
+            grown = np.zeros(new_size, dtype=column.dtype)
+            grown[:self._logical_size] = column[:self._logical_size]
+            self._columns[name] = grown
+        self._physical_size = new_size
+
+    def append(self, record: T) -> None:
+        """Add one record at the end."""
+        self.extend((record,))
+
+    def extend(self, records: Iterable[T]) -> None:
+        """Add records at the end, encoding them column by column a chunk at a time. A chunk that fails
+            validation is not added.
+        """
+        iterator = iter(records)
+        while True:
+            batch = [self._values_of(record) for record in islice(iterator, CHUNK_SIZE)]
+            if not batch:
+                return
+            encoded = {name: self._encode(name, [values[name] for values in batch]) for name in self._schema}
+            self._ensure_capacity(self._logical_size + len(batch))
+            for name, block in encoded.items():
+                self._store(name, self._logical_size, block)
+            self._logical_size += len(batch)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._logical_size
+
+    def __getitem__(self, index: int | slice | Sequence[int] | Sequence[bool] | NDArray) -> T | RecordArray[T]:
+        """Materialize the record at an integer index, or gather a new RecordArray by slice, index array or mask."""
+        if isinstance(index, (int, np.integer)):
+            row = self._normalize(int(index))
+            fields = {name: self._decode(name, column[row:row + 1]) for name, column in self._columns.items()}
+            return self._build(fields)[0]
+        if isinstance(index, str):
+            raise TypeError("Index must be an integer, a slice, an integer sequence or a boolean mask; use column() for fields.")
+        selection = index if isinstance(index, slice) else selection_index(index, self._logical_size)
+        return self._gather(selection)
+
+    def __setitem__(self, index: int, record: T) -> None:
+        """Overwrite the record at index."""
+        row = self._normalize(index)
+        values = self._values_of(record)
+        encoded = {name: self._encode(name, [values[name]]) for name in self._schema}
+        for name, block in encoded.items():
+            self._store(name, row, block)
+
+    def _normalize(self, index: int) -> int:
+        """Resolve a negative index and check bounds."""
+        if index < 0:
+            index += self._logical_size
+        if index < 0 or index >= self._logical_size:
+            raise IndexError("RecordArray index out of bounds.")
+        return index
+
+    def _gather(self, selection: slice | NDArray) -> RecordArray[T]:
+        """New RecordArray with the same schema holding the selected rows."""
+        result = RecordArray(self._schema, self._record_type, growth_policy=self._policy)
+        for name, column in self._columns.items():
+            picked = column[:self._logical_size][selection]
+            result._columns[name] = picked.copy() if isinstance(selection, slice) else picked
+        result._logical_size = result._physical_size = len(next(iter(result._columns.values())))
+        return result
+
+    def pop(self) -> None:
+        """Remove the last record."""
+        if self._logical_size == 0:
+            raise IndexError("Pop from empty array.")
+        self._logical_size -= 1
+        for column in self._columns.values():
+            if column.dtype == object:
+                column[self._logical_size] = None
+
+    def clear(self) -> None:
+        """Remove every record."""
+        for column in self._columns.values():
+            if column.dtype == object:
+                column[:self._logical_size] = None
+        self._logical_size = 0
+
+    def mask(self, **conditions: object) -> NDArray:
+        """Boolean mask of the rows matching every condition. A condition is field=value for equality, or
+            field=(value, ...) (any list, tuple, set or frozenset) for membership. Enum and str conditions are
+            translated to codes and bytes once, so every comparison is a single vectorized pass over a column.
+        """
+        selected = np.ones(self._logical_size, dtype=bool)
+        for name, condition in conditions.items():
+            column = self._columns[self._field(name)][:self._logical_size]
+            wanted = list(condition) if isinstance(condition, (list, tuple, set, frozenset)) else [condition]
+            keys = self._condition_keys(name, wanted)
+            if not keys:
+                selected[:] = False
+            elif len(keys) == 1:
+                selected &= column == keys[0]
+            elif column.dtype == object:
+                selected &= np.fromiter((value in keys for value in column.tolist()), dtype=bool, count=len(column))
+            else:
+                selected &= np.isin(column, keys)
+        return selected
+
+    def _condition_keys(self, name: str, wanted: list) -> list:
+        """Translate condition values to column storage, dropping values the column cannot hold."""
+        if name in self._codes:
+            return [self._codes[name][value] for value in wanted if value in self._codes[name]]
+        if self._schema[name] is str:
+            return [value.encode() for value in wanted if isinstance(value, str)]
+        return wanted
+
+    def where(self, **conditions: object) -> RecordArray[T]:
+        """New RecordArray of the rows matching every condition, e.g. cars.where(color=Color.RED, make=Make.FORD)."""
+        return self._gather(self.mask(**conditions))
+
+    def count_where(self, **conditions: object) -> int:
+        """Number of rows matching every condition, without gathering them."""
+        return int(np.count_nonzero(self.mask(**conditions)))
+
+    def __iter__(self) -> Iterator[T]:
+        """Materialize records a chunk at a time."""
+        for begin in range(0, self._logical_size, CHUNK_SIZE):
+            end = min(begin + CHUNK_SIZE, self._logical_size)
+            fields = {name: self._decode(name, column[begin:end]) for name, column in self._columns.items()}
+            yield from self._build(fields)
+
+    def __eq__(self, other: object) -> bool:
+        """Check two RecordArrays have the same schema and rows."""
+        if not isinstance(other, RecordArray) or self._schema != other._schema or len(self) != len(other):
+            return False
+        return all(np.array_equal(self._columns[name][:len(self)], other._columns[name][:len(other)]) for name in self._schema)
+
+    def __str__(self) -> str:
+        """Return a string representation of the records."""
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the record array."""
+        fields = ', '.join(f"{name}: {self._columns[name].dtype}" for name in self._schema)
+        return f"RecordArray(size: {self._logical_size}, physical size: {self._physical_size}, fields: {fields})"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+import json
+import os
+import pickle
+import struct
+from typing import Any
+import numpy as np
+from numpy.typing import NDArray
+
+
+# File layout:
+#   8 byte magic | uint32 header length | JSON header | sections...
+# The JSON header records the structure type, the payload dtype ("object" for pickled payloads), its shape,
+# the item count and the byte length of every section. Section 0 is a pickled dict of structure metadata
+# (capacity, data type, ...). Section 1 is the payload: the raw NumPy buffer for primitive dtypes, or a
+# pickle protocol 5 stream whose out-of-band buffers follow as sections 2, 3, ...
+MAGIC = b'DSSAVE01'
+_LENGTH = struct.Struct('<I')
+
+
+def save(path: str | os.PathLike, structure_type: str, payload: NDArray | Any, count: int, metadata: dict[str, Any] | None = None) -> None:
+    """Write payload to path. Primitive NumPy arrays are stored as raw bytes; anything else is pickled with
+        protocol 5 so large buffers inside it are written out-of-band instead of being copied into the stream.
+    """
+    meta = pickle.dumps(metadata or {}, protocol=5)
+    if isinstance(payload, np.ndarray) and payload.dtype != object:
+        block = np.ascontiguousarray(payload)
+        dtype, shape = block.dtype.str, list(block.shape)
+        sections: list[bytes | memoryview] = [meta, memoryview(block.reshape(-1)).cast('B')]
+    else:
+        buffers: list[pickle.PickleBuffer] = []
+        stream = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+        dtype, shape = 'object', list(np.shape(payload)) if isinstance(payload, np.ndarray) else []
+        sections = [meta, stream, *(buffer.raw() for buffer in buffers)]
+
+    header = json.dumps({
+        'type': structure_type,
+        'dtype': dtype,
+        'shape': shape,
+        'count': count,
+        'sections': [section.nbytes if isinstance(section, memoryview) else len(section) for section in sections],
+    }).encode()
+    with open(path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(_LENGTH.pack(len(header)))
+        file.write(header)
+        for section in sections:
+            file.write(section)
+
+
+def _read_into(file, buffer: bytearray | memoryview, path: str | os.PathLike) -> None:
+    """Fill buffer from file, raising ValueError if the file ends first."""
+    if (file.readinto(buffer) or 0) != len(buffer):
+        raise ValueError(f"{path} is truncated.")
+
+
+def load(path: str | os.PathLike, structure_type: str) -> tuple[dict[str, Any], dict[str, Any], NDArray | Any]:
+    """Read a file written by save(). Returns (header, metadata, payload); raises ValueError if the file is not
+        a saved structure of structure_type. Primitive payloads are read straight into a new NumPy array.
+        Object payloads are unpickled, so only load files from sources you trust.
+    """
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a saved data structure.")
+        (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+        header = json.loads(file.read(length))
+        if header['type'] != structure_type:
+            raise ValueError(f"{path} holds {header['type']} data, not {structure_type}.")
+
+        meta_length, payload_length, *buffer_lengths = header['sections']
+        meta = bytearray(meta_length)
+        _read_into(file, meta, path)
+        metadata = pickle.loads(meta)
+        if header['dtype'] != 'object':
+            payload = np.empty(header['shape'], dtype=np.dtype(header['dtype']))
+            _read_into(file, memoryview(payload.reshape(-1)).cast('B'), path)
+        else:
+            stream = bytearray(payload_length)
+            _read_into(file, stream, path)
+            buffers = []
+            for buffer_length in buffer_lengths:
+                buffer = bytearray(buffer_length)
+                _read_into(file, buffer, path)
+                buffers.append(buffer)
+            payload = pickle.loads(stream, buffers=buffers)
+    return header, metadata, payload
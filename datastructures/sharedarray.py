@@ -0,0 +1,141 @@
+from __future__ import annotations
+import struct
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from typing import NoReturn
+import numpy as np
+from datastructures.array import Array, ArrayView, NATIVE_DTYPES
+from datastructures.iarray import T
+
+
+# Segment layout: a fixed 64 byte header (magic, dtype, item count) followed by the items.
+_MAGIC = b'DSSHM001'
+_HEADER = struct.Struct('<8s16sq')
+_HEADER_SIZE = 64
+_UNTRACKED_ATTACH = threading.Lock()
+
+
+def attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """Map an existing segment without registering it with this process's resource tracker. Only the owner's
+        registration may exist: the tracker unlinks registered segments when a process exits, and workers share
+        their parent's tracker, so a worker registering and unregistering would erase the owner's entry.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    # Before Python 3.13 SharedMemory always registers, so suppress that for the duration of the call.
+    with _UNTRACKED_ATTACH:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedArray(Array[T]):
+    """A fixed-length Array whose items live in a multiprocessing.shared_memory segment, so several processes
+        can map the same primitive-dtype buffer without copying it.
+
+        Ownership protocol:
+            * The process that calls Array.to_shared() owns the segment. It must call unlink() exactly once
+              (using the owner as a context manager does close() and unlink()).
+            * Workers call Array.attach_shared(name), or simply receive the SharedArray as a pickled argument:
+              it pickles as its segment name, not its items. They only ever close(), never unlink().
+            * Item writes are visible to every process. Operations that change the length raise BufferError,
+              because other processes could not see the new length.
+            * Views taken from the array (slices, to_numpy()) must be dropped before close().
+    """
+
+    @classmethod
+    def create(cls, source: Array[T]) -> SharedArray[T]:
+        """Copy source's items into a new shared memory segment owned by the calling process."""
+        if source._data_type not in NATIVE_DTYPES:
+            raise TypeError(f"SharedArray requires a primitive data type, got {source._data_type}")
+        items = source._live()
+        segment = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + max(1, items.nbytes))
+        segment.buf[:_HEADER.size] = _HEADER.pack(_MAGIC, items.dtype.str.encode(), len(items))
+        array = cls._wrap(segment, source._data_type, len(items), owner=True)
+        array._array[:] = items
+        return array
+
+    @classmethod
+    def attach(cls, name: str) -> SharedArray:
+        """Map an existing segment created by another SharedArray. The caller does not own it."""
+        segment = attach_untracked(name)
+        magic, dtype_str, count = _HEADER.unpack(bytes(segment.buf[:_HEADER.size]))
+        if magic != _MAGIC:
+            segment.close()
+            raise ValueError(f"Shared memory segment {name} does not hold a SharedArray.")
+        dtype = np.dtype(dtype_str.rstrip(b'\0').decode())
+        data_type = next(python_type for python_type, native in NATIVE_DTYPES.items() if native == dtype)
+        return cls._wrap(segment, data_type, count, owner=False)
+
+    @classmethod
+    def _wrap(cls, segment: shared_memory.SharedMemory, data_type: type, count: int, owner: bool) -> SharedArray:
+        """Build a SharedArray over count items of segment."""
+        array = cls.__new__(cls)
+        array._init_state(data_type, None)
+        array._segment = segment
+        array._owner = owner
+        array._array = np.ndarray((count,), dtype=array._dtype, buffer=segment.buf, offset=_HEADER_SIZE)
+        array._start = 0
+        array._logical_size = count
+        array._physical_size = count
+        return array
+
+    @property
+    def name(self) -> str:
+        """The segment name to pass to Array.attach_shared() in another process."""
+        return self._segment.name
+
+    @property
+    def owner(self) -> bool:
+        """True in the process responsible for unlinking the segment."""
+        return self._owner
+
+    def close(self) -> None:
+        """Unmap the segment from this process. The array cannot be used afterwards."""
+        self._array = None
+        self._segment.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment once every process has closed it. Only the owner may call this."""
+        if not self._owner:
+            raise PermissionError("Only the process that created a SharedArray may unlink it.")
+        self._segment.unlink()
+
+    def __enter__(self) -> SharedArray[T]:
+        """Use the array as a context manager: close on exit, and unlink too in the owning process."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the array, unlinking the segment if this process owns it."""
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple:
+        """Pickle as the segment name so workers attach instead of receiving a copy."""
+        return SharedArray.attach, (self.name,)
+
+    def snapshot(self) -> ArrayView[T]:
+        """Return a read-only copy of the items. Unlike Array.snapshot() this is O(n):
+            other processes write to the segment directly, so copy on write cannot protect it.
+        """
+        frozen = np.array(self._live())
+        frozen.flags.writeable = False
+        return ArrayView(frozen, self._data_type)
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the array."""
+        return f"SharedArray(name: {self._segment.name}, size: {self._logical_size}, owner: {self._owner}, data type: {self._data_type})"
+
+    def _fixed_length(self, *args: object, **kwargs: object) -> NoReturn:
+        """Shared arrays cannot change length: other processes would not see it."""
+        raise BufferError("SharedArray has a fixed length; copy it into an Array to append or remove items.")
+
+    append = append_front = insert = extend = _fixed_length
+    pop = pop_front = __delitem__ = clear = _fixed_length
+    delete_many = delete_where = retain = reserve = shrink_to_fit = _fixed_length
@@ -0,0 +1,138 @@
+from __future__ import annotations
+import heapq
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Generic
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array import Array, ArrayView
+from datastructures.iarray import T
+
+
+class SortedArray(Sequence[T], Generic[T]):
+    """An Array kept in ascending order. Lookups are binary searches (O(log n)), add() is a binary search plus
+        one shift of the shorter side, range() returns a zero-copy ArrayView and merge_in() merges a sorted
+        batch in a single linear pass. Order-breaking operations (append, __setitem__) are deliberately absent.
+    """
+
+    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object) -> None:
+        """Initialize the sorted array, sorting starting_sequence once."""
+        if not isinstance(starting_sequence, Sequence):
+            raise ValueError("Starting sequence must be a valid sequence type.")
+        self._data_type = data_type
+        self._items: Array[T] = Array(data_type=data_type)
+        self._items.extend(starting_sequence)
+        if self._items.is_native:
+            self._items.to_numpy().sort(kind='stable')
+        else:
+            self._items = Array.from_iterable(sorted(self._items), data_type)
+
+    def add(self, item: T) -> None:
+        """Insert item after any equal items, keeping the array sorted."""
+        self._items.insert(self.bisect_right(item), item)
+
+    def remove(self, item: T) -> None:
+        """Remove one occurrence of item. Raises ValueError if it is not present."""
+        del self._items[self.index(item)]
+
+    def pop(self) -> T:
+        """Remove and return the largest item."""
+        if len(self._items) == 0:
+            raise IndexError("Pop from empty array.")
+        item = self._items[-1]
+        self._items.pop()
+        return item
+
+    def bisect_left(self, item: T) -> int:
+        """Index of the first item >= item."""
+        return self._items.searchsorted(item, side='left')
+
+    def bisect_right(self, item: T) -> int:
+        """Index of the first item > item."""
+        return self._items.searchsorted(item, side='right')
+
+    def range(self, low: T, high: T) -> ArrayView[T]:
+        """Zero-copy view of the items with low <= item < high."""
+        return self._items[self.bisect_left(low):self.bisect_left(high)]
+
+    def merge_in(self, sorted_iterable: Iterable[T]) -> None:
+        """Merge an already sorted batch in O(n + m). Raises ValueError if the batch is not sorted."""
+        batch = Array(data_type=self._data_type)
+        batch.extend(sorted_iterable)
+        if len(batch) == 0:
+            return
+        incoming = batch.to_numpy()
+        if self._items.is_native:
+            if np.any(incoming[1:] < incoming[:-1]):
+                raise ValueError("merge_in() requires a sorted iterable.")
+            self._items = Array.from_iterable(self._merge_blocks(self._items.to_numpy(), incoming), self._data_type)
+        else:
+            if any(later < earlier for earlier, later in zip(incoming, incoming[1:])):
+                raise ValueError("merge_in() requires a sorted iterable.")
+            self._items = Array.from_iterable(heapq.merge(self._items, incoming), self._data_type, len(self._items) + len(incoming))
+
+    @staticmethod
+    def _merge_blocks(existing: NDArray, incoming: NDArray) -> NDArray:
+        """Stable linear merge of two sorted NumPy blocks: incoming items land after equal existing items."""
+        merged = np.empty(len(existing) + len(incoming), dtype=existing.dtype)
+        slots = np.searchsorted(existing, incoming, side='right') + np.arange(len(incoming))
+        taken = np.zeros(len(merged), dtype=bool)
+        taken[slots] = True
+        merged[slots] = incoming
+        merged[~taken] = existing
+        return merged
+
+    def index(self, item: T, start: int = 0, stop: int | None = None) -> int:
+        """Return the first index of item. Raises ValueError if it is not present."""
+        position = self.bisect_left(item)
+        start, stop, _ = slice(start, stop).indices(len(self._items))
+        position = max(position, start)
+        if position < stop and self._items[position] == item:
+            return position
+        raise ValueError(f"{item!r} is not in array")
+
+    def count(self, item: T) -> int:
+        """Return the number of occurrences of item."""
+        return self.bisect_right(item) - self.bisect_left(item)
+
+    def __contains__(self, item: object) -> bool:
+        """Binary search membership test."""
+        position = self.bisect_left(item)
+        return position < len(self._items) and self._items[position] == item
+
+    def __getitem__(self, index: int | slice) -> T | ArrayView[T]:
+        """Retrieve an item or a zero-copy slice."""
+        return self._items[index]
+
+    def __delitem__(self, index: int) -> None:
+        """Delete the item at index (removal never breaks the order)."""
+        del self._items[index]
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate in ascending order."""
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[T]:
+        """Iterate in descending order."""
+        return reversed(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality of two sorted arrays."""
+        if not isinstance(other, SortedArray):
+            return False
+        return self._items == other._items
+
+    def to_numpy(self, copy: bool = False) -> NDArray:
+        """Return the items as a NumPy array (a view unless copy is True)."""
+        return self._items.to_numpy(copy)
+
+    def __str__(self) -> str:
+        """Return a string representation of the sorted array."""
+        return str(self._items)
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the sorted array."""
+        return f"SortedArray(size: {len(self._items)}, data type: {self._data_type})"
@@ -0,0 +1,232 @@
+from __future__ import annotations
+from collections.abc import Iterator, Sequence
+from typing import TypeVar
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array2d import Array2D
+from datastructures.array import NATIVE_DTYPES, python_type, storage_dtype
+from datastructures.iarray2d import IArray2D
+
+T = TypeVar("T")
+
+class SparseArray2D(IArray2D[T]):
+    """A rows x columns grid that stores only the cells differing from a default value, as a dictionary of keys:
+        row -> {column -> value}, plus column -> {rows} so columns can be walked without touching empty cells.
+        Reading or writing a cell is O(1) and memory grows with the number of non-empty cells, not rows * cols.
+        Writing the default value into a cell empties it.
+    """
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: SparseArray2D[T], num_columns: int) -> None:
+            self.row_index = row_index
+            self.array = array
+            self.num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            return self.array[self.row_index, column_index]
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            self.array[self.row_index, column_index] = value
+
+        def __iter__(self) -> Iterator[T]:
+            cells = self.array._rows.get(self.row_index, {})
+            default = self.array._default
+            return (cells.get(column_index, default) for column_index in range(self.num_columns))
+
+        def __reversed__(self) -> Iterator[T]:
+            cells = self.array._rows.get(self.row_index, {})
+            default = self.array._default
+            return (cells.get(column_index, default) for column_index in reversed(range(self.num_columns)))
+
+        def __len__(self) -> int:
+            return self.num_columns
+
+        def items(self) -> Iterator[tuple[int, T]]:
+            """Returns (column, value) for the non-empty cells of the row, by column."""
+            return self.array.iter_row(self.row_index)
+
+        def __str__(self) -> str:
+            return f"[{', '.join(map(str, self))}]"
+
+        def __repr__(self) -> str:
+            return f"Row {self.row_index}: {self}"
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]] = [[]], data_type=object, default: T | None = None) -> None:
+        """Initializes the sparse grid from a dense sequence of rows, keeping only the non-default cells.
+            The default value is data_type() unless given (None for object grids).
+        """
+        if not isinstance(starting_sequence, Sequence) or any(not isinstance(row, Sequence) for row in starting_sequence):
+            raise ValueError("Starting sequence must be a sequence of sequences.")
+        row_lengths = {len(row) for row in starting_sequence}
+        if len(row_lengths) > 1:
+            raise ValueError("All rows must have the same length.")
+
+        self._setup(len(starting_sequence), row_lengths.pop() if starting_sequence else 0, data_type, default)
+        for row_index, row in enumerate(starting_sequence):
+            for column_index, value in enumerate(row):
+                self[row_index, column_index] = value
+
+    def _setup(self, rows: int, cols: int, data_type: type, default: T | None) -> None:
+        """Sets the shape, data type and default value of an empty grid."""
+        if rows < 0 or cols < 0:
+            raise ValueError("Dimensions must be non-negative.")
+        if default is None and data_type is not object:
+            default = data_type()
+        if data_type is not object and not isinstance(default, data_type):
+            raise ValueError(f"Default value must be of type {data_type}, but got {type(default)}")
+        self.data_type = data_type
+        self._default = default
+        self._shape = (rows, cols)
+        self._rows: dict[int, dict[int, T]] = {}
+        self._columns: dict[int, set[int]] = {}
+
+    @staticmethod
+    def empty(rows: int = 0, cols: int = 0, data_type: type = object, default: T | None = None) -> SparseArray2D:
+        """Creates an all-default grid of given dimensions in O(1), whatever its size."""
+        array = SparseArray2D.__new__(SparseArray2D)
+        array._setup(rows, cols, data_type, default)
+        return array
+
+    @staticmethod
+    def from_dense(dense: Array2D | NDArray | Sequence[Sequence[T]], data_type: type | None = None, default: T | None = None) -> SparseArray2D:
+        """Builds a sparse grid from an Array2D, a 2D NumPy array or a sequence of rows. Primitive grids find
+            their non-default cells with one vectorized comparison. Without a data_type, an array's is inferred
+            from its dtype and a sequence's from its items: their primitive type if they all share one, else object.
+        """
+        if isinstance(dense, Array2D):
+            data_type = data_type or dense.data_type
+            dense = dense.to_numpy()
+        if not isinstance(dense, np.ndarray):
+            if data_type is None:
+                item_types = {type(value) for row in dense for value in row}
+                data_type = item_types.pop() if len(item_types) == 1 and item_types <= NATIVE_DTYPES.keys() else object
+            return SparseArray2D(dense, data_type, default)
+        if dense.ndim != 2:
+            raise ValueError("Dense grid must be two-dimensional.")
+
+        array = SparseArray2D.empty(*dense.shape, data_type=data_type or python_type(dense.dtype), default=default)
+        if dense.dtype == object:
+            rows, cols = np.nonzero(np.frompyfunc(lambda value: value != array._default, 1, 1)(dense).astype(bool))
+        else:
+            rows, cols = np.nonzero(dense != array._default)
+        for row_index, column_index, value in zip(rows.tolist(), cols.tolist(), dense[rows, cols].tolist()):
+            array[row_index, column_index] = value
+        return array
+
+    def to_dense(self) -> Array2D[T]:
+        """Returns the grid as a dense Array2D. This materializes rows * cols cells, so only use it on grids
+            (or crops of them) that fit in memory.
+        """
+        data = np.empty(self._shape, dtype=storage_dtype(self.data_type))
+        dense = Array2D._wrap(data, self.data_type)
+        dense.fill(self._default)
+        if self._rows:
+            rows, cols, values = zip(*self.items())
+            data[rows, cols] = np.fromiter(values, dtype=data.dtype, count=len(values))
+        return dense
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The (rows, columns) of the grid."""
+        return self._shape
+
+    @property
+    def default(self) -> T:
+        """The value of every cell that has not been set."""
+        return self._default
+
+    @property
+    def nnz(self) -> int:
+        """The number of non-empty (non-default) cells."""
+        return sum(len(cells) for cells in self._rows.values())
+
+    def _check(self, row_index: int, column_index: int) -> None:
+        """Raises IndexError unless (row_index, column_index) is inside the grid."""
+        if not (0 <= row_index < self._shape[0] and 0 <= column_index < self._shape[1]):
+            raise IndexError("Index out of bounds")
+
+    def __getitem__(self, index: int | tuple[int, int]) -> Row[T] | T:
+        """Returns a row at the specified index, or with a[r, c] the cell value in O(1)."""
+        if isinstance(index, tuple):
+            row_index, column_index = index
+            self._check(row_index, column_index)
+            cells = self._rows.get(row_index)
+            return self._default if cells is None else cells.get(column_index, self._default)
+        if index < 0 or index >= self._shape[0]:
+            raise IndexError("Row index out of bounds")
+        return SparseArray2D.Row(index, self, self._shape[1])
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        """Sets the cell at a[r, c] in O(1); setting the default value empties the cell."""
+        if not isinstance(index, tuple):
+            raise TypeError("Assign to a[r, c], or to a[r][c] through a row.")
+        row_index, column_index = index
+        self._check(row_index, column_index)
+        if not isinstance(value, self.data_type):
+            raise ValueError(f"Expected type {self.data_type}, but got {type(value)}")
+        if value == self._default:
+            self._discard(row_index, column_index)
+            return
+        self._rows.setdefault(row_index, {})[column_index] = value
+        self._columns.setdefault(column_index, set()).add(row_index)
+
+    def _discard(self, row_index: int, column_index: int) -> None:
+        """Empties a cell, dropping index entries that become empty."""
+        cells = self._rows.get(row_index)
+        if cells is None or column_index not in cells:
+            return
+        del cells[column_index]
+        if not cells:
+            del self._rows[row_index]
+        rows = self._columns[column_index]
+        rows.discard(row_index)
+        if not rows:
+            del self._columns[column_index]
+
+    def iter_row(self, row_index: int) -> Iterator[tuple[int, T]]:
+        """Returns (column, value) for the non-empty cells of one row, by column."""
+        if row_index < 0 or row_index >= self._shape[0]:
+            raise IndexError("Row index out of bounds")
+        cells = self._rows.get(row_index, {})
+        return ((column_index, cells[column_index]) for column_index in sorted(cells))
+
+    def iter_col(self, column_index: int) -> Iterator[tuple[int, T]]:
+        """Returns (row, value) for the non-empty cells of one column, by row."""
+        if column_index < 0 or column_index >= self._shape[1]:
+            raise IndexError("Column index out of bounds")
+        rows = self._columns.get(column_index, ())
+        return ((row_index, self._rows[row_index][column_index]) for row_index in sorted(rows))
+
+    def items(self) -> Iterator[tuple[int, int, T]]:
+        """Returns (row, column, value) for every non-empty cell, row by row."""
+        for row_index in sorted(self._rows):
+            cells = self._rows[row_index]
+            for column_index in sorted(cells):
+                yield row_index, column_index, cells[column_index]
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        """Returns an iterator over the rows (each yields every cell, defaults included)."""
+        return (SparseArray2D.Row(row_index, self, self._shape[1]) for row_index in range(self._shape[0]))
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        """Returns a reversed iterator over the rows."""
+        return (SparseArray2D.Row(row_index, self, self._shape[1]) for row_index in reversed(range(self._shape[0])))
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the grid."""
+        return self._shape[0]
+
+    def __eq__(self, other: object) -> bool:
+        """Checks two sparse grids have the same shape, default and non-empty cells."""
+        if not isinstance(other, SparseArray2D):
+            return False
+        return self._shape == other._shape and self._default == other._default and self._rows == other._rows
+
+    def __str__(self) -> str:
+        """Returns the non-empty cells as {(row, column): value, ...}."""
+        return f"{{{', '.join(f'({r}, {c}): {value}' for r, c, value in self.items())}}}"
+
+    def __repr__(self) -> str:
+        """Returns a detailed string representation of the sparse grid."""
+        rows, cols = self._shape
+        return f"SparseArray2D {rows} Rows x {cols} Columns, default: {self._default!r}, non-empty: {self.nnz}, items: {str(self)}"
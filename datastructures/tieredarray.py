@@ -0,0 +1,238 @@
+from __future__ import annotations
+import math
+from collections.abc import Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array import Array, ArrayView, NATIVE_DTYPES
+from datastructures.iarray import IArray, T
+
+
+# Smallest block size used; blocks grow with the square root of the size so insert and delete stay O(sqrt(n)).
+MIN_BLOCK_SIZE = 16
+
+
+class TieredArray(IArray[T]):
+    """A tiered vector: an IArray stored as fixed-size NumPy blocks, each a circular buffer, where every block
+        but the last is full. Random access is O(1) (block = i // b, slot = (head + i % b) % b). insert(i, x)
+        and del a[i] shift items inside one block and then move a single item across each later block by
+        adjusting that block's head, which is one vectorized gather/scatter, so both cost O(sqrt(n)) instead of
+        O(n). The block size b tracks sqrt(n) and the array re-tiers when n drifts too far from b * b.
+    """
+
+    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object) -> None:
+        """Initialize the tiered array from a sequence."""
+        if not isinstance(starting_sequence, Sequence):
+            raise ValueError("Starting sequence must be a valid sequence type.")
+        self._data_type = data_type
+        self._dtype = NATIVE_DTYPES.get(data_type, np.dtype(object))
+        items = Array(data_type=data_type)
+        items.extend(starting_sequence)
+        self._load(items.to_numpy())
+
+    def _load(self, items: NDArray) -> None:
+        """Rebuild the blocks from items in logical order, choosing a block size of about sqrt(len(items))."""
+        count = len(items)
+        self._block_size = max(MIN_BLOCK_SIZE, 1 << math.ceil(math.log2(max(1, math.isqrt(count)))))
+        block_count = max(2, -(-count // self._block_size) * 2)
+        self._blocks: NDArray = np.empty((block_count, self._block_size), dtype=self._dtype)
+        self._heads: NDArray = np.zeros(block_count, dtype=np.intp)
+        self._blocks.reshape(-1)[:count] = items
+        self._logical_size = count
+
+    def _validate(self, item: T) -> None:
+        """Raise TypeError if item is not an instance of the array's data type."""
+        if not isinstance(item, self._data_type):
+            raise TypeError(f"Expected type {self._data_type}, but got {type(item)}")
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Block and physical slot holding logical index."""
+        block, offset = divmod(index, self._block_size)
+        return block, (self._heads[block] + offset) % self._block_size
+
+    def _ordered_block(self, block: int) -> NDArray:
+        """The items of one block in logical order (a copy)."""
+        return np.roll(self._blocks[block], -self._heads[block])
+
+    def _normalize(self, index: int) -> int:
+        """Resolve a negative index and check bounds."""
+        if index < 0:
+            index += self._logical_size
+        if index < 0 or index >= self._logical_size:
+            raise IndexError("TieredArray index out of bounds.")
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return self._logical_size
+
+    def __getitem__(self, index: int | slice) -> T | Array[T]:
+        """Retrieve an item in O(1), or a new Array holding a slice."""
+        if isinstance(index, (int, np.integer)):
+            item = self._blocks[self._locate(self._normalize(int(index)))]
+            return item.item() if isinstance(item, np.generic) else item
+        if isinstance(index, slice):
+            array = Array(data_type=self._data_type)
+            array.extend(self.to_numpy()[index])
+            return array
+        raise TypeError("Index must be an integer or a slice.")
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """Modify an item in O(1)."""
+        self._validate(item)
+        self._blocks[self._locate(self._normalize(index))] = item
+
+    def append(self, data: T) -> None:
+        """Append an item to the end in amortized O(1)."""
+        self._validate(data)
+        self._reserve_one()
+        block, offset = divmod(self._logical_size, self._block_size)
+        if offset == 0:
+            self._heads[block] = 0
+        self._blocks[block, (self._heads[block] + offset) % self._block_size] = data
+        self._logical_size += 1
+
+    def append_front(self, data: T) -> None:
+        """Insert an item at the front in O(sqrt(n))."""
+        self.insert(0, data)
+
+    def insert(self, index: int, data: T) -> None:
+        """Insert an item before index (list.insert semantics) in O(sqrt(n))."""
+        self._validate(data)
+        if index < 0:
+            index = max(0, index + self._logical_size)
+        if index >= self._logical_size:
+            self.append(data)
+            return
+
+        self._reserve_one()
+        size = self._block_size
+        first, offset = divmod(index, size)
+        last = self._logical_size // size
+        if self._logical_size % size == 0:
+            self._heads[last] = 0
+
+        if last > first:
+            # Every block after `first` takes the tail item of the block before it at its front.
+            receivers = np.arange(first + 1, last + 1)
+            donors = receivers - 1
+            carried = self._blocks[donors, (self._heads[donors] + size - 1) % size]
+            self._heads[receivers] = (self._heads[receivers] - 1) % size
+            self._blocks[receivers, self._heads[receivers]] = carried
+
+        count = min(size, self._logical_size - first * size)
+        ordered = self._ordered_block(first)
+        stop = min(count + 1, size)
+        ordered[offset + 1:stop] = ordered[offset:stop - 1]
+        ordered[offset] = data
+        self._blocks[first] = ordered
+        self._heads[first] = 0
+        self._logical_size += 1
+
+    def __delitem__(self, index: int) -> None:
+        """Delete the item at index in O(sqrt(n))."""
+        index = self._normalize(index)
+        size = self._block_size
+        first, offset = divmod(index, size)
+        last = (self._logical_size - 1) // size
+
+        count = min(size, self._logical_size - first * size)
+        ordered = self._ordered_block(first)
+        ordered[offset:count - 1] = ordered[offset + 1:count]
+
+        if last > first:
+            # Every block after `first` hands its front item to the block before it.
+            donors = np.arange(first + 1, last + 1)
+            old_heads = self._heads[donors].copy()
+            carried = self._blocks[donors, old_heads]
+            self._heads[donors] = (old_heads + 1) % size
+            self._blocks[donors[:-1], old_heads[:-1]] = carried[1:]
+            ordered[size - 1] = carried[0]
+            if self._dtype == object:
+                self._blocks[last, old_heads[-1]] = None
+        elif self._dtype == object:
+            ordered[count - 1] = None
+
+        self._blocks[first] = ordered
+        self._heads[first] = 0
+        self._logical_size -= 1
+        self._maybe_shrink()
+
+    def pop(self) -> None:
+        """Remove the last item in O(1)."""
+        if self._logical_size == 0:
+            raise IndexError("Pop from empty array.")
+        if self._dtype == object:
+            self._blocks[self._locate(self._logical_size - 1)] = None
+        self._logical_size -= 1
+        self._maybe_shrink()
+
+    def pop_front(self) -> None:
+        """Remove the first item in O(sqrt(n))."""
+        if self._logical_size == 0:
+            raise IndexError("Pop from empty array.")
+        del self[0]
+
+    def _reserve_one(self) -> None:
+        """Make room for one more item: add blocks, or re-tier with bigger blocks once n outgrows b * b."""
+        if self._logical_size >= 4 * self._block_size * self._block_size:
+            self._load(self.to_numpy())
+        if self._logical_size == len(self._blocks) * self._block_size:
+            grown = np.empty((len(self._blocks) * 2, self._block_size), dtype=self._dtype)
+            grown[:len(self._blocks)] = self._blocks
+            heads = np.zeros(len(grown), dtype=np.intp)
+            heads[:len(self._heads)] = self._heads
+            self._blocks, self._heads = grown, heads
+
+    def _maybe_shrink(self) -> None:
+        """Re-tier with smaller blocks, or drop spare blocks, when the array has mostly emptied."""
+        size = self._block_size
+        if size > MIN_BLOCK_SIZE and self._logical_size * 16 < size * size:
+            self._load(self.to_numpy())
+        elif len(self._blocks) > 2 and self._logical_size <= len(self._blocks) * size // 4:
+            keep = len(self._blocks) // 2
+            self._blocks = self._blocks[:keep].copy()
+            self._heads = self._heads[:keep].copy()
+
+    def to_numpy(self) -> NDArray:
+        """Return a new NumPy array with the items in logical order."""
+        used = -(-self._logical_size // self._block_size)
+        slots = (self._heads[:used, None] + np.arange(self._block_size)) % self._block_size
+        return self._blocks[np.arange(used)[:, None], slots].reshape(-1)[:self._logical_size]
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality with another TieredArray, an Array or a view."""
+        if isinstance(other, TieredArray):
+            return np.array_equal(self.to_numpy(), other.to_numpy())
+        if isinstance(other, Array):
+            return np.array_equal(self.to_numpy(), other._live())
+        if isinstance(other, ArrayView):
+            return np.array_equal(self.to_numpy(), other._view)
+        return NotImplemented
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate block by block, yielding native Python values."""
+        remaining = self._logical_size
+        for block in range(-(-self._logical_size // self._block_size)):
+            ordered = self._ordered_block(block)[:min(remaining, self._block_size)]
+            remaining -= len(ordered)
+            yield from ordered.tolist()
+
+    def __reversed__(self) -> Iterator[T]:
+        """Iterate from the last item to the first."""
+        return reversed(self.to_numpy().tolist())
+
+    def __contains__(self, item: object) -> bool:
+        """Check if an item exists in the array."""
+        return any(element is item or element == item for element in self)
+
+    def clear(self) -> None:
+        """Clear the array."""
+        self._load(np.empty(0, dtype=self._dtype))
+
+    def __str__(self) -> str:
+        """Return a string representation of the array."""
+        return str(self.to_numpy().tolist())
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the array."""
+        return f"TieredArray(logical size: {self._logical_size}, block size: {self._block_size}, blocks: {len(self._blocks)}, data type: {self._data_type})"
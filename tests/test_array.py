@@ -1,5 +1,7 @@
+import operator
+import numpy as np
 import pytest
-from datastructures.array import Array
+from datastructures.array import Array, GrowthPolicy
 
 class TestArray:
     
@@ -63,3 +65,523 @@ class TestArray:
         """Test clearing the array."""
         filled_array.clear()
         assert len(filled_array) == 0
+
+    def test_primitive_types_use_native_storage(self):
+        """Test that int, float and bool arrays are backed by native NumPy buffers."""
+        assert Array([1, 2, 3], data_type=int)._array.dtype == np.int64
+        assert Array([1.5, 2.5], data_type=float)._array.dtype == np.float64
+        assert Array([True, False], data_type=bool)._array.dtype == np.bool_
+        assert not Array(['a', 'b'], data_type=str).is_native
+
+    def test_str_elements_are_not_truncated(self):
+        """Test that strings keep their full value (object storage, not a fixed-width unicode dtype)."""
+        array = Array(['zero', 'one', 'two'], data_type=str)
+        assert array[2] == 'two'
+        array.append('three')
+        assert array[3] == 'three'
+
+    def test_batch_type_check_rejects_mixed_types(self):
+        """Test that construction raises TypeError when any element has the wrong type."""
+        with pytest.raises(TypeError):
+            Array([1, 2, 3.0], data_type=int)
+
+    def test_ints_outside_int64_raise_value_error(self):
+        """Test that int values an int64 buffer cannot hold raise ValueError, and object storage keeps them."""
+        with pytest.raises(ValueError):
+            Array([2**70], data_type=int)
+        array = Array([1], data_type=int)
+        with pytest.raises(ValueError):
+            array.append(2**70)
+        with pytest.raises(ValueError):
+            array.extend([-2**64])
+        with pytest.raises(ValueError):
+            array[0] = 2**63
+        with pytest.raises(ValueError):
+            array[:][0] = 2**63
+        assert list(array) == [1]
+        assert Array([2**70], data_type=object)[0] == 2**70
+
+    def test_append_wrong_type_raises_error(self):
+        """Test that append refuses values a native buffer would silently coerce."""
+        array = Array([1, 2], data_type=int)
+        with pytest.raises(TypeError):
+            array.append(2.7)
+
+    def test_extend_from_list_and_generator(self):
+        """Test extending with a list and a generator keeps order and grows capacity."""
+        array = Array([1, 2], data_type=int)
+        array.extend([3, 4, 5])
+        array.extend(x for x in range(6, 9))
+        assert list(array) == [1, 2, 3, 4, 5, 6, 7, 8]
+
+    def test_extend_with_itself(self):
+        """Test extending an array with itself or a view of it, even when that recentres the buffer."""
+        array = Array([0, 1, 2, 3], data_type=int)
+        array.pop_front()
+        array.pop_front()
+        array.extend(array)
+        assert list(array) == [2, 3, 2, 3]
+        array.extend(array[1:3])
+        assert list(array) == [2, 3, 2, 3, 3, 2]
+
+    def test_extend_from_numpy_array(self):
+        """Test extending with a NumPy block copies it in and validates its dtype once."""
+        array = Array(data_type=float)
+        array.extend(np.linspace(0.0, 1.0, 5))
+        assert len(array) == 5
+        assert array[4] == 1.0
+        with pytest.raises(TypeError):
+            array.extend(np.array(['a', 'b']))
+
+    def test_extend_wrong_type_raises_error(self):
+        """Test that a single bad element rejects the whole batch without changing the array."""
+        array = Array([1], data_type=int)
+        with pytest.raises(TypeError):
+            array.extend([2, 'three'])
+        assert len(array) == 1
+
+    def test_from_iterable_with_size_hint(self):
+        """Test from_iterable builds the array with a single allocation when given a size hint."""
+        array = Array.from_iterable(range(100), data_type=int, size_hint=100)
+        assert len(array) == 100
+        assert array._physical_size == 100
+        assert array[99] == 99
+
+    def test_slice_returns_view_without_copy(self, filled_array: Array[int]):
+        """Test that a slice shares the array's buffer and sees later writes."""
+        view = filled_array[1:3]
+        assert list(view) == [2, 3]
+        filled_array[1] = 20
+        assert view[0] == 20
+        view[1] = 30
+        assert filled_array[2] == 30
+
+    def test_nested_slice_and_negative_index(self):
+        """Test slicing a view and indexing it from the end."""
+        array = Array(list(range(10)), data_type=int)
+        view = array[2:9][::2]
+        assert list(view) == [2, 4, 6, 8]
+        assert view[-1] == 8
+        with pytest.raises(IndexError):
+            view[4]
+
+    def test_view_copy_is_independent(self):
+        """Test that copy() produces an Array that no longer shares storage."""
+        array = Array(['a', 'b', 'c'], data_type=str)
+        copied = array[:2].copy()
+        array[0] = 'z'
+        assert isinstance(copied, Array)
+        assert list(copied) == ['a', 'b']
+
+    def test_view_numpy_interop(self):
+        """Test NumPy reads a view as one block, and views accept NumPy integer indices."""
+        array = Array(list(range(10)), data_type=int)
+        view = array[2:8]
+        assert np.sum(view) == 27
+        assert view.to_numpy().tolist() == [2, 3, 4, 5, 6, 7]
+        assert np.asarray(view, dtype=float).dtype == np.float64
+        assert view[np.int64(1)] == 3
+        view[np.int32(0)] = 20
+        assert array[2] == 20
+        frozen = array.snapshot()
+        with pytest.raises(ValueError):
+            frozen.to_numpy()[0] = 1
+
+    def test_view_equality_is_symmetric(self, filled_array: Array[int]):
+        """Test that an Array and a view of the same items compare equal from either side."""
+        assert filled_array[:] == filled_array
+        assert filled_array == filled_array[:]
+        assert filled_array != filled_array[1:]
+        assert filled_array != [1, 2, 3, 4]
+
+    def test_append_front_keeps_order(self, empty_array: Array[int]):
+        """Test that repeated append_front builds the array in reverse order."""
+        for i in range(10):
+            empty_array.append_front(i)
+        assert list(empty_array) == [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+
+    def test_front_operations_do_not_shift_buffer(self):
+        """Test that pop_front and append_front only move the start offset when there is slack."""
+        array = Array(list(range(8)), data_type=int)
+        buffer = array._array
+        array.pop_front()
+        array.pop_front()
+        array.append_front(100)
+        assert array._array is buffer
+        assert list(array) == [100, 2, 3, 4, 5, 6, 7]
+
+    def test_mixed_front_back_operations(self):
+        """Test indexing and assignment stay correct while the start offset moves around."""
+        array = Array(data_type=int)
+        for i in range(50):
+            array.append(i)
+            array.append_front(-i)
+        for _ in range(20):
+            array.pop_front()
+            array.pop()
+        assert len(array) == 60
+        assert array[0] == -29 and array[-1] == 29
+        array[0] = 7
+        del array[1]
+        assert array[0] == 7 and array[1] == -27
+
+    def test_pop_to_empty_then_append(self):
+        """Test that shrinking never leaves the array without room to grow again."""
+        array = Array([1], data_type=int)
+        array.pop()
+        array.append(2)
+        array.pop()
+        array.append(3)
+        assert list(array) == [3]
+
+    def test_numpy_interop_shares_buffer(self):
+        """Test that np.asarray and to_numpy() see the live items without copying."""
+        array = Array([3, 1, 2], data_type=int)
+        assert np.sum(array) == 6
+        view = np.asarray(array)
+        view[0] = 30
+        assert array[0] == 30
+        copied = array.to_numpy(copy=True)
+        copied[1] = 10
+        assert array[1] == 1
+
+    def test_to_numpy_after_front_operations(self):
+        """Test that the exported region follows the start offset."""
+        array = Array([1, 2, 3], data_type=int)
+        array.pop_front()
+        array.append_front(9)
+        assert array.to_numpy().tolist() == [9, 2, 3]
+
+    def test_memoryview_export(self):
+        """Test the memoryview covers exactly the live items and is refused for object arrays."""
+        array = Array([1.0, 2.0, 4.0], data_type=float)
+        view = array.to_memoryview()
+        assert view.format == 'd'
+        assert view.tolist() == [1.0, 2.0, 4.0]
+        with pytest.raises(TypeError):
+            Array(['a'], data_type=str).to_memoryview()
+
+    def test_index_and_count(self):
+        """Test index honours start/stop and count finds every occurrence."""
+        array = Array([4, 7, 4, 9, 4], data_type=int)
+        assert array.index(4) == 0
+        assert array.index(4, 1) == 2
+        assert array.index(4, -2) == 4
+        assert array.count(4) == 3
+        assert array.count(8) == 0
+        with pytest.raises(ValueError):
+            array.index(9, 0, 3)
+
+    def test_find_all_with_value_and_predicate(self):
+        """Test find_all accepts a value or a predicate and returns matching indices."""
+        array = Array([1.0, 5.0, 2.5, 7.0], data_type=float)
+        assert list(array.find_all(5.0)) == [1]
+        assert list(array.find_all(lambda x: x > 2)) == [1, 2, 3]
+        words = Array(['apple', 'kiwi', 'avocado'], data_type=str)
+        assert list(words.find_all(lambda word: word.startswith('a'))) == [0, 2]
+
+    def test_contains_object_items_are_compared_whole(self):
+        """Test membership of tuple items is not broadcast element-wise by NumPy."""
+        array = Array([(1, 2), (3, 4)])
+        assert (3, 4) in array
+        assert (1, 4) not in array
+        assert 'x' not in Array([1, 2], data_type=int)
+
+    def test_searchsorted(self):
+        """Test searchsorted returns bisect-style insertion points on sorted data."""
+        array = Array([1, 3, 3, 5], data_type=int)
+        assert array.searchsorted(3) == 1
+        assert array.searchsorted(3, side='right') == 3
+        assert Array(['a', 'c', 'e'], data_type=str).searchsorted('d') == 2
+
+    def test_reserve_presizes_and_blocks_shrinking(self, empty_array: Array[int]):
+        """Test reserve() allocates once and pops never shrink below the reservation."""
+        empty_array.reserve(64)
+        assert empty_array.capacity == 64
+        for i in range(64):
+            empty_array.append(i)
+        for _ in range(64):
+            empty_array.pop()
+        assert empty_array.capacity == 64
+        assert empty_array.resize_counters.grows == 1
+        assert empty_array.resize_counters.shrinks == 0
+
+    def test_shrink_to_fit(self):
+        """Test shrink_to_fit releases slack down to the logical size."""
+        array = Array(list(range(10)), data_type=int)
+        array.reserve(100)
+        array.shrink_to_fit()
+        assert array.capacity == 10
+        assert list(array) == list(range(10))
+
+    def test_push_pop_at_boundary_does_not_thrash(self):
+        """Test alternating append/pop around a resize boundary reallocates at most once."""
+        array = Array(list(range(8)), data_type=int)
+        for _ in range(4):
+            array.pop()
+        before = array.resize_counters.grows + array.resize_counters.shrinks
+        for i in range(100):
+            array.append(i)
+            array.pop()
+        assert array.resize_counters.grows + array.resize_counters.shrinks == before
+
+    def test_custom_growth_policy(self):
+        """Test a custom growth factor and that thrashing policies are rejected."""
+        array = Array(data_type=int, growth_policy=GrowthPolicy(growth_factor=1.5, min_capacity=4))
+        for i in range(5):
+            array.append(i)
+        assert array.capacity == 6
+        with pytest.raises(ValueError):
+            GrowthPolicy(shrink_threshold=0.5, shrink_factor=0.5)
+
+    def test_delete_many(self):
+        """Test deleting scattered indices, including negative and repeated ones."""
+        array = Array(list(range(10)), data_type=int)
+        assert array.delete_many([0, 3, -1, 3]) == 3
+        assert list(array) == [1, 2, 4, 5, 6, 7, 8]
+        with pytest.raises(IndexError):
+            array.delete_many([7])
+
+    def test_delete_where_mask_and_predicate(self):
+        """Test delete_where with a boolean mask and with a predicate on object storage."""
+        array = Array([1, 2, 3, 4], data_type=int)
+        assert array.delete_where([True, False, True, False]) == 2
+        assert list(array) == [2, 4]
+        words = Array(['keep', 'drop', 'keep'], data_type=str)
+        words.delete_where(lambda word: word == 'drop')
+        assert list(words) == ['keep', 'keep']
+        with pytest.raises(ValueError):
+            array.delete_where([True])
+
+    def test_retain_shrinks_once(self):
+        """Test retain compacts the buffer and reallocates at most once."""
+        array = Array(list(range(1000)), data_type=int)
+        shrinks = array.resize_counters.shrinks
+        assert array.retain(lambda x: x % 100 == 0) == 990
+        assert list(array) == list(range(0, 1000, 100))
+        assert array.resize_counters.shrinks == shrinks + 1
+        assert array.capacity < 100
+
+    def test_map_vectorized_and_fallback(self):
+        """Test map with a ufunc, a block-friendly lambda and a per-item callable."""
+        array = Array([1, 4, 9], data_type=int)
+        roots = array.map(np.sqrt)
+        assert list(roots) == [1.0, 2.0, 3.0]
+        assert roots._data_type is float
+        doubled = array.map(lambda x: x * 2 + 1, vectorized=True)
+        assert list(doubled) == [3, 9, 19] and doubled._data_type is int
+        assert list(array.map(lambda x: x * 2 + 1)) == [3, 9, 19]
+        labels = array.map(lambda x: f"#{x}", data_type=str)
+        assert list(labels) == ['#1', '#4', '#9']
+
+    def test_plain_callables_are_called_per_item(self):
+        """Test callables that are not ufuncs only see single items unless vectorized=True is passed."""
+        array = Array([1, 2, 3], data_type=int)
+        assert list(array.map(lambda x: x * 10 if isinstance(x, int) else x)) == [10, 20, 30]
+        seen = []
+        array.filter(lambda x: seen.append(x) or x > 1)
+        assert seen == [1, 2, 3]
+        assert list(array.find_all(lambda x: x > 1, vectorized=True)) == [1, 2]
+        with pytest.raises(ValueError):
+            array.map(lambda x: 0, vectorized=True)
+
+    def test_filter_and_reduce(self):
+        """Test filter keeps the data type and reduce works with ufuncs and Python callables."""
+        array = Array([1, 2, 3, 4, 5], data_type=int)
+        evens = array.filter(lambda x: x % 2 == 0)
+        assert list(evens) == [2, 4] and evens._data_type is int
+        assert array.reduce(np.add) == 15
+        assert array.reduce(lambda x, y: x * y) == 120
+        assert Array(['a', 'b', 'c'], data_type=str).reduce(lambda x, y: x + y) == 'abc'
+        with pytest.raises(TypeError):
+            Array(data_type=int).reduce(np.add)
+
+    def test_arithmetic_operators(self):
+        """Test element-wise arithmetic with scalars, sequences and other arrays."""
+        array = Array([2, 4, 6], data_type=int)
+        assert list(array + 1) == [3, 5, 7]
+        assert list(10 - array) == [8, 6, 4]
+        assert list(array * Array([1, 2, 3], data_type=int)) == [2, 8, 18]
+        halves = array / 2
+        assert list(halves) == [1.0, 2.0, 3.0] and halves._data_type is float
+        assert list(-array) == [-2, -4, -6]
+        with pytest.raises(ValueError):
+            array + [1, 2]
+
+    def test_insert(self):
+        """Test insert at the front, middle, end and with out-of-range indices."""
+        array = Array([1, 2, 4], data_type=int)
+        array.insert(2, 3)
+        array.insert(0, 0)
+        array.insert(100, 5)
+        array.insert(-100, -1)
+        assert list(array) == [-1, 0, 1, 2, 3, 4, 5]
+
+    def test_gather_with_index_array_and_mask(self):
+        """Test fancy indexing returns a new Array of the selected items."""
+        array = Array([10, 20, 30, 40, 50], data_type=int)
+        assert list(array[[4, 0, -2]]) == [50, 10, 40]
+        assert list(array[np.array([True, False, True, False, False])]) == [10, 30]
+        assert array[np.int64(1)] == 20
+        with pytest.raises(IndexError):
+            array[[0, 5]]
+        with pytest.raises(IndexError):
+            array[[True, False]]
+        with pytest.raises(TypeError):
+            array[[0.5]]
+
+    def test_scatter_with_scalar_and_sequence(self):
+        """Test fancy assignment writes one value or one value per selected slot."""
+        array = Array([0, 0, 0, 0], data_type=int)
+        array[[0, 2]] = 7
+        array[np.array([False, True, False, True])] = [1, 3]
+        assert list(array) == [7, 1, 7, 3]
+        with pytest.raises(ValueError):
+            array[[0, 1]] = [1, 2, 3]
+        with pytest.raises(TypeError):
+            array[[0]] = 'x'
+
+    def test_scatter_tuple_into_object_array(self):
+        """Test a tuple is stored as one value rather than unpacked across the selection."""
+        array = Array([(1, 2), (3, 4), (5, 6)])
+        array[[0, 2]] = (0, 0)
+        assert list(array) == [(0, 0), (3, 4), (0, 0)]
+
+    def test_iteration_yields_python_values(self):
+        """Test iteration and indexing agree on native Python types across chunk boundaries."""
+        array = Array.from_iterable(range(10_000), data_type=int)
+        items = list(array)
+        assert items == list(range(10_000))
+        assert type(items[5000]) is int and type(array[5000]) is int
+        assert list(reversed(array))[:3] == [9999, 9998, 9997]
+
+    def test_iter_chunks(self):
+        """Test iter_chunks yields NumPy views covering the array in order."""
+        array = Array(list(range(10)), data_type=int)
+        chunks = list(array.iter_chunks(4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert isinstance(chunks[0], np.ndarray)
+        assert np.concatenate(chunks).tolist() == list(range(10))
+        with pytest.raises(ValueError):
+            next(array.iter_chunks(0))
+
+    def test_save_and_load(self, tmp_path):
+        """Test primitive and object arrays round-trip through save() and load()."""
+        path = tmp_path / "array.ds"
+        numbers = Array([3, 1, 4, 1, 5], data_type=int)
+        numbers.pop_front()
+        numbers.save(path)
+        loaded = Array.load(path)
+        assert loaded == numbers and loaded._data_type is int
+        words = Array(['one', 'two'], data_type=str)
+        words.save(path)
+        assert list(Array.load(path)) == ['one', 'two']
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(ValueError):
+            Array.load(path)
+
+    def test_sort_primitive_with_key_and_reverse(self):
+        """Test sort() on a primitive array, including a vectorized key and stable reverse order."""
+        array = Array([3, -1, 4, -1, 5, -9], data_type=int)
+        array.pop_front()
+        array.sort()
+        assert list(array) == [-9, -1, -1, 4, 5]
+        array.sort(reverse=True)
+        assert list(array) == [5, 4, -1, -1, -9]
+        array.sort(key=np.abs)
+        assert list(array) == [-1, -1, 4, 5, -9]
+
+    def test_sort_object_array_is_stable(self):
+        """Test sort() on objects keeps equal keys in their original order, with or without reverse."""
+        words = Array(['pear', 'fig', 'apple', 'kiwi', 'date'], data_type=str)
+        words.sort(key=len)
+        assert list(words) == ['fig', 'pear', 'kiwi', 'date', 'apple']
+        words.sort(key=len, reverse=True)
+        assert list(words) == ['apple', 'pear', 'kiwi', 'date', 'fig']
+
+    def test_parallel_sort_matches_serial(self, monkeypatch):
+        """Test the process pool sort and k-way merge give the same order as a serial stable sort."""
+        monkeypatch.setattr('datastructures.array.PARALLEL_SORT_THRESHOLD', 0)
+        monkeypatch.setattr('os.cpu_count', lambda: 4)
+        values = [(index % 7, str(index)) for index in range(200)]
+        array = Array(values, data_type=tuple)
+        array.sort(key=operator.itemgetter(0), reverse=True, parallel=True)
+        assert list(array) == sorted(values, key=operator.itemgetter(0), reverse=True)
+
+    def test_argsort(self):
+        """Test argsort() returns stable sorting indices and leaves the array unchanged."""
+        array = Array([2.5, 1.0, 2.5, 0.5], data_type=float)
+        assert list(array.argsort()) == [3, 1, 0, 2]
+        assert list(array.argsort(reverse=True)) == [0, 2, 1, 3]
+        assert list(array) == [2.5, 1.0, 2.5, 0.5]
+        words = Array(['b', 'a', 'b'], data_type=str)
+        assert list(words.argsort(reverse=True)) == [0, 2, 1]
+
+    def test_snapshot_is_frozen_and_shares_buffer(self):
+        """Test snapshot() costs no copy until a write touches a slot the snapshot can see."""
+        array = Array([1, 2, 3], data_type=int)
+        array.reserve(16)
+        frozen = array.snapshot()
+        array.append(4)
+        assert array.resize_counters.unshares == 0
+        array[0] = 10
+        array.pop_front()
+        assert array.resize_counters.unshares == 1
+        assert list(frozen) == [1, 2, 3] and list(array) == [2, 3, 4]
+        with pytest.raises(ValueError):
+            frozen[0] = 5
+
+    def test_snapshot_survives_growth_and_object_removal(self):
+        """Test reallocation hands the writer a new buffer, and clearing object slots does not leak into a snapshot."""
+        array = Array(['a', 'b'], data_type=str)
+        frozen = array.snapshot()
+        for letter in 'cdefgh':
+            array.append(letter)
+        assert array.resize_counters.grows > 0 and array.resize_counters.unshares == 0
+        array.clear()
+        assert list(frozen) == ['a', 'b']
+        again = Array(['x', 'y', 'z'], data_type=str)
+        view = again.snapshot()
+        again.pop()
+        assert list(view) == ['x', 'y', 'z'] and list(again) == ['x', 'y']
+
+    def test_snapshot_survives_extend_into_popped_slots(self):
+        """Test extend() unshares before overwriting a slot the snapshot still sees."""
+        array = Array([1, 2, 3, 4], data_type=int)
+        array.reserve(16)
+        frozen = array.snapshot()
+        array.pop()
+        array.extend([99])
+        assert list(frozen) == [1, 2, 3, 4] and list(array) == [1, 2, 3, 99]
+
+    def test_snapshot_and_slices(self):
+        """Test slices only unshare when written through, and views taken before a snapshot cannot change it."""
+        array = Array([1, 2, 3, 4], data_type=int)
+        before = array[0:2]
+        frozen = array.snapshot()
+        after = array[1:3][::-1]
+        assert array.resize_counters.unshares == 0
+        before[0] = 42
+        after[0] = 7
+        assert array.resize_counters.unshares == 1
+        assert list(frozen) == [1, 2, 3, 4]
+        assert list(array) == [42, 2, 7, 4] and list(before) == [42, 2] and list(after) == [7, 2]
+
+    def test_snapshot_copies_while_numpy_views_are_exported(self):
+        """Test a snapshot taken while a raw NumPy view is alive is a copy the view cannot write to."""
+        array = Array([1, 2, 3], data_type=int)
+        raw = array.to_numpy()
+        frozen = array.snapshot()
+        raw[0] = 42
+        assert list(frozen) == [1, 2, 3] and array[0] == 42
+
+    def test_numpy_reads_do_not_unshare_a_snapshot(self):
+        """Test NumPy reads while a snapshot shares the slots get a read-only view and leave the buffer shared."""
+        array = Array([1, 2, 3, 4], data_type=int)
+        frozen = array.snapshot()
+        assert np.sum(array) == 10 and np.sum(array[1:3]) == 5
+        assert not np.asarray(array).flags.writeable and not np.asarray(array[1:3]).flags.writeable
+        assert array.resize_counters.unshares == 0 and not array._exported
+        assert np.shares_memory(array.snapshot().to_numpy(), frozen.to_numpy())
+        array[0] = 10
+        assert list(frozen) == [1, 2, 3, 4] and np.asarray(array).flags.writeable
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from datastructures.array2d import Array2D
 
@@ -108,4 +109,184 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+
+    # ✅ Test Saving and Loading
+    def test_save_and_load(self, filled3x3: Array2D[int], tmp_path) -> None:
+        """Checks a grid round-trips through save() and load()."""
+        path = tmp_path / "grid.ds"
+        filled3x3.save(path)
+        loaded = Array2D.load(path)
+        assert [list(row) for row in loaded] == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        assert loaded.data_type is int
+
+    def test_save_and_load_empty_grids(self, filled3x3: Array2D[int], tmp_path) -> None:
+        """Checks grids with a zero-length axis round-trip through save() and load()."""
+        path = tmp_path / "empty.ds"
+        for grid in (Array2D.empty(3, 0, int), Array2D.empty(0, 0, float), filled3x3[0:0, :]):
+            grid.save(path)
+            loaded = Array2D.load(path)
+            assert loaded.shape == grid.shape and loaded.data_type is grid.data_type
+
+    def test_load_rejects_truncated_file(self, filled3x3: Array2D[int], tmp_path) -> None:
+        """Ensures a file cut short raises ValueError instead of loading garbage."""
+        path = tmp_path / "grid.ds"
+        filled3x3.save(path)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError):
+            Array2D.load(path)
+
+    # ✅ Test the Contiguous NumPy Buffer
+    def test_native_buffer_and_row_views(self, filled3x3: Array2D[int]) -> None:
+        """Checks primitive grids use one 2D int64 buffer and rows write through to it without copying."""
+        grid = filled3x3.to_numpy()
+        assert grid.dtype == np.int64 and grid.shape == (3, 3) and grid.flags['C_CONTIGUOUS']
+        row = filled3x3[1]
+        assert np.shares_memory(row.to_numpy(), grid)
+        row[2] = 60
+        assert grid[1, 2] == 60 and filled3x3[1][2] == 60
+        assert isinstance(filled3x3[0][0], int)
+        with pytest.raises(ValueError):
+            row[0] = 1.5
+
+    # ✅ Test Building from NumPy and Filling
+    def test_from_numpy_and_fill(self) -> None:
+        """Checks a 2D NumPy array is accepted directly and fill() overwrites every cell."""
+        grid = Array2D(np.arange(6).reshape(2, 3), data_type=int)
+        assert [list(row) for row in grid] == [[0, 1, 2], [3, 4, 5]]
+        with pytest.raises(ValueError):
+            Array2D(np.ones((2, 2)), data_type=int)
+        grid.fill(7)
+        assert grid.shape == (2, 3) and all(item == 7 for row in grid for item in row)
+
+    # ✅ Test Object Grids
+    def test_object_grid_keeps_items_whole(self, tmp_path) -> None:
+        """Checks tuple items are not broadcast into extra dimensions and object grids save and load."""
+        grid = Array2D([[(1, 2), (3, 4)], [(5, 6), (7, 8)]], data_type=tuple)
+        assert grid.shape == (2, 2) and grid[1][0] == (5, 6)
+        grid.fill((0, 0))
+        assert grid[0][1] == (0, 0)
+        path = tmp_path / "tuples.ds"
+        grid.save(path)
+        assert Array2D.load(path) == grid
+
+    # ✅ Test Column Views
+    def test_col_is_a_strided_view(self, filled3x3: Array2D[int]) -> None:
+        """Checks col(j) reads and writes the grid's buffer and iter_columns() walks every column."""
+        column = filled3x3.col(1)
+        assert list(column) == [2, 5, 8] and len(column) == 3
+        assert np.shares_memory(column.to_numpy(), filled3x3.to_numpy())
+        column[2] = 80
+        assert filled3x3[2][1] == 80
+        assert [list(col) for col in filled3x3.iter_columns()] == [[1, 4, 7], [2, 5, 80], [3, 6, 9]]
+        with pytest.raises(IndexError):
+            filled3x3.col(3)
+
+    # ✅ Test Transpose
+    def test_transpose_is_a_view(self) -> None:
+        """Checks transpose() swaps the dimensions without copying."""
+        grid = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+        flipped = grid.transpose()
+        assert flipped.shape == (3, 2)
+        assert [list(row) for row in flipped] == [[1, 4], [2, 5], [3, 6]]
+        flipped[0][1] = 40
+        assert grid[1][0] == 40
+        assert flipped.transpose() == grid
+
+    # ✅ Test Reductions Along an Axis
+    def test_reductions_with_axis(self, filled3x3: Array2D[int]) -> None:
+        """Checks sum/min/max/mean/reduce over the grid, per column and per row."""
+        assert filled3x3.sum() == 45
+        assert list(filled3x3.sum(axis=0)) == [12, 15, 18]
+        assert list(filled3x3.max(axis=1)) == [3, 6, 9]
+        assert filled3x3.min() == 1
+        assert list(filled3x3.mean(axis=0)) == [4.0, 5.0, 6.0]
+        assert list(filled3x3.reduce(lambda a, b: a * b, axis=1)) == [6, 120, 504]
+        words = Array2D([['a', 'b'], ['c', 'd']], data_type=str)
+        assert list(words.reduce(lambda a, b: a + b, axis=0)) == ['ac', 'bd']
+        assert filled3x3.reduce(lambda a, b: a + b, axis=0).is_native
+        with pytest.raises(ValueError):
+            filled3x3.sum(axis=2)
+
+    # ✅ Test Tuple Indexing
+    def test_tuple_get_and_set(self, filled3x3: Array2D[int]) -> None:
+        """Checks a[r, c] reads and writes items directly and bounds-checks both indices."""
+        assert filled3x3[1, 2] == 6 and isinstance(filled3x3[1, 2], int)
+        filled3x3[2, 0] = 70
+        assert filled3x3[2][0] == 70
+        for index in [(3, 0), (0, 3), (-1, 0), (0, -1)]:
+            with pytest.raises(IndexError):
+                _ = filled3x3[index]
+            with pytest.raises(IndexError):
+                filled3x3[index] = 0
+        with pytest.raises(ValueError):
+            filled3x3[0, 0] = 'one'
+
+    # ✅ Test Batch Gathers
+    def test_get_many(self, filled3x3: Array2D[int]) -> None:
+        """Checks get_many() gathers (row, column) pairs into an Array."""
+        assert list(filled3x3.get_many([0, 1, 2, 2], [0, 1, 2, 0])) == [1, 5, 9, 7]
+        assert len(filled3x3.get_many([], [])) == 0
+        with pytest.raises(IndexError):
+            filled3x3.get_many([0, 3], [0, 0])
+        with pytest.raises(ValueError):
+            filled3x3.get_many([0, 1], [0])
+
+    # ✅ Test Sub-grid Views
+    def test_subgrid_view_writes_through(self) -> None:
+        """Checks a[r0:r1, c0:c1] shares storage with the parent, nests and copies independently."""
+        grid = Array2D([[r * 4 + c for c in range(4)] for r in range(4)], data_type=int)
+        window = grid[1:3, 1:4]
+        assert window.shape == (2, 3)
+        assert [list(row) for row in window] == [[5, 6, 7], [9, 10, 11]]
+        window[0, 0] = 50
+        window[1][2] = 110
+        assert grid[1, 1] == 50 and grid[2, 3] == 110
+        inner = window[1:, ::2]
+        assert [list(row) for row in inner] == [[9, 110]]
+        inner[0, 0] = 90
+        assert grid[2, 1] == 90
+        assert [list(row) for row in grid[2:]] == [[8, 90, 10, 110], [12, 13, 14, 15]]
+
+    # ✅ Test Copying a View
+    def test_subgrid_copy_is_independent(self, filled3x3: Array2D[int]) -> None:
+        """Checks copy() detaches a window from its parent."""
+        snapshot = filled3x3[0:2, 0:2].copy()
+        filled3x3[0, 0] = 100
+        assert [list(row) for row in snapshot] == [[1, 2], [4, 5]]
+        assert snapshot.to_numpy().flags['C_CONTIGUOUS']
+        with pytest.raises(TypeError):
+            _ = filled3x3[0, 0:2]
+
+    # ✅ Test Stencils
+    def test_stencil_neighbour_counts(self) -> None:
+        """Checks 8-neighbour counts under each boundary mode against a direct count."""
+        cells = np.array([[1, 0, 1, 0], [0, 1, 0, 0], [1, 1, 1, 0]])
+        grid = Array2D(cells, data_type=int)
+        kernel = [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+        for boundary, mode in [('zero', 'constant'), ('wrap', 'wrap'), ('reflect', 'reflect')]:
+            padded = np.pad(cells, 1, mode=mode)
+            expected = [[int(padded[r:r + 3, c:c + 3].sum() - cells[r, c]) for c in range(4)] for r in range(3)]
+            counts = grid.stencil(kernel, boundary=boundary)
+            assert [list(row) for row in counts] == expected
+            assert counts.data_type is int and counts.to_numpy().dtype == np.int64
+
+    def test_stencil_weights_and_validation(self) -> None:
+        """Checks weighted and rectangular kernels, float results and rejected kernels or boundaries."""
+        grid = Array2D([[1.0, 2.0, 4.0]], data_type=float)
+        blurred = grid.stencil([[0.25, 0.5, 0.25]], boundary='wrap')
+        assert list(blurred[0]) == [2.0, 2.25, 2.75]
+        assert list(Array2D([[1, 2, 3]], data_type=int).stencil([[-1, 0, 1]])[0]) == [2, 2, -2]
+        assert list(Array2D([[100, 100]], data_type=int).stencil([[3, 3, 3]])[0]) == [600, 600]
+        with pytest.raises(ValueError):
+            grid.stencil([[1, 1]])
+        with pytest.raises(ValueError):
+            grid.stencil([[1]], boundary='edge')
+
+    def test_parallel_stencil_matches_serial(self, monkeypatch) -> None:
+        """Checks the shared-memory process pool path gives the same grid as the serial path."""
+        monkeypatch.setattr('datastructures.array2d.PARALLEL_STENCIL_THRESHOLD', 0)
+        monkeypatch.setattr('os.cpu_count', lambda: 3)
+        grid = Array2D(np.random.default_rng(0).integers(0, 5, (20, 7)), data_type=int)
+        kernel = [[0, 1, 0], [1, -4, 1], [0, 1, 0]]
+        assert grid.stencil(kernel, 'reflect', parallel=True) == grid.stencil(kernel, 'reflect')
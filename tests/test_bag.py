@@ -76,4 +76,22 @@ def test_clear_removes_all_items(bag: Bag[int]):
     bag.clear()
     assert len(bag) == 0
     assert 12 not in bag
-    assert 13 not in bag
\ No newline at end of file
+    assert 13 not in bag
+
+def test_save_and_load_int_items(bag: Bag[int], tmp_path):
+    """ integer items and counts survive a save/load round trip."""
+    for item in (1, 1, 2, 3, 3, 3):
+        bag.add(item)
+    path = tmp_path / "bag.ds"
+    bag.save(path)
+    loaded = Bag.load(path)
+    assert loaded.count(3) == 3
+    assert len(loaded) == 6
+
+
+def test_save_and_load_object_items(tmp_path):
+    """ non-integer items are pickled and restored."""
+    bag = Bag(['red', 'red', 'blue'])
+    path = tmp_path / "bag.ds"
+    bag.save(path)
+    assert Bag.load(path).count('red') == 2
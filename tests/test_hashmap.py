@@ -52,3 +52,10 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_save_and_load(self, populated_hashmap: HashMap[int, str], tmp_path):
+        path = tmp_path / "hashmap.ds"
+        populated_hashmap.save(path)
+        loaded = HashMap.load(path)
+        assert loaded == populated_hashmap
+        assert loaded[5] == populated_hashmap[5]
@@ -0,0 +1,72 @@
+import pytest
+from datastructures.memmaparray import MemmapArray
+
+
+class TestMemmapArray:
+
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        """Fixture to provide a fresh file path for each test."""
+        return str(tmp_path / "array.dsmm")
+
+    def test_create_and_read(self, path: str):
+        """Test that a new memory-mapped array holds its starting sequence."""
+        array = MemmapArray(path, [1, 2, 3], data_type=int)
+        assert list(array) == [1, 2, 3]
+        assert array[1] == 2
+
+    def test_grow_remaps_file(self, path: str):
+        """Test appending past the physical size grows the file and keeps the items."""
+        array = MemmapArray(path, data_type=float)
+        for i in range(100):
+            array.append(float(i))
+        array.append_front(-1.0)
+        assert len(array) == 101
+        assert array[0] == -1.0 and array[-1] == 99.0
+
+    def test_reopen_after_flush(self, path: str):
+        """Test that open() sees the items and sizes written before flush()."""
+        array = MemmapArray(path, [5, 6], data_type=int)
+        array.extend(range(10))
+        array.pop_front()
+        array.flush()
+        reopened = MemmapArray.open(path)
+        assert list(reopened) == [6, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert reopened._data_type is int
+
+    def test_shrink_then_close_and_reopen(self, path: str):
+        """Test popping most items shrinks the mapping and the state survives close()."""
+        with MemmapArray(path, list(range(64)), data_type=int) as array:
+            for _ in range(60):
+                array.pop()
+        reopened = MemmapArray.open(path)
+        assert list(reopened) == [0, 1, 2, 3]
+
+    def test_grow_after_shrink_keeps_old_views_mapped(self, path: str):
+        """Test growing after a shrink never cuts the file below a mapping taken before the shrink."""
+        array = MemmapArray(path, list(range(4096)), data_type=int)
+        view = array.to_numpy()
+        while len(array) > 10:
+            array.pop()
+        array.reserve(array.capacity + 1)
+        assert view[-1] == 4095
+        array.close()
+
+    def test_object_data_type_rejected(self, path: str):
+        """Test that only primitive data types can be memory mapped."""
+        with pytest.raises(TypeError):
+            MemmapArray(path, ['a'], data_type=str)
+
+    def test_open_rejects_other_files(self, path: str):
+        """Test open() refuses a file without the MemmapArray header."""
+        with open(path, 'wb') as file:
+            file.write(bytes(128))
+        with pytest.raises(ValueError):
+            MemmapArray.open(path)
+
+    def test_snapshot_is_an_independent_copy(self, path: str):
+        """Test a snapshot of a memory-mapped array does not see later writes to the file."""
+        with MemmapArray(path, [1, 2, 3]) as array:
+            frozen = array.snapshot()
+            array[0] = 9
+            assert list(frozen) == [1, 2, 3]
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from datastructures.recordarray import RecordArray
+from tests.car import Car, Color, Make, Model
+
+
+class TestRecordArray:
+
+    @pytest.fixture
+    def cars(self) -> RecordArray[Car]:
+        """Fixture to provide a RecordArray of Car built from the Car constructor's annotations."""
+        return RecordArray.for_class(Car, [
+            Car('1HGCM82633A004352', Color.RED, Make.HONDA, Model.ACCORD),
+            Car('2T1BURHE0JC043821', Color.BLUE, Make.TOYOTA, Model.COROLLA),
+            Car('1FAHP3F20CL148530', Color.RED, Make.FORD, Model.FOCUS),
+            Car('4T1BF1FK5CU123456', Color.WHITE, Make.TOYOTA, Model.CAMRY),
+        ])
+
+    def test_schema_from_class(self, cars: RecordArray[Car]):
+        """Test the schema is read from Car.__init__ and enums are stored as one-byte codes."""
+        assert cars.fields == {'vin': str, 'color': Color, 'make': Make, 'model': Model}
+        assert cars.column('color').dtype == np.uint8
+        assert cars.column('vin').dtype.itemsize == 17
+        assert len(cars) == 4
+
+    def test_rows_are_materialized_on_access(self, cars: RecordArray[Car]):
+        """Test indexing and iteration rebuild equal Car objects."""
+        assert cars[1] == Car('2T1BURHE0JC043821', Color.BLUE, Make.TOYOTA, Model.COROLLA)
+        assert isinstance(cars[-1], Car) and cars[-1].model is Model.CAMRY
+        assert [car.make for car in cars] == [Make.HONDA, Make.TOYOTA, Make.FORD, Make.TOYOTA]
+        with pytest.raises(IndexError):
+            cars[4]
+
+    def test_where_equality_and_membership(self, cars: RecordArray[Car]):
+        """Test where() filters on encoded columns, combining conditions with and."""
+        red = cars.where(color=Color.RED)
+        assert [car.vin for car in red] == ['1HGCM82633A004352', '1FAHP3F20CL148530']
+        assert len(cars.where(color=Color.RED, make=Make.FORD)) == 1
+        assert cars.count_where(make=(Make.TOYOTA, Make.HONDA)) == 3
+        assert cars.count_where(vin='2T1BURHE0JC043821') == 1
+        assert cars.count_where(color=Color.GREEN) == 0
+        assert cars.count_where(color='red') == 0
+        with pytest.raises(KeyError):
+            cars.where(price=10)
+
+    def test_set_item_widens_strings_and_validates(self, cars: RecordArray[Car]):
+        """Test overwriting a row, widening the vin column and rejecting wrongly typed fields."""
+        cars[0] = Car('a much longer vehicle identifier', Color.BLACK, Make.DODGE, Model.FUSION)
+        assert cars[0].vin == 'a much longer vehicle identifier'
+        assert cars[1].vin == '2T1BURHE0JC043821'
+        with pytest.raises(TypeError):
+            cars.append(Car('X', 'red', Make.FORD, Model.FOCUS))
+        assert len(cars) == 4
+
+    def test_default_record_type_and_growth(self):
+        """Test a plain schema materializes namedtuples and grows past its initial capacity."""
+        points = RecordArray({'x': int, 'y': float, 'label': str})
+        points.extend({'x': i, 'y': i / 2, 'label': f'p{i}'} for i in range(10_000))
+        assert len(points) == 10_000
+        assert points[9_999] == (9_999, 4999.5, 'p9999')
+        assert points[9_999].label == 'p9999'
+        assert len(points[points.column('x') % 2 == 0]) == 5_000
+        points.pop()
+        assert len(points) == 9_999
+
+    def test_slice_is_independent(self, cars: RecordArray[Car]):
+        """Test slicing gathers a new RecordArray that equals the matching rows."""
+        head = cars[:2]
+        head[0] = cars[3]
+        assert cars[0].vin == '1HGCM82633A004352'
+        assert head == RecordArray.for_class(Car, [cars[3], cars[1]])
+
+    def test_index_arrays_are_validated(self, cars: RecordArray[Car]):
+        """Test empty selections gather nothing and bad index arrays raise like Array's fancy indexing."""
+        assert len(cars[[]]) == 0
+        assert [car.vin for car in cars[[-1, 0]]] == ['4T1BF1FK5CU123456', '1HGCM82633A004352']
+        with pytest.raises(IndexError):
+            cars[[0, 4]]
+        with pytest.raises(IndexError):
+            cars[[True, False]]
+        with pytest.raises(TypeError):
+            cars[[0.5, 1.0]]
@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from datastructures.array import Array
+from datastructures.sharedarray import SharedArray
+
+
+def _sum_and_mark(shared: SharedArray[int]) -> int:
+    """Worker: read the shared items, write one back, and close without unlinking."""
+    total = int(np.sum(shared))
+    shared[0] = -1
+    shared.close()
+    return total
+
+
+class TestSharedArray:
+
+    @pytest.fixture
+    def shared(self):
+        """Fixture to provide an owned SharedArray that is unlinked after the test."""
+        with Array(list(range(10)), data_type=int).to_shared() as shared:
+            yield shared
+
+    def test_to_shared_copies_items(self, shared: SharedArray[int]):
+        """Test the shared array holds the source items and is the owner."""
+        assert list(shared) == list(range(10))
+        assert shared.owner
+
+    def test_attach_sees_writes(self, shared: SharedArray[int]):
+        """Test a second mapping of the segment sees writes made through the first."""
+        attached = Array.attach_shared(shared.name)
+        shared[3] = 30
+        assert attached[3] == 30
+        assert not attached.owner
+        with pytest.raises(PermissionError):
+            attached.unlink()
+        attached.close()
+
+    def test_fixed_length(self, shared: SharedArray[int]):
+        """Test operations that would change the length are refused."""
+        with pytest.raises(BufferError):
+            shared.append(1)
+        with pytest.raises(BufferError):
+            shared.pop()
+
+    def test_object_data_type_rejected(self):
+        """Test only primitive dtypes can be shared."""
+        with pytest.raises(TypeError):
+            Array(['a'], data_type=str).to_shared()
+
+    def test_worker_process_maps_same_buffer(self, shared: SharedArray[int]):
+        """Test a worker process receives the segment name, not a copy, and its writes come back."""
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_sum_and_mark, shared).result() == 45
+        assert shared[0] == -1
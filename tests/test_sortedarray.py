@@ -0,0 +1,60 @@
+import pytest
+from datastructures.array import ArrayView
+from datastructures.sortedarray import SortedArray
+
+
+class TestSortedArray:
+
+    @pytest.fixture
+    def timestamps(self) -> SortedArray[int]:
+        """Fixture to provide a SortedArray built from unsorted values."""
+        return SortedArray([50, 10, 40, 20, 30, 20], data_type=int)
+
+    def test_init_sorts(self, timestamps: SortedArray[int]):
+        """Test the starting sequence is sorted."""
+        assert list(timestamps) == [10, 20, 20, 30, 40, 50]
+
+    def test_add_keeps_order(self, timestamps: SortedArray[int]):
+        """Test add() inserts at the binary-search position."""
+        timestamps.add(25)
+        timestamps.add(5)
+        timestamps.add(60)
+        assert list(timestamps) == [5, 10, 20, 20, 25, 30, 40, 50, 60]
+
+    def test_bisect_and_count(self, timestamps: SortedArray[int]):
+        """Test bisect_left/right bracket equal items."""
+        assert timestamps.bisect_left(20) == 1
+        assert timestamps.bisect_right(20) == 3
+        assert timestamps.count(20) == 2
+        assert timestamps.index(30) == 3
+        assert 40 in timestamps and 45 not in timestamps
+
+    def test_range_is_a_view(self, timestamps: SortedArray[int]):
+        """Test range() returns the half-open interval as a zero-copy view."""
+        window = timestamps.range(20, 40)
+        assert isinstance(window, ArrayView)
+        assert list(window) == [20, 20, 30]
+        assert list(timestamps.range(41, 45)) == []
+
+    def test_merge_in(self, timestamps: SortedArray[int]):
+        """Test merging a sorted batch keeps everything ordered."""
+        timestamps.merge_in([0, 20, 35, 100])
+        assert list(timestamps) == [0, 10, 20, 20, 20, 30, 35, 40, 50, 100]
+        with pytest.raises(ValueError):
+            timestamps.merge_in([3, 1])
+
+    def test_object_items(self):
+        """Test a SortedArray of strings uses the Python fallbacks."""
+        words = SortedArray(['pear', 'apple'], data_type=str)
+        words.merge_in(['banana', 'zucchini'])
+        words.add('cherry')
+        assert list(words) == ['apple', 'banana', 'cherry', 'pear', 'zucchini']
+        assert list(words.range('b', 'd')) == ['banana', 'cherry']
+
+    def test_remove_and_pop(self, timestamps: SortedArray[int]):
+        """Test removing an item and popping the largest."""
+        timestamps.remove(20)
+        assert timestamps.pop() == 50
+        assert list(timestamps) == [10, 20, 30, 40]
+        with pytest.raises(ValueError):
+            timestamps.remove(99)
@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+from datastructures.array2d import Array2D
+from datastructures.sparsearray2d import SparseArray2D
+
+class TestSparseArray2D:
+
+    # ✅ Fixtures to create test instances of SparseArray2D
+    @pytest.fixture
+    def huge(self) -> SparseArray2D[int]:
+        """Returns an empty 1M x 1M SparseArray2D with int type."""
+        return SparseArray2D.empty(rows=1_000_000, cols=1_000_000, data_type=int)
+
+    @pytest.fixture
+    def filled3x3(self) -> SparseArray2D[int]:
+        """Returns a 3x3 SparseArray2D built from a mostly-zero dense sequence."""
+        return SparseArray2D([[0, 2, 0], [0, 0, 0], [7, 0, 9]], data_type=int)
+
+    # ✅ Test Initialization
+    def test_init_keeps_only_non_default_cells(self, filled3x3: SparseArray2D[int]) -> None:
+        """Checks only the non-zero cells are stored and the rest read as the default."""
+        assert filled3x3.shape == (3, 3)
+        assert len(filled3x3) == 3
+        assert filled3x3.nnz == 3
+        assert [list(row) for row in filled3x3] == [[0, 2, 0], [0, 0, 0], [7, 0, 9]]
+
+    def test_init_rejects_ragged_and_mistyped_rows(self) -> None:
+        """Ensures rows of different lengths and values of the wrong type raise ValueError."""
+        with pytest.raises(ValueError):
+            SparseArray2D([[1, 2], [3]], data_type=int)
+        with pytest.raises(ValueError):
+            SparseArray2D([[1, 'a']], data_type=int)
+
+    def test_empty_huge_grid(self, huge: SparseArray2D[int]) -> None:
+        """Checks a 1M x 1M grid costs nothing until cells are set."""
+        assert huge.shape == (1_000_000, 1_000_000)
+        assert huge.nnz == 0
+        assert huge[999_999, 999_999] == 0
+
+    # ✅ Test the Default Value
+    def test_configurable_default(self) -> None:
+        """Ensures unset cells read as the configured default, and a mistyped default is rejected."""
+        grid = SparseArray2D.empty(rows=2, cols=2, data_type=float, default=-1.0)
+        assert grid.default == -1.0
+        assert grid[1, 1] == -1.0
+        assert SparseArray2D.empty(rows=1, cols=1).default is None
+        with pytest.raises(ValueError):
+            SparseArray2D.empty(rows=1, cols=1, data_type=int, default='x')
+
+    # ✅ Test Getting and Setting Cells
+    def test_set_get_cell(self, huge: SparseArray2D[int]) -> None:
+        """Ensures cells can be set and read with a[r, c] and through rows."""
+        huge[12, 500_000] = 42
+        huge[300][7] = 5
+        assert huge[12, 500_000] == 42
+        assert huge[12][500_000] == 42
+        assert huge[300, 7] == 5
+        assert huge.nnz == 2
+
+    def test_setting_default_empties_cell(self, huge: SparseArray2D[int]) -> None:
+        """Checks writing the default value removes the cell from both indexes."""
+        huge[4, 4] = 1
+        huge[4, 4] = 0
+        assert huge.nnz == 0
+        assert list(huge.iter_row(4)) == []
+        assert list(huge.iter_col(4)) == []
+
+    def test_cell_bounds_and_types(self, huge: SparseArray2D[int]) -> None:
+        """Ensures out-of-range and negative indices raise IndexError and wrong types ValueError."""
+        with pytest.raises(IndexError):
+            huge[1_000_000, 0]
+        with pytest.raises(IndexError):
+            huge[-1, 0]
+        with pytest.raises(IndexError):
+            huge[0, 1_000_000] = 1
+        with pytest.raises(ValueError):
+            huge[0, 0] = 'x'
+        with pytest.raises(TypeError):
+            huge[0] = 1
+
+    # ✅ Test Sparse Iteration
+    def test_iter_row_and_col_skip_empty_cells(self, huge: SparseArray2D[int]) -> None:
+        """Checks row and column iteration yields only the non-empty cells, in index order."""
+        for row, col, value in [(7, 900, 3), (7, 2, 1), (50, 2, 8), (7, 40, 2)]:
+            huge[row, col] = value
+        assert list(huge.iter_row(7)) == [(2, 1), (40, 2), (900, 3)]
+        assert list(huge[7].items()) == [(2, 1), (40, 2), (900, 3)]
+        assert list(huge.iter_col(2)) == [(7, 1), (50, 8)]
+        assert list(huge.iter_row(8)) == []
+        assert list(huge.items()) == [(7, 2, 1), (7, 40, 2), (7, 900, 3), (50, 2, 8)]
+
+    def test_reversed_rows(self, filled3x3: SparseArray2D[int]) -> None:
+        """Ensures reversed iteration walks rows and cells back to front."""
+        assert [list(reversed(row)) for row in reversed(filled3x3)] == [[9, 0, 7], [0, 0, 0], [0, 2, 0]]
+
+    # ✅ Test Dense Conversion
+    def test_to_dense(self, filled3x3: SparseArray2D[int]) -> None:
+        """Checks the dense form holds the default everywhere but the stored cells."""
+        dense = filled3x3.to_dense()
+        assert isinstance(dense, Array2D)
+        assert dense == Array2D([[0, 2, 0], [0, 0, 0], [7, 0, 9]], data_type=int)
+
+    def test_from_dense_round_trip(self) -> None:
+        """Ensures Array2D, NumPy and nested list grids convert to sparse and back unchanged."""
+        dense = Array2D(np.array([[0, 0, 4], [1, 0, 0]]), data_type=int)
+        sparse = SparseArray2D.from_dense(dense)
+        assert sparse.nnz == 2
+        assert sparse.to_dense() == dense
+        assert SparseArray2D.from_dense(dense.to_numpy(), data_type=int) == sparse
+        assert SparseArray2D.from_dense([[0, 0, 4], [1, 0, 0]], data_type=int) == sparse
+
+    def test_from_dense_infers_numpy_data_type(self) -> None:
+        """Checks an ndarray without data_type keeps its primitive type, so zeros stay empty."""
+        sparse = SparseArray2D.from_dense(np.zeros((3, 3), dtype=int))
+        assert sparse.nnz == 0
+        assert sparse.data_type is int and sparse.default == 0
+        assert SparseArray2D.from_dense(np.eye(3)).nnz == 3
+
+    def test_from_dense_infers_sequence_data_type(self) -> None:
+        """Checks nested lists of one primitive type keep it, and mixed items fall back to object."""
+        sparse = SparseArray2D.from_dense([[0, 1], [0, 0]])
+        assert sparse.nnz == 1
+        assert sparse.data_type is int and sparse.default == 0
+        assert SparseArray2D.from_dense([[0.0, 2.5]]).data_type is float
+        assert SparseArray2D.from_dense([[0, 'a']]).data_type is object
+
+    def test_from_dense_custom_default(self) -> None:
+        """Checks cells equal to a non-zero default are left out of the sparse form."""
+        sparse = SparseArray2D.from_dense(Array2D([[1.0, 1.0], [1.0, 2.5]], data_type=float), default=1.0)
+        assert list(sparse.items()) == [(1, 1, 2.5)]
+        assert sparse.to_dense().to_numpy().tolist() == [[1.0, 1.0], [1.0, 2.5]]
+
+    def test_object_round_trip(self) -> None:
+        """Ensures object grids, including sequence-like values, survive dense conversion."""
+        sparse = SparseArray2D.empty(rows=2, cols=2)
+        sparse[0, 1] = (1, 2)
+        dense = sparse.to_dense()
+        assert dense[0][1] == (1, 2)
+        assert dense[1][1] is None
+        assert SparseArray2D.from_dense(dense) == sparse
+
+    # ✅ Test String Representations
+    def test_str_and_repr(self, filled3x3: SparseArray2D[int]) -> None:
+        """Checks str lists the non-empty cells and repr adds the shape and default."""
+        assert str(filled3x3) == "{(0, 1): 2, (2, 0): 7, (2, 2): 9}"
+        assert repr(filled3x3).startswith("SparseArray2D 3 Rows x 3 Columns, default: 0, non-empty: 3")
+        assert str(filled3x3[2]) == "[7, 0, 9]"
@@ -0,0 +1,82 @@
+import pytest
+from datastructures.array import Array
+from datastructures.iarray import IArray
+from datastructures.tieredarray import TieredArray
+
+
+class TestTieredArray:
+
+    @pytest.fixture
+    def filled(self) -> TieredArray[int]:
+        """Fixture to provide a TieredArray spanning several blocks."""
+        return TieredArray(list(range(100)), data_type=int)
+
+    def test_is_an_iarray(self, filled: TieredArray[int]):
+        """Test the tiered array can stand in wherever an IArray is expected."""
+        assert isinstance(filled, IArray)
+        assert len(filled) == 100
+        assert filled == Array(list(range(100)), data_type=int)
+        assert Array(list(range(100)), data_type=int) == filled
+        assert Array(list(range(100)), data_type=int)[:] == filled
+        assert filled != list(range(100))
+
+    def test_random_access(self, filled: TieredArray[int]):
+        """Test indexing, negative indexing and assignment."""
+        assert filled[0] == 0 and filled[57] == 57 and filled[-1] == 99
+        filled[57] = -57
+        assert filled[57] == -57
+        with pytest.raises(IndexError):
+            filled[100]
+
+    def test_insert_in_middle(self, filled: TieredArray[int]):
+        """Test inserting moves later items across block boundaries."""
+        expected = list(range(100))
+        for position in (50, 0, 17, 101, -3):
+            filled.insert(position, 1000 + position)
+            expected.insert(position, 1000 + position)
+        assert list(filled) == expected
+
+    def test_delete_in_middle(self, filled: TieredArray[int]):
+        """Test deleting pulls later items back across block boundaries."""
+        expected = list(range(100))
+        for position in (50, 0, 15, -1, 31):
+            del filled[position]
+            del expected[position]
+        assert list(filled) == expected
+
+    def test_front_and_back_operations(self):
+        """Test append, append_front, pop and pop_front."""
+        array = TieredArray(data_type=str)
+        for word in ('b', 'c'):
+            array.append(word)
+        array.append_front('a')
+        assert list(array) == ['a', 'b', 'c']
+        array.pop_front()
+        array.pop()
+        assert list(array) == ['b']
+
+    def test_grows_and_shrinks_blocks(self):
+        """Test the block size follows sqrt(n) as the array grows and empties."""
+        array = TieredArray(data_type=int)
+        for i in range(5000):
+            array.insert(len(array) // 2, i)
+        assert array._block_size > 16
+        while len(array):
+            array.pop_front()
+        assert array._block_size == 16
+
+    def test_slice_and_contains(self, filled: TieredArray[int]):
+        """Test slicing returns an Array copy and membership works."""
+        assert list(filled[10:13]) == [10, 11, 12]
+        assert 42 in filled and 420 not in filled
+        filled.clear()
+        assert len(filled) == 0
+
+    def test_compare_does_not_unshare_array(self, filled: TieredArray[int]):
+        """Test comparing with a snapshotted Array neither copies nor exports its buffer."""
+        array = Array(list(range(100)), data_type=int)
+        frozen = array.snapshot()
+        assert filled == array and filled == array[:]
+        assert array.resize_counters.unshares == 0 and not array._exported
+        array[0] = -1
+        assert frozen[0] == 0